@@ -0,0 +1,162 @@
+"""Compare the requests (HTTP/1.1) path with the HTTP/2 transport locally.
+
+Starts two local servers that answer every GET with the same article-sized
+page after a fixed latency: a threaded HTTP/1.1 server and a cleartext
+HTTP/2 server built on h2. Then fetches the same number of pages from each
+with the same concurrency, once through a pooled requests session (the
+path the scrapers use today) and once through Http2Session, and reports
+wall time and how many TCP connections each server accepted.
+
+Run from the repository root (needs httpx[http2]):
+
+    python -m benchmarks.http2_benchmark --requests 200 --concurrency 10
+"""
+import time
+import asyncio
+import argparse
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from src.http_client import SessionRegistry
+from src.http2_client import Http2Session
+
+BODY = ('<html><body>' + '<p>Lorem ipsum dolor sit amet.</p>' * 1500 + '</body></html>').encode('utf-8')
+
+def start_http1_server(port, latency, stats):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+
+        def setup(self):
+            super().setup()
+            with stats['lock']:
+                stats['connections'] += 1
+
+        def do_GET(self):
+            time.sleep(latency)
+            self.send_response(200)
+            self.send_header('Content-Type', 'text/html; charset=utf-8')
+            self.send_header('Content-Length', str(len(BODY)))
+            self.end_headers()
+            self.wfile.write(BODY)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(('127.0.0.1', port), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+def start_http2_server(port, latency, stats):
+    import h2.config
+    import h2.connection
+    import h2.events
+
+    class H2Protocol(asyncio.Protocol):
+        def connection_made(self, transport):
+            with stats['lock']:
+                stats['connections'] += 1
+            self.transport = transport
+            self.conn = h2.connection.H2Connection(
+                config=h2.config.H2Configuration(client_side=False, header_encoding='utf-8'),
+            )
+            self.pending = {}
+            self.conn.initiate_connection()
+            self.transport.write(self.conn.data_to_send())
+
+        def data_received(self, data):
+            for event in self.conn.receive_data(data):
+                if isinstance(event, h2.events.RequestReceived):
+                    loop.call_later(latency, self.respond, event.stream_id)
+                elif isinstance(event, h2.events.WindowUpdated):
+                    self.flush()
+                elif isinstance(event, h2.events.StreamReset):
+                    self.pending.pop(event.stream_id, None)
+            self.transport.write(self.conn.data_to_send())
+
+        def respond(self, stream_id):
+            self.conn.send_headers(stream_id, [
+                (':status', '200'),
+                ('content-type', 'text/html; charset=utf-8'),
+                ('content-length', str(len(BODY))),
+            ])
+            self.pending[stream_id] = BODY
+            self.flush()
+
+        def flush(self):
+            # Send as much of each body as the flow-control windows allow
+            for stream_id in list(self.pending):
+                data = self.pending[stream_id]
+                while data:
+                    window = min(
+                        self.conn.local_flow_control_window(stream_id),
+                        self.conn.max_outbound_frame_size,
+                    )
+                    if window <= 0:
+                        break
+                    self.conn.send_data(stream_id, data[:window])
+                    data = data[window:]
+                if data:
+                    self.pending[stream_id] = data
+                else:
+                    self.conn.end_stream(stream_id)
+                    del self.pending[stream_id]
+            self.transport.write(self.conn.data_to_send())
+
+    loop = asyncio.new_event_loop()
+    ready = threading.Event()
+
+    def serve():
+        asyncio.set_event_loop(loop)
+        loop.run_until_complete(loop.create_server(H2Protocol, '127.0.0.1', port))
+        ready.set()
+        loop.run_forever()
+
+    threading.Thread(target=serve, daemon=True).start()
+    ready.wait()
+    return loop
+
+def run(fetch, url, total, concurrency):
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        sizes = list(pool.map(lambda _: len(fetch(url).content), range(total)))
+    elapsed = time.perf_counter() - started
+    assert all(size == len(BODY) for size in sizes)
+    return elapsed
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--requests', type=int, default=200)
+    parser.add_argument('--concurrency', type=int, default=10)
+    parser.add_argument('--latency', type=float, default=0.02, help='server think time per request (s)')
+    parser.add_argument('--port', type=int, default=8480)
+    args = parser.parse_args()
+
+    http1_stats = {'connections': 0, 'lock': threading.Lock()}
+    http2_stats = {'connections': 0, 'lock': threading.Lock()}
+    start_http1_server(args.port, args.latency, http1_stats)
+    start_http2_server(args.port + 1, args.latency, http2_stats)
+
+    http1_url = f"http://127.0.0.1:{args.port}/article"
+    http2_url = f"http://127.0.0.1:{args.port + 1}/article"
+
+    registry = SessionRegistry(pool_maxsize=args.concurrency)
+    http1 = registry.session_for(http1_url)
+    http2 = Http2Session(max_connections=args.concurrency, http1=False)
+
+    print(f"{args.requests} GETs de {len(BODY) // 1024} KB, {args.concurrency} em paralelo, "
+          f"latência do servidor {args.latency * 1000:.0f} ms")
+    for name, session, url, stats in (
+        ('requests (HTTP/1.1)', http1, http1_url, http1_stats),
+        ('httpx (HTTP/2)', http2, http2_url, http2_stats),
+    ):
+        run(session.get, url, args.concurrency, args.concurrency)  # warm up
+        elapsed = run(session.get, url, args.requests, args.concurrency)
+        print(f"{name:>20}: {elapsed:6.2f}s  {args.requests / elapsed:7.1f} req/s  "
+              f"{stats['connections']} conexões TCP")
+
+    print(f"{'':>20}  {http2.http2_requests} respostas recebidas via HTTP/2")
+    http2.close()
+
+if __name__ == '__main__':
+    main()
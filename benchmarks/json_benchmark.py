@@ -0,0 +1,127 @@
+"""Compare locating embedded JSON by character loop and with raw_decode.
+
+Builds pages shaped like the CDP Insights listing (an "initialInsights"
+array inside Next.js RSC chunks) and a Sustainable Views article (a
+dataLayer `data: {...}` object after the page scripts), then times the
+previous extraction, which parsed the page and walked the payload one
+character at a time, against src/embedded_json.json_after().
+
+Run from the repository root:
+
+    python -m benchmarks.json_benchmark --entries 300 --rounds 20
+"""
+import re
+import json
+import time
+import argparse
+from src.dom import make_soup
+from src.scrapers import CDPInsightsScraper, SustainableViewsScraper
+
+NOISE = '<nav>' + '<a href="/secao">Seção</a>' * 80 + '</nav>'
+
+def build_cdp_page(entries):
+    insights = [
+        {
+            'sys': {'id': f'id{n}', 'updatedAt': '2025-01-01T00:00:00Z'},
+            'fields': {
+                'slug': f'insight-{n}',
+                'title': f'Insight {n} "entre aspas" [com colchetes]',
+                'body': {'content': [{'value': 'texto ' * 40}]},
+            },
+        }
+        for n in range(entries)
+    ]
+    # RSC chunks end at line boundaries; the insights line sits among the others
+    chunks = [f'{n:x}:["$","div",null,{{"children":"{"texto " * 200}"}}]' for n in range(2, 40)]
+    chunks.insert(20, '1:["$","div",null,{"initialInsights":' + json.dumps(insights) + ',"total":1}]')
+    scripts = ''.join(
+        f'<script>self.__next_f.push([1,{json.dumps(chunk)}])</script>' for chunk in chunks
+    )
+    return f'<html><body>{NOISE}{scripts}</body></html>'.encode('utf-8')
+
+def build_views_page(entries):
+    data = {'author_name': 'Autora', 'tags': [f'tag {n} {{}}' for n in range(entries)]}
+    scripts = '<script>var x = 1;</script>' * 20
+    body = '<p>parágrafo do artigo</p>' * entries
+    return (
+        f'<html><head>{scripts}</head><body>{NOISE}{body}'
+        f'<script>dataLayer.push({{event: "Article Entity Loaded", data: {json.dumps(data)}}});</script>'
+        f'</body></html>'
+    ).encode('utf-8')
+
+def cdp_char_loop(content):
+    soup = make_soup(content.decode('utf-8', errors='replace'))
+    parts = []
+    for script in soup.find_all('script'):
+        match = re.search(r'self\.__next_f\.push\(\[1,(".*")\]\)', script.string or '', re.S)
+        if match:
+            parts.append(json.loads(match.group(1)))
+    text = '\n'.join(parts)
+    start = text.find('[', text.find('"initialInsights":'))
+    depth, in_string, escaped = 0, False, False
+    for index in range(start, len(text)):
+        char = text[index]
+        if in_string:
+            if escaped:
+                escaped = False
+            elif char == '\\':
+                escaped = True
+            elif char == '"':
+                in_string = False
+            continue
+        if char == '"':
+            in_string = True
+        elif char == '[':
+            depth += 1
+        elif char == ']':
+            depth -= 1
+            if depth == 0:
+                return json.loads(text[start:index + 1])
+
+def views_char_loop(content):
+    for script in make_soup(content).find_all('script'):
+        text = script.string or ''
+        if 'Article Entity Loaded' not in text:
+            continue
+        start = text.index('data: {') + 6
+        brace_count = 0
+        for i, c in enumerate(text[start:], start):
+            if c == '{':
+                brace_count += 1
+            elif c == '}':
+                brace_count -= 1
+            if brace_count == 0:
+                return json.loads(text[start:i + 1]).get('author_name', '')
+
+def timed(func, rounds):
+    started = time.perf_counter()
+    for _ in range(rounds):
+        result = func()
+    return (time.perf_counter() - started) / rounds * 1000, result
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--entries', type=int, default=300)
+    parser.add_argument('--rounds', type=int, default=20)
+    args = parser.parse_args()
+
+    cdp = CDPInsightsScraper.__new__(CDPInsightsScraper)
+    cdp_page = build_cdp_page(args.entries)
+    views_page = build_views_page(args.entries)
+    cases = (
+        ('CDP Insights', cdp_page,
+         lambda: len(cdp_char_loop(cdp_page)),
+         lambda: len(cdp._extract_initial_insights(cdp_page.decode('utf-8')))),
+        ('Sustainable Views', views_page,
+         lambda: views_char_loop(views_page),
+         lambda: SustainableViewsScraper._extract_author(views_page)),
+    )
+    print(f"Média de {args.rounds} rodadas")
+    for name, page, before, after in cases:
+        loop_ms, expected = timed(before, args.rounds)
+        decode_ms, found = timed(after, args.rounds)
+        assert found == expected
+        print(f"{name:>18} ({len(page) // 1024} KB): laço {loop_ms:7.1f} ms  raw_decode {decode_ms:6.1f} ms")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,75 @@
+"""Compare the HTML parser backends and selector compilation on one page.
+
+Builds a section page shaped like the Globo/Valor listings (a long run of
+div.bastian-feed-item cards around navigation and script noise), then
+times, per backend, building the tree and extracting the cards the way
+ValorOGloboScraper does, with selector strings (compiled on every call by
+BeautifulSoup) and with the compiled selectors of src/dom.py.
+
+Run from the repository root:
+
+    python -m benchmarks.parser_benchmark --cards 200 --rounds 20
+"""
+import time
+import argparse
+from bs4 import BeautifulSoup
+from src.dom import PARSER_BACKENDS, select, select_one
+
+CARD = """
+<div class="bastian-feed-item">
+  <div class="feed-post-body">
+    <a href="https://valor.globo.com/esg/noticia/2025/01/{n}/artigo.ghtml">
+      <h2 class="feed-post-link">Título do artigo {n}</h2>
+    </a>
+    <p class="feed-post-body-resumo">Resumo do artigo {n}, com algumas frases de texto.</p>
+    <span class="feed-post-metadata-section">ESG</span>
+    <span class="feed-post-datetime">Há {n} horas</span>
+  </div>
+</div>
+"""
+NOISE = '<nav>' + '<a href="/secao">Seção</a>' * 80 + '</nav><script>var x = 1;</script>' * 5
+
+def build_page(cards):
+    body = ''.join(CARD.format(n=n) for n in range(cards))
+    return f"<html><head><title>ESG</title></head><body>{NOISE}{body}{NOISE}</body></html>".encode('utf-8')
+
+def extract_with_strings(soup):
+    return [
+        (item.select_one('h2.feed-post-link').text, item.select_one('a')['href'])
+        for item in soup.select('div.bastian-feed-item')
+    ]
+
+def extract_compiled(soup):
+    return [
+        (select_one(item, 'h2.feed-post-link').text, select_one(item, 'a')['href'])
+        for item in select(soup, 'div.bastian-feed-item')
+    ]
+
+def timed(func, rounds):
+    started = time.perf_counter()
+    for _ in range(rounds):
+        result = func()
+    return (time.perf_counter() - started) / rounds * 1000, result
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--cards', type=int, default=200)
+    parser.add_argument('--rounds', type=int, default=20)
+    args = parser.parse_args()
+
+    page = build_page(args.cards)
+    print(f"Página de {len(page) // 1024} KB com {args.cards} cards, média de {args.rounds} rodadas")
+    for backend in PARSER_BACKENDS:
+        try:
+            parse_ms, soup = timed(lambda: BeautifulSoup(page, backend), args.rounds)
+        except Exception as e:
+            print(f"{backend:>12}: indisponível ({e})")
+            continue
+        strings_ms, expected = timed(lambda: extract_with_strings(soup), args.rounds)
+        compiled_ms, found = timed(lambda: extract_compiled(soup), args.rounds)
+        assert found == expected and len(found) == args.cards
+        print(f"{backend:>12}: parsing {parse_ms:7.1f} ms  seletores {strings_ms:6.1f} ms "
+              f"(pré-compilados {compiled_ms:6.1f} ms)")
+
+if __name__ == '__main__':
+    main()
@@ -1,31 +1,263 @@
+import os
 import time
+from functools import partial
 from src.scrapers import get_scraper_class
+from src.runner import run_sources, run_sources_async
+from src.parsing import start_parse_pool, shutdown_parse_pool
+from src.dom import configure_parser
+from src.http_client import configure_http_pool, http_pool_stats, NotModified
+from src.cache import enrichment_cache, DEFAULT_CACHE_PATH
+from src.cookies import cookie_store, DEFAULT_COOKIES_PATH
+from src.fetcher import Fetcher
+from src.coalesce import RequestCoalescer
+from src.retry import retry_policy, is_permanent
+from src.deadline import set_deadline, reset_deadline, expired
+from src.checkpoint import RunCheckpoint
+from src.urls import ArticleIndex
+from src.host_limits import host_limiter, host_throttle, DEFAULT_LIMITS_PATH
 from src.utils import (
     ensure_directories,
+    get_feed_path,
     load_sources_config,
+    load_run_settings,
     load_history,
     save_history,
     generate_feed,
     save_feed,
     merge_articles_with_existing_feed,
+    fill_incomplete_from_feed,
+    load_published_articles,
     generate_opml,
     save_opml,
     generate_html_index,
     save_html_index
 )
 
+# Per-source change markers kept in history between runs
+CHANGE_MARKERS = ('validators', 'fingerprint', 'incomplete_links')
+# Outcomes a resumed run keeps; failed sources are scraped again
+FINISHED_STATUSES = ('new', 'unchanged')
+
+MAX_ATTEMPTS = 3
+
+def schedule_retry(source, result, attempt, error):
+    """Ask the runner for another attempt, unless *error* is permanent.
+
+    The retry must fit retry_policy's budgets; it is scheduled after a
+    jittered backoff, or after the source host's pause if that is longer.
+    """
+    if expired():
+        print("   Prazo da fonte esgotado, sem nova tentativa.")
+    elif is_permanent(error):
+        retry_policy.record_fast_fail()
+        print("   Falha permanente, sem nova tentativa.")
+    elif attempt < MAX_ATTEMPTS - 1 and retry_policy.allow():
+        delay = max(retry_policy.backoff(attempt), host_throttle.delay(source['url']))
+        retry_policy.record_wait(delay)
+        print(f"   Nova tentativa em {delay:.0f} segundos (outras fontes seguem enquanto isso)...")
+        result['retry_in'] = delay
+    elif attempt < MAX_ATTEMPTS - 1:
+        print("   Orçamento de retentativas esgotado, sem nova tentativa.")
+    else:
+        print(f"   Falha após {MAX_ATTEMPTS} tentativas.")
+
+def seed_scraper_state(scraper, source, article_index=None):
+    """Give the scraper what the previous run left for this source.
+
+    That is the HTTP validators, the listing fingerprint and the published
+    articles that enrichment can be skipped for. They all mean "keep what
+    you have", so they are used only while that run's feed is on disk.
+    *article_index* adds the articles other sources enriched in this run.
+    """
+    history = {}
+    published = {}
+    if os.path.exists(get_feed_path(source['feed_file'])):
+        history = load_history(source['history_file'])
+        published = load_published_articles(
+            source['feed_file'],
+            exclude=history.get('incomplete_links', []),
+        )
+    scraper.validators = dict(history.get('validators', {}))
+    scraper.fingerprint = history.get('fingerprint')
+    scraper.published = published
+    scraper.article_index = article_index
+    scraper.source_name = source['name']
+
+def publish_articles(source, articles, result, scraper=None):
+    """Merge, record history and write the individual feed for scraped articles.
+
+    The *scraper*'s validators and listing fingerprint are stored only once
+    the feed is written and every article was fully enriched, so a later
+    304 or fingerprint match never freezes a partial feed. Links published
+    with incomplete content are recorded so the next run enriches them again;
+    meanwhile they are published with their previous content when there is one.
+    """
+    incomplete_links = [a['link'] for a in articles if a.get('_enrichment_failed')]
+    if source['scraper'] in (
+        'LinkedInNewsletterScraper',
+        'FolhaRssFullContentScraper',
+    ):
+        merge_limit = (
+            5 if source['scraper'] == 'LinkedInNewsletterScraper' else 10
+        )
+        articles = merge_articles_with_existing_feed(
+            articles,
+            source['feed_file'],
+            limit=merge_limit,
+        )
+    else:
+        articles = fill_incomplete_from_feed(articles, source['feed_file'])
+    if articles:
+        latest_article = articles[0]
+        history = load_history(source['history_file'])
+
+        # Check if this is a new article for logging/statistics
+        is_new_article = latest_article['link'] != history.get('last_article_link')
+
+        if is_new_article:
+            # Update history
+            history['last_article_link'] = latest_article['link']
+            save_history(source['history_file'], history)
+            print(f"✅ Novo artigo: {source['name']}")
+            result['status'] = 'new'
+        else:
+            print(f"ℹ️  Sem novidades: {source['name']}")
+            result['status'] = 'unchanged'
+
+        # ALWAYS generate individual feed (whether new or not)
+        try:
+            individual_feed = generate_feed(
+                source['name'],
+                source['url'],
+                articles,
+                feed_filename=source['feed_file'],
+            )
+            save_feed(individual_feed, source['feed_file'])
+            result['feed_generated'] = True
+
+            if scraper is not None:
+                stored = {key: history.get(key) for key in CHANGE_MARKERS}
+                for key in ('validators', 'fingerprint'):
+                    value = getattr(scraper, key)
+                    if value and not incomplete_links:
+                        history[key] = value
+                    else:
+                        history.pop(key, None)
+                if incomplete_links:
+                    history['incomplete_links'] = incomplete_links
+                else:
+                    history.pop('incomplete_links', None)
+                if any(history.get(key) != stored[key] for key in CHANGE_MARKERS):
+                    save_history(source['history_file'], history)
+        except Exception as e:
+            print(f"   ⚠️  Erro ao gerar feed individual de {source['name']}: {str(e)}")
+
+    else:
+        print(f"⚠️  Não foi possível obter artigo: {source['name']}")
+
+def megabytes(mb):
+    """A size setting in MB as bytes (None = no cap)."""
+    return None if mb is None else int(mb * 1024 * 1024)
+
+def process_source(source, attempt=0, fetcher=None, deadline=None, checkpoint=None, article_index=None):
+    """Scrape one source, update its history and write its individual feed.
+
+    This is one *attempt*; on failure the result asks the runner to retry
+    later (see schedule_retry). *fetcher* is the run's shared Fetcher,
+    handed to the scraper. The attempt gets the source's 'deadline' seconds,
+    or *deadline* when the source sets none, after which it publishes
+    what it has. A 'new' or 'unchanged' outcome is recorded in
+    *checkpoint*, if given; a source that failed is scraped again when
+    the run is resumed. The fully enriched articles are added to
+    *article_index*, the run's cross-source duplicate index, so other
+    sources reuse them. Returns a dict with the outcome ('new',
+    'unchanged' or 'error') and whether the individual feed was written.
+    """
+    result = {'status': 'error', 'feed_generated': False}
+
+    scraper_class = get_scraper_class(source['scraper'])
+    if not scraper_class:
+        print(f"❌ Scraper não encontrado: {source['scraper']}")
+        return result
+
+    if fetcher is not None:
+        fetcher = fetcher.for_scraper(source['scraper'])
+    scraper = scraper_class(source['url'], fetcher=fetcher)
+    seed_scraper_state(scraper, source, article_index)
+    # Every retry made for this source, down to single requests, spends its budget
+    token = retry_policy.bind_source(source['name'])
+    deadline_token = set_deadline(source.get('deadline', deadline))
+    try:
+        articles = scraper.get_articles()
+        if expired():
+            # Whatever was enriched in time is published; the rest is incomplete
+            print(f"⏰ Prazo esgotado: {source['name']} (resultado parcial)")
+            result['deadline_hit'] = True
+        publish_articles(source, articles, result, scraper)
+        if article_index is not None:
+            article_index.add(source['name'], articles)
+    except NotModified:
+        print(f"ℹ️  Sem novidades (não modificado): {source['name']}")
+        result['status'] = 'unchanged'
+        result['not_modified'] = True
+    except Exception as e:
+        print(f"❌ Erro ao processar {source['name']}: {str(e)}")
+        schedule_retry(source, result, attempt, e)
+    finally:
+        reset_deadline(deadline_token)
+        retry_policy.unbind_source(token)
+
+    if checkpoint is not None and result['status'] in FINISHED_STATUSES:
+        checkpoint.record(source, result)
+    return result
+
+async def aprocess_source(source, session, attempt=0, fetcher=None, deadline=None, checkpoint=None, article_index=None):
+    """Async counterpart of process_source() for the asyncio engine."""
+    result = {'status': 'error', 'feed_generated': False}
+
+    scraper_class = get_scraper_class(source['scraper'])
+    if not scraper_class:
+        print(f"❌ Scraper não encontrado: {source['scraper']}")
+        return result
+
+    if fetcher is not None:
+        fetcher = fetcher.for_scraper(source['scraper'])
+    scraper = scraper_class(source['url'], fetcher=fetcher)
+    seed_scraper_state(scraper, source, article_index)
+    # Every retry made for this source, down to single requests, spends its budget
+    token = retry_policy.bind_source(source['name'])
+    deadline_token = set_deadline(source.get('deadline', deadline))
+    try:
+        articles = await scraper.aget_articles(session)
+        if expired():
+            # Whatever was enriched in time is published; the rest is incomplete
+            print(f"⏰ Prazo esgotado: {source['name']} (resultado parcial)")
+            result['deadline_hit'] = True
+        publish_articles(source, articles, result, scraper)
+        if article_index is not None:
+            article_index.add(source['name'], articles)
+    except NotModified:
+        print(f"ℹ️  Sem novidades (não modificado): {source['name']}")
+        result['status'] = 'unchanged'
+        result['not_modified'] = True
+    except Exception as e:
+        print(f"❌ Erro ao processar {source['name']}: {str(e)}")
+        schedule_retry(source, result, attempt, e)
+    finally:
+        reset_deadline(deadline_token)
+        retry_policy.unbind_source(token)
+
+    if checkpoint is not None and result['status'] in FINISHED_STATUSES:
+        checkpoint.record(source, result)
+    return result
+
 def main():
     # Garante que os diretórios necessários existem
     ensure_directories()
 
     # Carrega a configuração dos sources
     sources = load_sources_config()
-
-    # Statistics
-    new_articles_count = 0
-    no_change_count = 0
-    error_count = 0
-    individual_feeds_generated = 0
+    settings = load_run_settings()
 
     print("=" * 70)
     print("Coletando artigos e gerando feeds individuais...")
@@ -38,84 +270,224 @@ def main():
     if rss_sources:
         print(f"ℹ️  {len(rss_sources)} fontes com RSS nativo (não serão raspadas)")
 
-    for source in scrape_sources:
-        scraper_class = get_scraper_class(source['scraper'])
-        if not scraper_class:
-            print(f"❌ Scraper não encontrado: {source['scraper']}")
-            error_count += 1
-            continue
-
-        scraper = scraper_class(source['url'])
-
-        max_retries = 3
-        for attempt in range(max_retries):
-            try:
-                articles = scraper.get_articles()
-                if source['scraper'] in (
-                    'LinkedInNewsletterScraper',
-                    'FolhaRssFullContentScraper',
-                ):
-                    merge_limit = (
-                        5 if source['scraper'] == 'LinkedInNewsletterScraper' else 10
-                    )
-                    articles = merge_articles_with_existing_feed(
-                        articles,
-                        source['feed_file'],
-                        limit=merge_limit,
-                    )
-                if articles:
-                    latest_article = articles[0]
-                    history = load_history(source['history_file'])
-
-                    # Check if this is a new article for logging/statistics
-                    is_new_article = latest_article['link'] != history.get('last_article_link')
-
-                    if is_new_article:
-                        # Update history
-                        history['last_article_link'] = latest_article['link']
-                        save_history(source['history_file'], history)
-                        print(f"✅ Novo artigo: {source['name']}")
-                        new_articles_count += 1
-                    else:
-                        print(f"ℹ️  Sem novidades: {source['name']}")
-                        no_change_count += 1
-
-                    # ALWAYS generate individual feed (whether new or not)
-                    try:
-                        individual_feed = generate_feed(
-                            source['name'],
-                            source['url'],
-                            articles,
-                            feed_filename=source['feed_file'],
-                        )
-                        save_feed(individual_feed, source['feed_file'])
-                        individual_feeds_generated += 1
-                    except Exception as e:
-                        print(f"   ⚠️  Erro ao gerar feed individual de {source['name']}: {str(e)}")
+    # Connections are pooled per host and reused by every scraper in the run
+    configure_http_pool(
+        pool_maxsize=settings['http_pool_maxsize'],
+        http2_hosts=settings['http2_hosts'],
+    )
 
-                else:
-                    print(f"⚠️  Não foi possível obter artigo: {source['name']}")
-                    error_count += 1
-
-                break  # Se bem-sucedido, sai do loop
-            except Exception as e:
-                print(f"❌ Erro ao processar {source['name']}: {str(e)}")
-                if attempt < max_retries - 1:
-                    print(f"   Tentando novamente em 5 segundos...")
-                    time.sleep(5)
-                else:
-                    print(f"   Falha após {max_retries} tentativas.")
-                    error_count += 1
+    # Cookies of these domains (consent, login redirects) survive between runs
+    if settings['persistent_cookie_hosts']:
+        cookie_store.hosts = set(settings['persistent_cookie_hosts'])
+        cookie_store.load(DEFAULT_COOKIES_PATH)
+
+    # CPU-bound page parsing runs in a process pool, one worker per core by
+    # default, with the same HTML parser backend in every worker
+    parse_workers = settings['parse_workers']
+    if parse_workers is None:
+        parse_workers = os.cpu_count() or 1
+    html_parser = configure_parser(settings['html_parser'])
+    start_parse_pool(parse_workers, initializer=configure_parser, initargs=(html_parser,))
+
+    # Extracted article content is reused across runs instead of re-fetched.
+    # Without it the cache is kept in memory, so retries still reuse it.
+    if settings['enrichment_cache']:
+        enrichment_cache.configure(
+            DEFAULT_CACHE_PATH,
+            ttl=settings['cache_ttl_days'] * 24 * 3600,
+            max_entries=settings['cache_max_entries'],
+        )
+        enrichment_cache.load()
+
+    retry_policy.configure(
+        per_source=settings['retry_budget_per_source'],
+        per_run=settings['retry_budget_per_run'],
+    )
+
+    # Requests in flight per host follow an AIMD limit learned across runs
+    limiter = None
+    if settings['adaptive_concurrency']:
+        limiter = host_limiter
+        limiter.initial = settings['host_concurrency_initial']
+        limiter.maximum = settings['host_concurrency_max']
+        limiter.load(DEFAULT_LIMITS_PATH)
+
+    # Identical requests from different sources share one trip to the server
+    coalescer = None
+    if settings['coalesce_requests']:
+        coalescer = RequestCoalescer(
+            max_entries=settings['coalesce_max_entries'],
+            max_body=settings['coalesce_max_kb'] * 1024,
+            max_bytes=megabytes(settings['coalesce_max_total_mb']),
+        )
+
+    # Every scraper reaches the network through this one Fetcher; a 429/503
+    # pauses the whole domain for every source (host_throttle). Bodies past
+    # the size cap are abandoned mid-download instead of read in full.
+    fetcher = Fetcher(
+        limiter=limiter,
+        throttle=host_throttle,
+        max_bytes=megabytes(settings['max_response_mb']),
+        max_bytes_per_host={
+            host: megabytes(mb) for host, mb in settings['max_response_mb_per_host'].items()
+        },
+        max_bytes_per_scraper={
+            name: megabytes(mb) for name, mb in settings['max_response_mb_per_scraper'].items()
+        },
+        coalescer=coalescer,
+    )
+
+    # Articles enriched by one source are reused by any other that lists them
+    article_index = ArticleIndex()
+
+    # Sources finished by an interrupted run are restored instead of scraped again
+    checkpoint = None
+    results_by_key = {}
+    if settings['resume_window_hours']:
+        checkpoint = RunCheckpoint(window=settings['resume_window_hours'] * 3600)
+        finished = checkpoint.start()
+        for source in scrape_sources:
+            entry = finished.get(RunCheckpoint.key(source))
+            if entry is not None:
+                results_by_key[RunCheckpoint.key(source)] = checkpoint.restore(source, entry)
+        if results_by_key:
+            print(f"♻️  Retomando execução interrompida: {len(results_by_key)} fontes já concluídas")
+    pending_sources = [s for s in scrape_sources if RunCheckpoint.key(s) not in results_by_key]
+
+    started_at = time.monotonic()
+    try:
+        if settings['engine'] == 'asyncio':
+            pending_results = run_sources_async(
+                pending_sources,
+                partial(
+                    aprocess_source,
+                    fetcher=fetcher,
+                    deadline=settings['source_deadline'],
+                    checkpoint=checkpoint,
+                    article_index=article_index,
+                ),
+                max_workers=settings['max_workers'],
+                max_per_host=settings['max_per_host'],
+                limiter=limiter,
+                throttle=host_throttle,
+                session_options={
+                    'max_bytes': fetcher.max_bytes,
+                    'max_bytes_per_host': fetcher.max_bytes_per_host,
+                    'stats': fetcher.stats,
+                    'coalescer': coalescer,
+                },
+            )
+        else:
+            pending_results = run_sources(
+                pending_sources,
+                partial(
+                    process_source,
+                    fetcher=fetcher,
+                    deadline=settings['source_deadline'],
+                    checkpoint=checkpoint,
+                    article_index=article_index,
+                ),
+                max_workers=settings['max_workers'],
+                max_per_host=settings['max_per_host'],
+                throttle=host_throttle,
+            )
+    finally:
+        shutdown_parse_pool()
+        enrichment_cache.save()
+        if limiter is not None:
+            limiter.save(DEFAULT_LIMITS_PATH)
+        cookie_store.save(DEFAULT_COOKIES_PATH)
+    elapsed = time.monotonic() - started_at
+    for source, result in zip(pending_sources, pending_results):
+        results_by_key[RunCheckpoint.key(source)] = result
+    results = [results_by_key[RunCheckpoint.key(source)] for source in scrape_sources]
+
+    # Statistics
+    new_articles_count = sum(1 for r in results if r['status'] == 'new')
+    no_change_count = sum(1 for r in results if r['status'] == 'unchanged')
+    error_count = sum(1 for r in results if r['status'] == 'error')
+    not_modified_count = sum(1 for r in results if r.get('not_modified'))
+    individual_feeds_generated = sum(1 for r in results if r['feed_generated'])
+    deadline_count = sum(1 for r in results if r.get('deadline_hit'))
 
     # Print summary
     print("\n" + "=" * 70)
     print("RESUMO DA EXECUÇÃO")
     print("=" * 70)
     print(f"✅ Artigos novos: {new_articles_count}")
-    print(f"ℹ️  Sem mudanças: {no_change_count}")
+    print(f"ℹ️  Sem mudanças: {no_change_count} ({not_modified_count} puladas: HTTP 304 ou listagem igual)")
     print(f"❌ Erros: {error_count}")
+    if deadline_count:
+        print(f"⏰ Fontes com prazo esgotado (resultado parcial): {deadline_count}")
     print(f"📊 Total processado: {new_articles_count + no_change_count + error_count}")
+    resumed_count = len(scrape_sources) - len(pending_sources)
+    if resumed_count:
+        print(f"♻️  Retomadas do checkpoint: {resumed_count}")
     print(f"\n📄 Feeds individuais gerados: {individual_feeds_generated}")
+    index_stats = article_index.stats()
+    if index_stats['duplicates']:
+        print(f"🔗 Artigos repetidos entre fontes: {index_stats['duplicates']} (conteúdo reaproveitado, sem novo enriquecimento)")
+    pool_stats = http_pool_stats()
+    print(
+        f"🔌 Conexões HTTP: {pool_stats['requests']} requisições em "
+        f"{pool_stats['connections']} conexões ({pool_stats['reused']} reutilizadas, "
+        f"{pool_stats['hosts']} hosts)"
+    )
+    if settings['http2_hosts']:
+        print(f"   {pool_stats['http2_requests']} requisições multiplexadas em HTTP/2")
+    redirects = pool_stats['redirects']
+    if redirects:
+        top = sorted(redirects.items(), key=lambda item: -item[1])[:5]
+        print(
+            f"↪️  Redirecionamentos: {sum(redirects.values())} "
+            f"({', '.join(f'{host}: {count}' for host, count in top)})"
+        )
+    if cookie_store.hosts:
+        jar_stats = cookie_store.stats()
+        print(
+            f"🍪 Cookies persistentes: {jar_stats['cookies']} em {jar_stats['hosts']} domínios "
+            f"({jar_stats['loaded']} restaurados, {jar_stats['expired']} expirados descartados)"
+        )
+    download_stats = fetcher.stats
+    print(
+        f"📦 Downloads: {download_stats.bytes_read / 1024 / 1024:.1f} MB lidos, "
+        f"{download_stats.aborted} respostas abortadas por tamanho"
+    )
+    cache_stats = enrichment_cache.stats()
+    if coalescer is not None:
+        coalesce_stats = coalescer.stats()
+        print(
+            f"🧩 Requisições poupadas: {coalesce_stats['saved']} "
+            f"({coalesce_stats['shared']} aguardaram uma idêntica em andamento, "
+            f"{coalesce_stats['repeated']} repetidas na execução; "
+            f"{cache_stats['shared']} extrações de artigo compartilhadas)"
+        )
+    print(
+        f"🗃️  Cache de conteúdo{'' if enrichment_cache.persistent else ' (em memória)'}: "
+        f"{cache_stats['hits']} acertos, {cache_stats['misses']} falhas "
+        f"({cache_stats['expired']} expirados, {cache_stats['evicted']} removidos, "
+        f"{cache_stats['entries']} entradas)"
+    )
+    if limiter is not None:
+        limit_stats = limiter.stats()
+        print(
+            f"🎚️  Concorrência adaptativa: {limit_stats['hosts']} hosts, limites de "
+            f"{limit_stats['min_limit']} a {limit_stats['max_limit']} requisições simultâneas "
+            f"({limit_stats['decreases']} reduções por 429/5xx ou lentidão)"
+        )
+    retry_stats = retry_policy.stats()
+    print(
+        f"🔁 Retentativas: {retry_stats['retries']} ({retry_stats['retry_time']:.1f}s de espera), "
+        f"{retry_stats['fast_failed']} falhas permanentes sem retentativa, "
+        f"{retry_stats['denied']} barradas pelo orçamento"
+    )
+    throttle_stats = host_throttle.stats()
+    if throttle_stats['throttled']:
+        print(
+            f"🚦 Pausas por host: {throttle_stats['throttled']} respostas 429/503 de "
+            f"{throttle_stats['hosts']} domínios ({throttle_stats['waited']:.0f}s aguardando Retry-After)"
+        )
+    print(f"⏱️  Tempo de coleta: {elapsed:.1f}s ({settings['engine']}, {settings['max_workers']} workers, até {settings['max_per_host']} por host)")
 
     # Gera o arquivo OPML atualizado
     print("\n" + "=" * 70)
@@ -140,6 +512,10 @@ def main():
     except Exception as e:
         print(f"❌ Erro ao gerar página HTML: {str(e)}")
 
+    # Only a run that got this far is complete; the next one starts afresh
+    if checkpoint is not None:
+        checkpoint.finish()
+
 
 if __name__ == "__main__":
     main()
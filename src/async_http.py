@@ -0,0 +1,210 @@
+import json
+import time
+import asyncio
+import requests
+from functools import partial
+from src.retry import retry_policy
+from src.deadline import check_deadline, cap_timeout, remaining
+from src.fetcher import CHUNK_SIZE, ResponseTooLarge
+from src.utils import get_host_key
+
+class AsyncResponse:
+    """The subset of requests.Response that the scrapers rely on."""
+    def __init__(self, url, status_code, headers, content, encoding=None):
+        self.url = url
+        self.status_code = status_code
+        self.headers = headers
+        self.content = content
+        self.encoding = encoding
+
+    @property
+    def text(self):
+        return self.content.decode(self.encoding or 'utf-8', errors='replace')
+
+    def json(self):
+        return json.loads(self.content)
+
+    def raise_for_status(self):
+        if 400 <= self.status_code < 600:
+            kind = 'Client' if self.status_code < 500 else 'Server'
+            raise requests.exceptions.HTTPError(
+                f"{self.status_code} {kind} Error for url: {self.url}",
+                response=self,
+            )
+
+class AsyncRetrySession:
+    """aiohttp counterpart of requests_retry_session().
+
+    Applies the same policy: up to *retries* retries on connection errors,
+    timeouts and the statuses in *status_forcelist*, sleeping a jittered
+    backoff_factor * 2 ** (n - 1) seconds between attempts the way
+    BudgetedRetry does, and only while retry_policy's budgets allow.
+    Failures surface as requests exceptions, so scrapers can share their
+    error handling between the blocking and async paths.
+
+    With a *limiter* (see AdaptiveHostLimiter), each attempt waits for a
+    slot on its host and reports its latency and status back. With a
+    *throttle* (see HostThrottle), each attempt first waits out its
+    domain's backpressure pause, and a 429/503 is retried once the pause
+    the host asked for is over.
+
+    Bodies are read in chunks and abandoned with ResponseTooLarge past
+    the domain's cap in *max_bytes_per_host*, or else *max_bytes*; bytes
+    read and aborts are counted in *stats* (a DownloadStats), if given.
+    With a *coalescer* (see RequestCoalescer), identical GET/HEAD requests
+    share one trip to the server.
+
+    Use as ``async with AsyncRetrySession() as session:``.
+    """
+    def __init__(
+        self,
+        retries=3,
+        backoff_factor=0.3,
+        status_forcelist=(500, 502, 504),
+        timeout=30,
+        limit=100,
+        limiter=None,
+        throttle=None,
+        max_bytes=None,
+        max_bytes_per_host=None,
+        stats=None,
+        coalescer=None,
+    ):
+        self.retries = retries
+        self.backoff_factor = backoff_factor
+        self.status_forcelist = status_forcelist
+        self.timeout = timeout
+        self.limit = limit
+        self.limiter = limiter
+        self.throttle = throttle
+        self.max_bytes = max_bytes
+        self.max_bytes_per_host = dict(max_bytes_per_host or {})
+        self.stats = stats
+        self.coalescer = coalescer
+        self._session = None
+
+    async def __aenter__(self):
+        import aiohttp
+
+        self._session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=self.limit),
+        )
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self._session.close()
+
+    def _backoff(self, attempt):
+        if attempt < 1:
+            return 0
+        return retry_policy.backoff(attempt, self.backoff_factor)
+
+    async def _read_body(self, response, url):
+        """Read the body in chunks, giving up once it passes the byte cap."""
+        max_bytes = self.max_bytes_per_host.get(get_host_key(url), self.max_bytes)
+        if max_bytes is not None and (response.content_length or 0) > max_bytes:
+            self._count(0, aborted=True)
+            raise ResponseTooLarge(url, max_bytes)
+
+        chunks = []
+        size = 0
+        async for chunk in response.content.iter_chunked(CHUNK_SIZE):
+            size += len(chunk)
+            if max_bytes is not None and size > max_bytes:
+                self._count(size, aborted=True)
+                raise ResponseTooLarge(url, max_bytes)
+            chunks.append(chunk)
+        self._count(size)
+        return b''.join(chunks)
+
+    def _count(self, size, aborted=False):
+        if self.stats is not None:
+            self.stats.add(size, aborted=aborted)
+
+    async def get(self, url, **kwargs):
+        return await self.request('GET', url, **kwargs)
+
+    async def post(self, url, **kwargs):
+        return await self.request('POST', url, **kwargs)
+
+    async def request(self, method, url, timeout=None, allow_redirects=True, **kwargs):
+        key = None
+        if self.coalescer is not None:
+            max_bytes = self.max_bytes_per_host.get(get_host_key(url), self.max_bytes)
+            key = self.coalescer.key(method, url, dict(kwargs, allow_redirects=allow_redirects), max_bytes)
+        if key is None:
+            return await self._request(method, url, timeout, allow_redirects, **kwargs)
+        try:
+            return await self.coalescer.afetch(
+                key,
+                partial(self._request, method, url, timeout, allow_redirects, **kwargs),
+                timeout=remaining(),
+            )
+        except asyncio.TimeoutError:
+            # Gave up waiting on another source's request: our deadline is spent
+            check_deadline()
+            raise
+
+    async def _request(self, method, url, timeout, allow_redirects, **kwargs):
+        import aiohttp
+
+        # Like urllib3's Retry, only idempotent methods are retried on status
+        retry_on_status = method.upper() in ('GET', 'HEAD', 'OPTIONS')
+
+        for attempt in range(self.retries + 1):
+            if self.throttle is not None:
+                check_deadline(self.throttle.delay(url))
+                await self.throttle.await_ready(url)
+            check_deadline()
+            # Each attempt gets at most the time left before the source's deadline
+            client_timeout = aiohttp.ClientTimeout(total=cap_timeout(timeout or self.timeout))
+            if self.limiter is not None:
+                await self.limiter.aacquire(url)
+            started = time.monotonic()
+            status = None
+            aborted = False
+            try:
+                async with self._session.request(
+                    method,
+                    url,
+                    timeout=client_timeout,
+                    allow_redirects=allow_redirects,
+                    **kwargs,
+                ) as response:
+                    content = await self._read_body(response, url)
+                    status = response.status
+                    result = AsyncResponse(
+                        str(response.url),
+                        response.status,
+                        response.headers,
+                        content,
+                        response.charset,
+                    )
+            except ResponseTooLarge:
+                aborted = True
+                raise
+            except asyncio.TimeoutError as e:
+                if attempt >= self.retries or not retry_policy.allow():
+                    raise requests.exceptions.Timeout(f"Timeout ao acessar {url}") from e
+            except aiohttp.ClientError as e:
+                if attempt >= self.retries or not retry_policy.allow():
+                    raise requests.exceptions.ConnectionError(str(e)) from e
+            else:
+                backpressure = (
+                    self.throttle is not None
+                    and self.throttle.observe(url, status, result.headers)
+                )
+                # 429/503 mean the request was not processed, so any method is retried
+                retry = backpressure or (retry_on_status and status in self.status_forcelist)
+                if not retry or attempt >= self.retries or not retry_policy.allow():
+                    return result
+            finally:
+                # The slot is freed before the backoff sleep
+                if self.limiter is not None:
+                    # A body past our byte cap is no sign of an overloaded host
+                    self.limiter.release(
+                        url, time.monotonic() - started, status=status, failed=status is None, aborted=aborted,
+                    )
+            delay = self._backoff(attempt)
+            retry_policy.record_wait(delay)
+            await asyncio.sleep(delay)
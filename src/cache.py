@@ -0,0 +1,212 @@
+import os
+import copy
+import json
+import time
+import datetime
+import threading
+from collections import OrderedDict
+from src.coalesce import SingleFlight
+from src.deadline import check_deadline, remaining
+from src.urls import canonical_url
+
+DEFAULT_CACHE_PATH = os.path.join('cache', 'enrichment.json')
+DEFAULT_TTL = 30 * 24 * 3600
+DEFAULT_MAX_ENTRIES = 2000
+
+def _cache_key(namespace, url):
+    """Key an entry by extractor namespace and canonical article URL."""
+    return f"{namespace} {canonical_url(url)}"
+
+def _encode(value):
+    if isinstance(value, datetime.datetime):
+        return {'__datetime__': value.isoformat()}
+    raise TypeError(f"Tipo não serializável no cache: {type(value).__name__}")
+
+def _decode(obj):
+    if '__datetime__' in obj:
+        return datetime.datetime.fromisoformat(obj['__datetime__'])
+    return obj
+
+def _is_cacheable(value, complete=None):
+    """Only complete extraction results are cached; failures are retried next run.
+
+    *complete*, if given, is the caller's own test of a complete value (say,
+    that the body element of an (author, body) tuple is there).
+    """
+    if not value:
+        return False
+    if complete is not None:
+        return bool(complete(value))
+    if isinstance(value, dict):
+        return not value.get('_enrichment_failed')
+    if isinstance(value, (tuple, list)):
+        return any(value)
+    return True
+
+class EnrichmentCache:
+    """Persistent on-disk cache of extracted article content.
+
+    Published articles rarely change, so the content extracted from an
+    article page (body HTML, abstracts, transcripts...) is kept between runs
+    in one JSON file. Entries expire after *ttl* seconds and the least
+    recently used ones are evicted beyond *max_entries*.
+
+    *revalidate*, if given, is called as revalidate(url, value, stored_at)
+    for an expired entry; returning True keeps the entry for another *ttl*
+    instead of fetching the page again.
+
+    Without a *path* the cache lives in memory for the run only. Either
+    way a source retried within the run reuses every article its failed
+    attempt already extracted, so only the requests that failed are made
+    again.
+
+    Sources that miss the same article at the same time share one
+    extraction: the others wait for it instead of fetching the page too.
+    """
+    def __init__(self, path=None, ttl=DEFAULT_TTL, max_entries=DEFAULT_MAX_ENTRIES, revalidate=None):
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+        self._flight = SingleFlight()
+        self.configure(path, ttl, max_entries, revalidate)
+
+    def configure(self, path=None, ttl=DEFAULT_TTL, max_entries=DEFAULT_MAX_ENTRIES, revalidate=None):
+        with self._lock:
+            self.path = path
+            self.ttl = ttl
+            self.max_entries = max_entries
+            self.revalidate = revalidate
+            self._stats = {'hits': 0, 'misses': 0, 'expired': 0, 'evicted': 0}
+
+    @property
+    def persistent(self):
+        return self.path is not None
+
+    def load(self):
+        """Read the cache file, dropping it if it is unreadable."""
+        if not self.persistent or not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                entries = json.load(f, object_hook=_decode)
+        except (OSError, ValueError) as e:
+            print(f"⚠️  Cache de conteúdo ignorado ({self.path}): {str(e)}")
+            return
+        with self._lock:
+            # Stored oldest-used first, so the order is the LRU order
+            self._entries = OrderedDict(entries)
+
+    def save(self):
+        """Write the cache file atomically."""
+        if not self.persistent:
+            return
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        with self._lock:
+            data = json.dumps(self._entries, ensure_ascii=False, default=_encode)
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(data)
+        os.replace(tmp_path, self.path)
+
+    def get(self, namespace, url, complete=None):
+        """Return (True, value) for a fresh entry, (False, None) otherwise.
+
+        With *complete* (see _is_cacheable), an entry that fails it, stored
+        before the check existed, is dropped and fetched again.
+        """
+        key = _cache_key(namespace, url)
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and complete is not None and not _is_cacheable(entry['value'], complete):
+                self._entries.pop(key, None)
+                entry = None
+
+        # The hook may hit the network, so it runs outside the lock
+        if entry is not None and now - entry['stored_at'] > self.ttl:
+            if self._still_valid(url, entry):
+                entry['stored_at'] = now
+            else:
+                with self._lock:
+                    self._entries.pop(key, None)
+                    self._stats['expired'] += 1
+                entry = None
+
+        with self._lock:
+            if entry is None:
+                self._stats['misses'] += 1
+                return False, None
+            if key in self._entries:
+                self._entries.move_to_end(key)
+            self._stats['hits'] += 1
+            # Callers may update the articles they get; keep the cache intact
+            return True, copy.deepcopy(entry['value'])
+
+    def _still_valid(self, url, entry):
+        if self.revalidate is None:
+            return False
+        try:
+            return bool(self.revalidate(url, entry['value'], entry['stored_at']))
+        except Exception as e:
+            print(f"   ⚠️  Erro ao revalidar cache de {url}: {str(e)}")
+            return False
+
+    def put(self, namespace, url, value, complete=None):
+        if not _is_cacheable(value, complete):
+            return
+        key = _cache_key(namespace, url)
+        with self._lock:
+            self._entries[key] = {'stored_at': time.time(), 'value': copy.deepcopy(value)}
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._stats['evicted'] += 1
+
+    def fetch(self, namespace, url, func, *args, complete=None):
+        """Return the cached value for *url*, or call func(*args) and cache it.
+
+        *complete* decides which values are worth caching (see _is_cacheable).
+        """
+        found, value = self.get(namespace, url, complete)
+        if found:
+            return value
+        try:
+            value, _ = self._flight.do(
+                _cache_key(namespace, url), self._extract, namespace, url, func, args, complete,
+                timeout=remaining(),
+            )
+        except TimeoutError:
+            check_deadline()
+            raise
+        # The value is shared with any caller that waited on this extraction
+        return copy.deepcopy(value)
+
+    def _extract(self, namespace, url, func, args, complete):
+        value = func(*args)
+        self.put(namespace, url, value, complete)
+        return value
+
+    async def afetch(self, namespace, url, func, *args, complete=None):
+        """fetch() for a coroutine function *func*."""
+        found, value = self.get(namespace, url, complete)
+        if found:
+            return value
+        try:
+            value, _ = await self._flight.ado(
+                _cache_key(namespace, url), self._aextract, namespace, url, func, args, complete,
+                timeout=remaining(),
+            )
+        except TimeoutError:
+            check_deadline()
+            raise
+        return copy.deepcopy(value)
+
+    async def _aextract(self, namespace, url, func, args, complete):
+        value = await func(*args)
+        self.put(namespace, url, value, complete)
+        return value
+
+    def stats(self):
+        with self._lock:
+            return dict(self._stats, entries=len(self._entries), shared=self._flight.shared)
+
+enrichment_cache = EnrichmentCache()
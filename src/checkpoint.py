@@ -0,0 +1,98 @@
+import os
+import json
+import time
+import threading
+from src.utils import get_feed_path, get_history_path
+
+DEFAULT_CHECKPOINT_PATH = os.path.join('cache', 'checkpoint.jsonl')
+
+def _read_text(path):
+    if not os.path.exists(path):
+        return None
+    with open(path, 'r', encoding='utf-8') as f:
+        return f.read()
+
+def _write_text(path, text):
+    if text is None or _read_text(path) == text:
+        return
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(text)
+
+class RunCheckpoint:
+    """Progress of a run, so a killed run can be resumed instead of redone.
+
+    The checkpoint is a JSON Lines file: a header with the run's start
+    time, then one line per source that finished (new or unchanged; see
+    main.process_source) with its result and the feed and history files it
+    left on disk. Lines are appended as sources finish, so a crash loses at
+    most the line being written. A run started within *window* seconds of
+    the checkpointed one resumes it: finished sources get their files
+    restored and are not scraped again. The window is measured from the
+    start of the killed run, so it must exceed the schedule's interval for
+    the next scheduled run to resume it.
+    """
+    def __init__(self, path=DEFAULT_CHECKPOINT_PATH, window=12 * 3600):
+        self.path = path
+        self.window = window
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(source):
+        return source['feed_file']
+
+    def start(self):
+        """Open the checkpoint; returns {key: entry} of sources already finished."""
+        finished = self._load()
+        if finished is None:
+            os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+            with open(self.path, 'w', encoding='utf-8') as f:
+                f.write(json.dumps({'started_at': time.time()}) + '\n')
+            return {}
+        return finished
+
+    def _load(self):
+        """Finished entries of a resumable checkpoint, or None to start afresh."""
+        if not self.window or not os.path.exists(self.path):
+            return None
+        with open(self.path, 'r', encoding='utf-8') as f:
+            lines = f.read().splitlines()
+        try:
+            header = json.loads(lines[0])
+        except (IndexError, ValueError):
+            return None
+        if time.time() - header.get('started_at', 0) > self.window:
+            return None
+
+        finished = {}
+        for line in lines[1:]:
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                continue  # Cut short by the crash
+            finished[entry['key']] = entry
+        return finished
+
+    def record(self, source, result):
+        """Append a finished source, with the feed and history it wrote."""
+        entry = {
+            'key': self.key(source),
+            'result': result,
+            'feed': _read_text(get_feed_path(source['feed_file'])) if result.get('feed_generated') else None,
+            'history': _read_text(get_history_path(source['history_file'])),
+        }
+        line = json.dumps(entry, ensure_ascii=False) + '\n'
+        with self._lock:
+            with open(self.path, 'a', encoding='utf-8') as f:
+                f.write(line)
+                f.flush()
+
+    def restore(self, source, entry):
+        """Put back the files a finished source wrote; returns its result."""
+        _write_text(get_feed_path(source['feed_file']), entry['feed'])
+        _write_text(get_history_path(source['history_file']), entry['history'])
+        return entry['result']
+
+    def finish(self):
+        """The run completed: the next one starts from scratch."""
+        if os.path.exists(self.path):
+            os.remove(self.path)
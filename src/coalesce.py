@@ -0,0 +1,186 @@
+import copy
+import asyncio
+import threading
+from collections import OrderedDict
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+# Only safe, body-less requests are shared between callers
+COALESCED_METHODS = ('GET', 'HEAD')
+# Request options that don't change what the server sends back
+_NEUTRAL_OPTIONS = ('timeout',)
+
+def _request_url(url):
+    """*url* as the server receives it, with its query parameters sorted.
+
+    Only what cannot change the response is folded: the case of scheme and
+    host, the parameter order and the fragment (never sent). Every
+    parameter and the path are kept as they are, since tracking-looking
+    parameters or a trailing slash can still select another resource;
+    telling articles apart is canonical_url()'s job, not this one's.
+    """
+    parts = urlsplit(url)
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path, query, ''))
+
+class _Call:
+    def __init__(self):
+        self.done = threading.Event()
+        self.value = None
+        self.error = None
+
+class SingleFlight:
+    """Run a function at most once per key at a time.
+
+    The first caller for a key runs it; callers arriving while it runs
+    wait and get the same value (or exception) instead of running it
+    again. Threads use do(), coroutines ado().
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}
+        self._acalls = {}
+        self.shared = 0
+
+    def do(self, key, func, *args, timeout=None):
+        """Return (value, leader); waits at most *timeout* for another caller's run."""
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+            else:
+                self.shared += 1
+
+        if not leader:
+            if not call.done.wait(timeout):
+                raise TimeoutError(f"Aguardando requisição em andamento: {key}")
+            if call.error is not None:
+                raise call.error
+            return call.value, False
+
+        try:
+            call.value = func(*args)
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.value, True
+
+    async def ado(self, key, func, *args, timeout=None):
+        """do() for a coroutine function *func*, within one event loop."""
+        future = self._acalls.get(key)
+        if future is not None:
+            with self._lock:
+                self.shared += 1
+            # shield: a waiter timing out must not cancel the leader's call
+            return await asyncio.wait_for(asyncio.shield(future), timeout), False
+
+        future = self._acalls[key] = asyncio.get_running_loop().create_future()
+        try:
+            value = await func(*args)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            # Retrieved here so an exception nobody waited for isn't logged
+            future.exception()
+            raise
+        else:
+            future.set_result(value)
+        finally:
+            del self._acalls[key]
+        return value, True
+
+class RequestCoalescer:
+    """Share identical requests between the sources of a run.
+
+    GET and HEAD requests are keyed by method and exact URL (query sorted,
+    see _request_url) plus the options that shape the response.
+    Concurrent requests for a key make one trip to the server, and a
+    successful response of up to *max_body* bytes is remembered, so a later
+    request for it isn't sent at all. At most *max_entries* responses and
+    *max_bytes* bytes of bodies are held; the least recently used go first.
+    Every caller gets its own copy of the response object.
+    """
+    def __init__(self, max_entries=64, max_body=256 * 1024, max_bytes=4 * 1024 * 1024):
+        self.max_entries = max_entries
+        self.max_body = max_body
+        self.max_bytes = max_bytes
+        self._flight = SingleFlight()
+        self._lock = threading.Lock()
+        self._recent = OrderedDict()
+        self._held = 0
+        self._repeated = 0
+
+    def key(self, method, url, options, *extra):
+        """The coalescing key of a request, or None when it must be sent as is."""
+        method = method.upper()
+        if method not in COALESCED_METHODS:
+            return None
+        parts = []
+        for name, value in sorted(options.items()):
+            if name in _NEUTRAL_OPTIONS:
+                continue
+            if name == 'params':
+                value = sorted(value.items()) if isinstance(value, dict) else value
+            elif name == 'headers':
+                value = sorted((header.lower(), str(v)) for header, v in (value or {}).items())
+            elif name != 'allow_redirects':
+                return None  # Cookies, auth, streaming...: not shared
+            parts.append((name, repr(value)))
+        return (method, _request_url(url), tuple(parts)) + extra
+
+    def _remembered(self, key):
+        with self._lock:
+            entry = self._recent.get(key)
+            if entry is None:
+                return None
+            self._recent.move_to_end(key)
+            self._repeated += 1
+            return copy.copy(entry[0])
+
+    def _remember(self, key, response):
+        size = len(response.content)
+        if response.status_code != 200 or size > min(self.max_body, self.max_bytes):
+            return
+        with self._lock:
+            previous = self._recent.pop(key, None)
+            if previous is not None:
+                self._held -= previous[1]
+            self._recent[key] = (response, size)
+            self._held += size
+            while len(self._recent) > self.max_entries or self._held > self.max_bytes:
+                _, (_, evicted) = self._recent.popitem(last=False)
+                self._held -= evicted
+
+    def fetch(self, key, send, timeout=None):
+        """The response for *key*, calling send() only if no one else is."""
+        response = self._remembered(key)
+        if response is not None:
+            return response
+        response, leader = self._flight.do(key, send, timeout=timeout)
+        if leader:
+            self._remember(key, response)
+        return copy.copy(response)
+
+    async def afetch(self, key, send, timeout=None):
+        """fetch() for a coroutine function *send*."""
+        response = self._remembered(key)
+        if response is not None:
+            return response
+        response, leader = await self._flight.ado(key, send, timeout=timeout)
+        if leader:
+            self._remember(key, response)
+        return copy.copy(response)
+
+    def stats(self):
+        with self._lock:
+            return {
+                'shared': self._flight.shared,
+                'repeated': self._repeated,
+                'saved': self._flight.shared + self._repeated,
+            }
@@ -0,0 +1,111 @@
+import os
+import json
+import time
+import threading
+from requests.cookies import RequestsCookieJar, create_cookie
+from src.utils import get_host_key
+
+DEFAULT_COOKIES_PATH = os.path.join('cache', 'cookies.json')
+
+class CookieStore:
+    """Cookies of selected publisher domains, kept between runs.
+
+    Sites behind consent pages or login redirects (LinkedIn, Bloomberg,
+    Globo) set cookies on the first hops of a cold session; replaying them
+    on the next run lets requests land on the page directly. Each domain
+    in *hosts* (see get_host_key) gets one jar, shared by every pooled
+    session of that domain. Cookies past their expiry are dropped on load
+    and on save; session cookies, which carry no expiry, are kept for
+    *session_ttl* seconds after they were first saved.
+    """
+    def __init__(self, hosts=(), session_ttl=7 * 24 * 3600):
+        self.hosts = set(hosts)
+        self.session_ttl = session_ttl
+        self._jars = {}
+        self._lock = threading.Lock()
+        self._loaded = 0
+        self._expired = 0
+
+    def persists(self, url):
+        return get_host_key(url) in self.hosts
+
+    def jar_for(self, url):
+        """The shared jar of *url*'s domain, or None when it is not persisted."""
+        host = get_host_key(url)
+        if host not in self.hosts:
+            return None
+        with self._lock:
+            jar = self._jars.get(host)
+            if jar is None:
+                jar = self._jars[host] = RequestsCookieJar()
+            return jar
+
+    def load(self, path=DEFAULT_COOKIES_PATH):
+        """Restore the unexpired cookies saved by the previous run."""
+        if not self.hosts or not os.path.exists(path):
+            return
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"⚠️  Cookies salvos ignorados ({path}): {str(e)}")
+            return
+        now = time.time()
+        with self._lock:
+            for host, cookies in data.items():
+                if host not in self.hosts:
+                    continue
+                jar = self._jars.setdefault(host, RequestsCookieJar())
+                for saved in cookies:
+                    if saved.get('expires') is not None and saved['expires'] <= now:
+                        self._expired += 1
+                        continue
+                    jar.set_cookie(create_cookie(
+                        saved['name'],
+                        saved['value'],
+                        domain=saved.get('domain', ''),
+                        path=saved.get('path', '/'),
+                        secure=saved.get('secure', False),
+                        expires=saved.get('expires'),
+                        rest=saved.get('rest', {}),
+                    ))
+                    self._loaded += 1
+
+    def save(self, path=DEFAULT_COOKIES_PATH):
+        if not self.hosts:
+            return
+        now = time.time()
+        data = {}
+        with self._lock:
+            for host, jar in sorted(self._jars.items()):
+                cookies = []
+                for cookie in jar:
+                    if cookie.is_expired(now):
+                        continue
+                    cookies.append({
+                        'name': cookie.name,
+                        'value': cookie.value,
+                        'domain': cookie.domain,
+                        'path': cookie.path,
+                        'secure': cookie.secure,
+                        # A session cookie gets a bounded lifetime once persisted
+                        'expires': cookie.expires if cookie.expires is not None else int(now + self.session_ttl),
+                        'rest': dict(cookie._rest),
+                    })
+                if cookies:
+                    data[host] = cookies
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+
+    def stats(self):
+        with self._lock:
+            return {
+                'hosts': len(self._jars),
+                'cookies': sum(len(jar) for jar in self._jars.values()),
+                'loaded': self._loaded,
+                'expired': self._expired,
+            }
+
+# One store per process, shared by the session registry
+cookie_store = CookieStore()
@@ -0,0 +1,48 @@
+import time
+import contextvars
+import requests
+
+# Monotonic time by which the current source must be done, if any
+_deadline = contextvars.ContextVar('source_deadline', default=None)
+
+class DeadlineExceeded(requests.exceptions.Timeout):
+    """The current source ran out of wall-clock time.
+
+    A Timeout, so scrapers treat it like any failed request: the article
+    being enriched is kept with its listing data and marked incomplete.
+    """
+
+def set_deadline(seconds):
+    """Give the current context *seconds* of wall-clock time (None = no limit)."""
+    return _deadline.set(time.monotonic() + seconds if seconds else None)
+
+def reset_deadline(token):
+    _deadline.reset(token)
+
+def remaining():
+    """Seconds left before the deadline, or None when there is none."""
+    deadline = _deadline.get()
+    if deadline is None:
+        return None
+    return max(deadline - time.monotonic(), 0.0)
+
+def expired():
+    left = remaining()
+    return left is not None and left <= 0
+
+def check_deadline(needed=0.0):
+    """Raise DeadlineExceeded unless more than *needed* seconds are left."""
+    left = remaining()
+    if left is not None and left <= needed:
+        raise DeadlineExceeded("Prazo da fonte esgotado")
+
+def cap_timeout(timeout):
+    """Shorten a request *timeout* so it cannot outlive the deadline."""
+    left = remaining()
+    if left is None:
+        return timeout
+    if timeout is None:
+        return left
+    if isinstance(timeout, tuple):
+        return tuple(min(part, left) for part in timeout)
+    return min(timeout, left)
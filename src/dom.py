@@ -0,0 +1,157 @@
+import functools
+import soupsieve
+from bs4 import BeautifulSoup, SoupStrainer, Tag
+
+# Tree builders by preference; html.parser ships with Python and always works
+PARSER_BACKENDS = ('lxml', 'html.parser')
+
+_backend = None
+
+def _available(backend):
+    if backend == 'html.parser':
+        return True
+    try:
+        __import__(backend)
+    except ImportError:
+        return False
+    return True
+
+def configure_parser(backend='auto'):
+    """Pick the tree builder make_soup() uses; returns the one in effect.
+
+    'auto' takes the fastest one installed (lxml, which trafilatura already
+    depends on). A backend that isn't installed falls back to html.parser
+    with a warning. Parse pool workers start with 'auto'; start_parse_pool()
+    runs this in each worker to apply another choice there too.
+    """
+    global _backend
+    if backend in (None, 'auto'):
+        _backend = next(name for name in PARSER_BACKENDS if _available(name))
+    elif backend not in PARSER_BACKENDS:
+        print(f"⚠️  Parser HTML desconhecido: {backend}; usando html.parser")
+        _backend = 'html.parser'
+    elif not _available(backend):
+        print(f"⚠️  Parser HTML {backend} não instalado; usando html.parser")
+        _backend = 'html.parser'
+    else:
+        _backend = backend
+    return _backend
+
+def parser_backend():
+    if _backend is None:
+        configure_parser()
+    return _backend
+
+def make_soup(markup, from_encoding=None, parse_only=None):
+    """Parse *markup* (bytes or str) with the configured backend."""
+    return BeautifulSoup(
+        markup,
+        parser_backend(),
+        from_encoding=from_encoding,
+        parse_only=parse_only,
+    )
+
+@functools.lru_cache(maxsize=512)
+def compile_selector(selector):
+    """The compiled form of a CSS *selector*, compiled once per process."""
+    return soupsieve.compile(selector)
+
+def select(tag, selector, limit=0):
+    """tag.select(selector, limit) with the selector compiled once."""
+    return compile_selector(selector).select(tag, limit)
+
+def select_one(tag, selector):
+    """tag.select_one(selector) with the selector compiled once."""
+    return compile_selector(selector).select_one(tag)
+
+class _Enough(Exception):
+    """Raised inside the tree builder once a listing has given enough cards."""
+
+class _CardSoup(BeautifulSoup):
+    """Strained soup that hands each top-level element to *on_card* as it closes.
+
+    on_card(tag) returns True to stop parsing the rest of the document.
+    """
+    def __init__(self, markup, parser, on_card, **kwargs):
+        self._on_card = on_card
+        self._delivered = 0
+        self._enough = False
+        super().__init__(markup, parser, **kwargs)
+
+    def _deliver(self, card):
+        self._delivered += 1
+        if self._on_card(card):
+            self._enough = True
+            raise _Enough()
+
+    def handle_endtag(self, name, nsprefix=None):
+        depth = len(self.tagStack)
+        super().handle_endtag(name, nsprefix)
+        if depth > 1 and len(self.tagStack) == 1:
+            self._deliver(self.contents[-1])
+
+    def _feed(self):
+        try:
+            super()._feed()
+            # Cards the page never closed are only popped at the end
+            for card in self.contents[self._delivered:]:
+                if isinstance(card, Tag):
+                    self._deliver(card)
+        except _Enough:
+            self.endData()
+            while self.currentTag.name != self.ROOT_TAG_NAME:
+                self.popTag()
+
+@functools.lru_cache(maxsize=None)
+def _card_soup_works(backend):
+    """Whether _CardSoup still stops early with this bs4 and *backend*.
+
+    It overrides BeautifulSoup internals (_feed, handle_endtag, tagStack),
+    so a bs4 release that changes them must not silently break listings.
+    """
+    delivered = []
+
+    def on_card(card):
+        delivered.append(card.get_text())
+        return len(delivered) >= 2
+
+    try:
+        soup = _CardSoup('<p>x</p>' + '<div>1</div>' * 3, backend, on_card, parse_only=SoupStrainer('div'))
+        stopped = len(soup.find_all('div')) == 2
+    except Exception:
+        stopped = False
+    if stopped and delivered == ['1', '1']:
+        return True
+    print(f"⚠️  Parsing incremental de listagens indisponível com bs4 e {backend}; lendo a página inteira")
+    return False
+
+def parse_cards(markup, parse_card, limit=None, from_encoding=None, name=None, attrs=None, **kwargs):
+    """Parse only the card elements of a listing page, stopping after *limit*.
+
+    Cards are the elements matched by *name*, *attrs* and *kwargs*, as for
+    SoupStrainer (e.g. name='div', class_='bastian-feed-item'); nothing
+    outside them is built. Each card is given to parse_card(card) as soon
+    as it closes, and parsing stops once *limit* of those calls returned
+    something other than None. Returns those results, in page order.
+    Should the installed bs4 no longer allow stopping early, the strained
+    page is parsed in full and the cards are read from it instead.
+    """
+    results = []
+
+    def on_card(card):
+        result = parse_card(card)
+        if result is not None:
+            results.append(result)
+        return limit is not None and len(results) >= limit
+
+    backend = parser_backend()
+    strainer = SoupStrainer(name, attrs or {}, **kwargs)
+    if not _card_soup_works(backend):
+        soup = make_soup(markup, from_encoding=from_encoding, parse_only=strainer)
+        for card in soup.find_all(True, recursive=False):
+            if on_card(card):
+                break
+        return results
+
+    _CardSoup(markup, backend, on_card, from_encoding=from_encoding, parse_only=strainer)
+    return results
@@ -0,0 +1,117 @@
+import re
+import json
+
+_LD_JSON_RE = re.compile(
+    rb'<script\b[^>]*\btype=["\']?application/ld\+json["\']?[^>]*>(.*?)</script\s*>',
+    re.I | re.S,
+)
+_WHITESPACE = re.compile(r'\s*')
+_DECODER = json.JSONDecoder()
+
+def _as_bytes(markup):
+    return markup.encode('utf-8') if isinstance(markup, str) else markup
+
+def _subtree(data, path):
+    for key in path:
+        if not isinstance(data, dict):
+            return None
+        data = data.get(key)
+    return data
+
+def _decode(span, path):
+    """Parse a located JSON span, then walk *path* (a tuple of keys) into it."""
+    try:
+        data = json.loads(span)
+    except ValueError:
+        return None
+    return _subtree(data, path)
+
+def script_json(markup, script_id, path=()):
+    """The JSON of the <script id="*script_id*"> element (e.g. __NEXT_DATA__).
+
+    The element is located by searching the raw page for its id and only
+    its contents are decoded, so no DOM is built. *path* walks into the
+    decoded value (e.g. ('props', 'pageProps', 'story')); None when the
+    script, or a key along the path, is missing or the JSON is invalid.
+    """
+    content = _as_bytes(markup)
+    index = content.find(f'id="{script_id}"'.encode('utf-8'))
+    if index == -1:
+        index = content.find(f"id='{script_id}'".encode('utf-8'))
+    if index == -1:
+        return None
+    start = content.find(b'>', index) + 1
+    end = content.find(b'</script', start)
+    if start == 0 or end == -1:
+        return None
+    return _decode(content[start:end], path)
+
+def assigned_json(markup, name, terminator=';Fusion.', path=()):
+    """The JSON assigned to the JavaScript variable *name* (e.g. Fusion.globalContent).
+
+    Arc/Fusion pages serialize their state as ``name=<json>;Fusion.next=...``;
+    the span between ``name=`` and *terminator* is found in the raw page
+    and decoded alone. *path* and the return value work as in script_json().
+    """
+    content = _as_bytes(markup)
+    start = content.find(f'{name}='.encode('utf-8'))
+    if start == -1:
+        return None
+    start += len(name) + 1
+    end = content.find(terminator.encode('utf-8'), start)
+    if end == -1:
+        return None
+    return _decode(content[start:end], path)
+
+def ld_json(markup):
+    """Yield each decodable JSON-LD block (<script type="application/ld+json">) of a page."""
+    for match in _LD_JSON_RE.finditer(_as_bytes(markup)):
+        try:
+            yield json.loads(match.group(1))
+        except ValueError:
+            continue
+
+def json_after(markup, marker, start=0):
+    """The JSON value that follows the first *marker* at or after *start*.
+
+    For values with no delimiter of their own to search for, such as an
+    object literal inside a script (``data: {...}``) or an array keyed
+    inside a larger payload (``"initialInsights":[...]``). JSONDecoder's
+    raw_decode() scans the value from the marker and stops where it ends,
+    so nothing after it is read. None when the marker is missing or no
+    valid JSON value follows it.
+    """
+    if isinstance(markup, bytes):
+        index = markup.find(marker.encode('utf-8'), start)
+        if index == -1:
+            return None
+        text = markup[index + len(marker.encode('utf-8')):].decode('utf-8', errors='replace')
+        index = 0
+    else:
+        index = markup.find(marker, start)
+        if index == -1:
+            return None
+        text = markup
+        index += len(marker)
+    try:
+        value, _ = _DECODER.raw_decode(text, _WHITESPACE.match(text, index).end())
+    except ValueError:
+        return None
+    return value
+
+def iter_json_after(markup, marker):
+    """Yield the JSON value following each occurrence of *marker*, in page order.
+
+    Occurrences not followed by valid JSON are skipped.
+    """
+    text = markup.decode('utf-8', errors='replace') if isinstance(markup, bytes) else markup
+    index = text.find(marker)
+    while index != -1:
+        index += len(marker)
+        try:
+            value, index = _DECODER.raw_decode(text, _WHITESPACE.match(text, index).end())
+        except ValueError:
+            pass
+        else:
+            yield value
+        index = text.find(marker, index)
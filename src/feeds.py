@@ -0,0 +1,116 @@
+import xml.etree.ElementTree as ET
+from src.fetcher import CHUNK_SIZE
+
+ATOM_NS = 'http://www.w3.org/2005/Atom'
+RSS1_NS = 'http://purl.org/rss/1.0/'
+RDF_NS = 'http://www.w3.org/1999/02/22-rdf-syntax-ns#'
+DC_NS = 'http://purl.org/dc/elements/1.1/'
+CONTENT_NS = 'http://purl.org/rss/1.0/modules/content/'
+MEDIA_NS = 'http://search.yahoo.com/mrss/'
+
+# RSS 2.0 item, RSS 1.0 (RDF) item, Atom entry
+ITEM_TAGS = {'item', f'{{{RSS1_NS}}}item', f'{{{ATOM_NS}}}entry'}
+
+# Item fields and where each dialect keeps them, by preference
+FIELDS = {
+    'title': ('title', f'{{{RSS1_NS}}}title', f'{{{ATOM_NS}}}title'),
+    'guid': ('guid', f'{{{ATOM_NS}}}id'),
+    'description': (
+        'description',
+        f'{{{CONTENT_NS}}}encoded',
+        f'{{{ATOM_NS}}}summary',
+        f'{{{ATOM_NS}}}content',
+        f'{{{RSS1_NS}}}description',
+        f'{{{MEDIA_NS}}}group/{{{MEDIA_NS}}}description',
+    ),
+    'author': ('author', f'{{{DC_NS}}}creator', f'{{{ATOM_NS}}}author/{{{ATOM_NS}}}name'),
+    'published': ('pubDate', f'{{{DC_NS}}}date', f'{{{ATOM_NS}}}published'),
+    'updated': (f'{{{ATOM_NS}}}updated',),
+}
+
+def _text(item, paths):
+    """Text of the first element found along *paths*: '' when it's empty, None when none is."""
+    for path in paths:
+        elem = item.find(path)
+        if elem is not None:
+            return elem.text or ''
+    return None
+
+def _link(item):
+    elem = item.find('link')
+    if elem is None:
+        elem = item.find(f'{{{RSS1_NS}}}link')
+    if elem is not None:
+        return elem.get('href', elem.text or '')
+    links = item.findall(f'{{{ATOM_NS}}}link')
+    for elem in links:
+        if elem.get('rel', 'alternate') == 'alternate':
+            return elem.get('href', '')
+    return links[0].get('href', '') if links else None
+
+def normalize_item(item, extra=None):
+    """The fields of an item element as a dict, whatever the feed dialect.
+
+    Keys are title, link, guid, description, author, published and
+    updated, plus one per entry of *extra* (name -> ElementPath of a field
+    only some feeds carry, e.g. {'video_id': '{...youtube...}videoId'}).
+    A field is None when the item lacks it and '' when it is empty.
+    """
+    fields = {name: _text(item, paths) for name, paths in FIELDS.items()}
+    fields['link'] = _link(item)
+    if fields['guid'] is None:
+        fields['guid'] = item.get(f'{{{RDF_NS}}}about')
+    for name, path in (extra or {}).items():
+        fields[name] = _text(item, (path,))
+    return fields
+
+def iter_feed_items(chunks, limit=None, extra=None):
+    """Yield the items of an RSS 2.0, RSS 1.0 (RDF) or Atom feed as they are parsed.
+
+    *chunks* is an iterable of byte strings, such as a streamed response's
+    iter_content(). Each item is normalized (see normalize_item) once its
+    closing tag is read and its element is then dropped from the tree, so
+    memory stays flat however long the feed. After *limit* items nothing
+    more is read, and *chunks* is closed if it can be. Malformed XML
+    raises ET.ParseError.
+    """
+    parser = ET.XMLPullParser(events=('start', 'end'))
+
+    def events():
+        for chunk in chunks:
+            parser.feed(chunk)
+            yield from parser.read_events()
+        parser.close()
+        yield from parser.read_events()
+
+    open_elements = []
+    produced = 0
+    try:
+        if limit is not None and limit <= 0:
+            return
+        for event, elem in events():
+            if event == 'start':
+                open_elements.append(elem)
+                continue
+            open_elements.pop()
+            if elem.tag not in ITEM_TAGS:
+                continue
+            item = normalize_item(elem, extra)
+            if open_elements:
+                open_elements[-1].remove(elem)
+            yield item
+            produced += 1
+            if limit is not None and produced >= limit:
+                return
+    finally:
+        close = getattr(chunks, 'close', None)
+        if close is not None:
+            close()
+
+def feed_items(response, limit=None, extra=None):
+    """iter_feed_items() over a response's body, read as it is parsed.
+
+    With a response requested with stream=True (see Fetcher), the rest of
+    the body is never downloaded once *limit* items are out.
+    """
+    return iter_feed_items(response.iter_content(CHUNK_SIZE), limit=limit, extra=extra)
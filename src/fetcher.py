@@ -0,0 +1,286 @@
+import copy
+import time
+import threading
+import subprocess
+import contextvars
+import requests
+from functools import partial
+from concurrent.futures import ThreadPoolExecutor
+from src.http_client import requests_retry_session, conditional_get
+from src.retry import retry_policy, PermanentError
+from src.deadline import check_deadline, cap_timeout, remaining
+from src.utils import get_host_key
+
+CHUNK_SIZE = 64 * 1024
+
+class ResponseTooLarge(PermanentError, requests.exceptions.RequestException):
+    """A response body went past the byte cap and was abandoned."""
+    def __init__(self, url, max_bytes):
+        super().__init__(f"Resposta maior que {max_bytes} bytes abortada: {url}")
+        self.url = url
+
+class DownloadStats:
+    """Body bytes read and downloads aborted, shared by every client of a run."""
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.bytes_read = 0
+        self.aborted = 0
+
+    def add(self, size, aborted=False):
+        with self._lock:
+            self.bytes_read += size
+            self.aborted += int(aborted)
+
+class Fetcher:
+    """The scrapers' single way to reach the network.
+
+    Every scraper gets one (see BaseScraper), so pooling, caching,
+    throttling, metrics or offline replay can be added here once instead
+    of in each scraper. By default it wraps the pooled retry session from
+    requests_retry_session(); pass *session* to substitute another object
+    with a requests-style request() method.
+
+    With a *limiter* (see AdaptiveHostLimiter), every request waits for a
+    slot on its host and reports its latency and status back, and map()
+    fans out as wide as the limiter allows. With a *throttle* (see
+    HostThrottle), requests wait out their domain's backpressure pause and
+    a 429/503 is retried, up to *throttle_retries* times and while
+    retry_policy's budgets allow, once the pause the host asked for is over.
+    Requests made for a source with a deadline (see src/deadline.py) have
+    their timeout cut to the time left, and fail once it is spent.
+
+    Bodies are streamed and abandoned with ResponseTooLarge once they pass
+    the byte cap: the publisher domain's entry in *max_bytes_per_host*, or
+    else the scraper's in *max_bytes_per_scraper* (see for_scraper()), or
+    else *max_bytes* (None = no cap).
+
+    With a *coalescer* (see RequestCoalescer), identical GET/HEAD requests
+    made by any source during the run share one trip to the server.
+
+    As with requests, stream=True returns as soon as the headers arrive and
+    leaves the body to response.iter_content(), still under the byte cap;
+    the caller may stop reading early, and must then close the response.
+    Streamed requests are never coalesced, and free their limiter slot
+    once the headers are in. Http2Session (src/http2_client.py) reads the
+    whole body whatever *stream* says, so on HTTP/2 hosts the byte cap is
+    only checked once the body is downloaded.
+    """
+    def __init__(
+        self,
+        session=None,
+        timeout=30,
+        limiter=None,
+        throttle=None,
+        throttle_retries=2,
+        max_bytes=None,
+        max_bytes_per_host=None,
+        max_bytes_per_scraper=None,
+        coalescer=None,
+    ):
+        self.session = session if session is not None else requests_retry_session()
+        self.timeout = timeout
+        self.limiter = limiter
+        self.throttle = throttle
+        self.throttle_retries = throttle_retries
+        self.max_bytes = max_bytes
+        self.max_bytes_per_host = dict(max_bytes_per_host or {})
+        self.max_bytes_per_scraper = dict(max_bytes_per_scraper or {})
+        self.coalescer = coalescer
+        self.stats = DownloadStats()
+
+    def for_scraper(self, name):
+        """This Fetcher with scraper *name*'s byte cap as the default.
+
+        The copy shares the session, limiter, throttle, coalescer and stats.
+        """
+        if name not in self.max_bytes_per_scraper:
+            return self
+        fetcher = copy.copy(self)
+        fetcher.max_bytes = self.max_bytes_per_scraper[name]
+        return fetcher
+
+    def _byte_cap(self, url):
+        return self.max_bytes_per_host.get(get_host_key(url), self.max_bytes)
+
+    def request(self, method, url, **kwargs):
+        key = None
+        if self.coalescer is not None:
+            # Responses read under different byte caps aren't interchangeable
+            key = self.coalescer.key(method, url, kwargs, self._byte_cap(url))
+        if key is None:
+            return self._request(method, url, **kwargs)
+        try:
+            return self.coalescer.fetch(
+                key, partial(self._request, method, url, **kwargs), timeout=remaining(),
+            )
+        except TimeoutError:
+            # Gave up waiting on another source's request: our deadline is spent
+            check_deadline()
+            raise
+
+    def _request(self, method, url, **kwargs):
+        timeout = kwargs.pop('timeout', self.timeout)
+        for attempt in range(self.throttle_retries + 1):
+            if self.throttle is not None:
+                check_deadline(self.throttle.delay(url))
+                self.throttle.wait(url)
+            check_deadline()
+            response = self._send(method, url, timeout=cap_timeout(timeout), **kwargs)
+            backpressure = (
+                self.throttle is not None
+                and self.throttle.observe(url, response.status_code, response.headers)
+            )
+            if not backpressure or attempt >= self.throttle_retries or not retry_policy.allow():
+                break
+            response.close()
+        return response
+
+    def _send(self, method, url, **kwargs):
+        if self.limiter is None:
+            return self._fetch(method, url, **kwargs)
+
+        self.limiter.acquire(url)
+        started = time.monotonic()
+        try:
+            response = self._fetch(method, url, **kwargs)
+        except ResponseTooLarge:
+            # Our own byte cap, not a sign of an overloaded host
+            self.limiter.release(url, time.monotonic() - started, aborted=True)
+            raise
+        except Exception:
+            self.limiter.release(url, time.monotonic() - started, failed=True)
+            raise
+        self.limiter.release(url, time.monotonic() - started, status=response.status_code)
+        return response
+
+    def _fetch(self, method, url, stream=False, **kwargs):
+        """Send the request and read its body in chunks, up to the byte cap."""
+        response = self.session.request(method, url, stream=True, **kwargs)
+        max_bytes = self._byte_cap(url)
+        length = response.headers.get('Content-Length', '')
+        if max_bytes is not None and length.isdigit() and int(length) > max_bytes:
+            response.close()
+            self.stats.add(0, aborted=True)
+            raise ResponseTooLarge(url, max_bytes)
+
+        if stream:
+            # Read by the caller (response.content reads through it too)
+            response.iter_content = partial(self._read_chunks, response, response.iter_content, url, max_bytes)
+            return response
+        response._content = b''.join(self._capped_chunks(response, response.iter_content, url, max_bytes))
+        # iter_content() and iter_lines() now replay _content instead of the spent stream
+        response._content_consumed = True
+        return response
+
+    def _read_chunks(self, response, read, url, max_bytes, chunk_size=CHUNK_SIZE, decode_unicode=False):
+        """iter_content() of a streamed response: the body from read(), up to the byte cap.
+
+        The cap counts bytes, so with *decode_unicode* the capped byte
+        chunks are decoded here, the way requests decodes them.
+        """
+        chunks = self._capped_chunks(response, read, url, max_bytes, chunk_size)
+        if decode_unicode:
+            return requests.utils.stream_decode_response_unicode(chunks, response)
+        return chunks
+
+    def _capped_chunks(self, response, read, url, max_bytes, chunk_size=CHUNK_SIZE):
+        """Yield the body from read() (the original iter_content), up to the byte cap.
+
+        The response is closed once the body is read, abandoned or too large.
+        """
+        size = 0
+        aborted = False
+        try:
+            for chunk in read(chunk_size):
+                size += len(chunk)
+                if max_bytes is not None and size > max_bytes:
+                    aborted = True
+                    raise ResponseTooLarge(url, max_bytes)
+                yield chunk
+        finally:
+            response.close()
+            self.stats.add(size, aborted=aborted)
+
+    def get(self, url, **kwargs):
+        kwargs.setdefault('allow_redirects', True)
+        return self.request('GET', url, **kwargs)
+
+    def head(self, url, **kwargs):
+        kwargs.setdefault('allow_redirects', False)
+        return self.request('HEAD', url, **kwargs)
+
+    def post(self, url, data=None, json=None, **kwargs):
+        return self.request('POST', url, data=data, json=json, **kwargs)
+
+    def get_conditional(self, url, validators, **kwargs):
+        """GET with stored ETag/Last-Modified validators (see conditional_get)."""
+        return conditional_get(self, url, validators, **kwargs)
+
+    def download(self, url, **kwargs):
+        """Return the decoded body of *url*, raising on HTTP errors.
+
+        Replaces trafilatura.fetch_url(), which bypassed our retry, timeout
+        and pooling policy.
+        """
+        response = self.get(url, **kwargs)
+        response.raise_for_status()
+        return response.text
+
+    def download_with_curl(self, url, user_agent=None):
+        """Fetch *url* with the curl binary, for sites that block Python clients."""
+        check_deadline()
+        command = ['curl', '-L', '--silent', '--show-error', '--max-time', f"{cap_timeout(self.timeout):.0f}"]
+        if user_agent:
+            command += ['-A', user_agent]
+        max_bytes = self._byte_cap(url)
+        if max_bytes is not None:
+            command += ['--max-filesize', str(max_bytes)]
+        if self.limiter is None:
+            output = subprocess.check_output(command + [url])
+        else:
+            self.limiter.acquire(url)
+            started = time.monotonic()
+            try:
+                output = subprocess.check_output(command + [url])
+            except Exception:
+                self.limiter.release(url, time.monotonic() - started, failed=True)
+                raise
+            self.limiter.release(url, time.monotonic() - started)
+        self.stats.add(len(output))
+        return output
+
+    def map(self, func, items, max_workers=None):
+        """Return [func(item) for item in items], running the calls concurrently.
+
+        Meant for enrichment fan-out, where each call fetches a page. Without
+        *max_workers* the width is the limiter's ceiling (sequential when
+        there is no limiter); the limiter then keeps each host's requests in
+        flight at its learned limit. Worker threads run in the caller's
+        context, so their log output stays with the calling source.
+        """
+        items = list(items)
+        if max_workers is None:
+            max_workers = self.limiter.maximum if self.limiter is not None else 1
+        if max_workers <= 1 or len(items) <= 1:
+            return [func(item) for item in items]
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as pool:
+            futures = [
+                pool.submit(contextvars.copy_context().run, func, item)
+                for item in items
+            ]
+            return [future.result() for future in futures]
+
+    def fetch_many(self, urls, max_workers=4, **kwargs):
+        """GET every URL concurrently, returning responses in the same order.
+
+        A failed request yields its exception in place of the response, so
+        one bad URL doesn't lose the others.
+        """
+        def fetch(url):
+            try:
+                return self.get(url, **kwargs)
+            except Exception as e:
+                return e
+
+        return self.map(fetch, urls, max_workers=max_workers)
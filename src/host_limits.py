@@ -0,0 +1,227 @@
+import os
+import json
+import time
+import asyncio
+import threading
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlsplit
+from src.utils import get_host_key
+
+DEFAULT_LIMITS_PATH = os.path.join('cache', 'host_limits.json')
+
+def _host(url):
+    return urlsplit(url or '').netloc.lower()
+
+class _HostState:
+    def __init__(self, limit, latency=None):
+        self.limit = limit
+        self.latency = latency  # EWMA of successful request latency, in seconds
+        self.active = 0
+        self.last_decrease = 0.0
+
+class AdaptiveHostLimiter:
+    """AIMD controller for the number of requests in flight per host.
+
+    Each host starts at the limit learned on the previous run (or
+    *initial*). Healthy responses raise the limit additively, by about one
+    slot per *limit* successes; a 429, a 5xx, a connection error or a
+    response slower than *latency_factor* times the host's usual latency
+    cuts it by *decrease*, at most once per *cooldown* seconds so a single
+    burst of failures counts once. Responses faster than *spike_floor*
+    seconds never count as latency spikes.
+    """
+    def __init__(
+        self,
+        initial=4,
+        minimum=1,
+        maximum=16,
+        decrease=0.5,
+        latency_factor=3.0,
+        cooldown=1.0,
+        spike_floor=1.0,
+    ):
+        self.initial = initial
+        self.minimum = minimum
+        self.maximum = maximum
+        self.decrease = decrease
+        self.latency_factor = latency_factor
+        self.cooldown = cooldown
+        self.spike_floor = spike_floor
+        self._hosts = {}
+        self._decreases = 0
+        self._condition = threading.Condition()
+
+    def _state(self, host):
+        state = self._hosts.get(host)
+        if state is None:
+            state = self._hosts[host] = _HostState(float(self.initial))
+        return state
+
+    def try_acquire(self, url):
+        host = _host(url)
+        with self._condition:
+            state = self._state(host)
+            if state.active < int(state.limit):
+                state.active += 1
+                return True
+            return False
+
+    def acquire(self, url):
+        """Block until a request slot for *url*'s host is free."""
+        host = _host(url)
+        with self._condition:
+            state = self._state(host)
+            while state.active >= int(state.limit):
+                self._condition.wait()
+            state.active += 1
+
+    async def aacquire(self, url, poll_interval=0.05):
+        """acquire() for the event loop; polls instead of blocking a thread."""
+        while not self.try_acquire(url):
+            await asyncio.sleep(poll_interval)
+
+    def release(self, url, latency, status=None, failed=False, aborted=False):
+        """Free the slot and adjust the host's limit from the outcome.
+
+        An *aborted* request, one we gave up ourselves (say, a body past the
+        byte cap), tells nothing about the host: only its slot is freed.
+        """
+        host = _host(url)
+        with self._condition:
+            state = self._state(host)
+            state.active = max(state.active - 1, 0)
+            if aborted:
+                self._condition.notify_all()
+                return
+
+            slow = (
+                state.latency is not None
+                and latency > max(self.latency_factor * state.latency, self.spike_floor)
+            )
+            overloaded = failed or status == 429 or (status is not None and status >= 500)
+            if overloaded or slow:
+                now = time.monotonic()
+                if now - state.last_decrease >= self.cooldown:
+                    state.limit = max(float(self.minimum), state.limit * self.decrease)
+                    state.last_decrease = now
+                    self._decreases += 1
+            else:
+                state.limit = min(float(self.maximum), state.limit + 1.0 / state.limit)
+
+            if not overloaded:
+                state.latency = latency if state.latency is None else 0.8 * state.latency + 0.2 * latency
+            self._condition.notify_all()
+
+    def load(self, path=DEFAULT_LIMITS_PATH):
+        """Start from the limits learned on the previous run."""
+        if not os.path.exists(path):
+            return
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"⚠️  Limites por host ignorados ({path}): {str(e)}")
+            return
+        with self._condition:
+            for host, saved in data.items():
+                limit = min(max(float(saved.get('limit', self.initial)), self.minimum), self.maximum)
+                self._hosts[host] = _HostState(limit, saved.get('latency'))
+
+    def save(self, path=DEFAULT_LIMITS_PATH):
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        with self._condition:
+            data = {
+                host: {'limit': round(state.limit, 2), 'latency': state.latency}
+                for host, state in sorted(self._hosts.items())
+            }
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2)
+
+    def stats(self):
+        with self._condition:
+            limits = [int(state.limit) for state in self._hosts.values()]
+            return {
+                'hosts': len(limits),
+                'min_limit': min(limits) if limits else 0,
+                'max_limit': max(limits) if limits else 0,
+                'decreases': self._decreases,
+            }
+
+def parse_retry_after(value):
+    """Seconds to wait from a Retry-After header (delta-seconds or HTTP-date)."""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(retry_at.timestamp() - time.time(), 0.0)
+
+class HostThrottle:
+    """Pause shared by every request to a publisher domain after backpressure.
+
+    A 429 or 503 from any source pauses the whole domain (see get_host_key)
+    until the moment its Retry-After allows, or for an exponentially growing
+    default delay when the header is missing. Requests wait out the pause
+    before being sent instead of piling more load on the host.
+    """
+    BACKPRESSURE_STATUSES = (429, 503)
+
+    def __init__(self, default_delay=10.0, max_delay=300.0):
+        self.default_delay = default_delay
+        self.max_delay = max_delay
+        self._blocked_until = {}
+        self._strikes = {}
+        self._stats = {'throttled': 0, 'waited': 0.0}
+        self._lock = threading.Lock()
+
+    def delay(self, url):
+        """Seconds until requests to *url*'s domain are allowed again."""
+        with self._lock:
+            blocked_until = self._blocked_until.get(get_host_key(url), 0.0)
+        return max(blocked_until - time.monotonic(), 0.0)
+
+    def wait(self, url):
+        delay = self.delay(url)
+        if delay > 0:
+            with self._lock:
+                self._stats['waited'] += delay
+            time.sleep(delay)
+
+    async def await_ready(self, url):
+        delay = self.delay(url)
+        if delay > 0:
+            with self._lock:
+                self._stats['waited'] += delay
+            await asyncio.sleep(delay)
+
+    def observe(self, url, status, headers=None):
+        """Record a response; returns True when it was backpressure."""
+        host = get_host_key(url)
+        if status not in self.BACKPRESSURE_STATUSES:
+            if status is not None and status < 400:
+                with self._lock:
+                    self._strikes.pop(host, None)
+            return False
+
+        retry_after = parse_retry_after((headers or {}).get('Retry-After'))
+        with self._lock:
+            strikes = self._strikes.get(host, 0)
+            if retry_after is None:
+                retry_after = self.default_delay * (2 ** strikes)
+            self._strikes[host] = strikes + 1
+            until = time.monotonic() + min(retry_after, self.max_delay)
+            self._blocked_until[host] = max(self._blocked_until.get(host, 0.0), until)
+            self._stats['throttled'] += 1
+        print(f"   🚦 {host} pediu pausa (HTTP {status}): {min(retry_after, self.max_delay):.0f}s")
+        return True
+
+    def stats(self):
+        with self._lock:
+            return dict(self._stats, hosts=len(self._blocked_until))
+
+host_limiter = AdaptiveHostLimiter()
+host_throttle = HostThrottle()
@@ -0,0 +1,147 @@
+import time
+import threading
+import requests
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+from src.retry import retry_policy
+
+def _to_requests_response(response):
+    """Convert an httpx.Response into the requests.Response the scrapers expect."""
+    converted = requests.Response()
+    converted.status_code = response.status_code
+    converted._content = response.content
+    converted.headers = CaseInsensitiveDict(response.headers.items())
+    converted.url = str(response.url)
+    converted.reason = response.reason_phrase
+    converted.encoding = get_encoding_from_headers(converted.headers)
+    converted.elapsed = response.elapsed
+    converted.history = [_to_requests_response(hop) for hop in response.history]
+    # The body is already read, so iter_content() serves it from memory
+    converted._content_consumed = True
+    return converted
+
+def _httpx_timeout(timeout):
+    import httpx
+
+    if isinstance(timeout, tuple):
+        connect, read = timeout
+        return httpx.Timeout(read, connect=connect)
+    return httpx.Timeout(timeout)
+
+class Http2Session:
+    """requests.Session look-alike over one multiplexed httpx client.
+
+    SessionRegistry uses it for the domains in the http2_hosts setting, so
+    a publisher's article fetches share one HTTP/2 connection instead of
+    one pooled HTTP/1.1 connection each. HTTP/2 is negotiated per
+    connection (ALPN), so a server without it gets HTTP/1.1 from the same
+    client; *http1* = False forces HTTP/2 with prior knowledge, which is
+    what a cleartext test server needs.
+
+    Responses come back as requests.Response and failures as requests
+    exceptions. Retries follow the requests path's policy: connection
+    errors, timeouts and *status_forcelist* on idempotent methods, within
+    retry_policy's budgets. Cookies live in *cookies* (an
+    http.cookiejar.CookieJar) when given. Needs the optional httpx[http2]
+    package.
+    """
+    def __init__(
+        self,
+        retries=3,
+        backoff_factor=0.3,
+        status_forcelist=(500, 502, 504),
+        max_connections=10,
+        http1=True,
+        cookies=None,
+    ):
+        import httpx
+
+        self.retries = retries
+        self.backoff_factor = backoff_factor
+        self.status_forcelist = status_forcelist
+        self._client = httpx.Client(
+            http1=http1,
+            http2=True,
+            limits=httpx.Limits(max_connections=max_connections),
+            cookies=cookies,
+        )
+        self._lock = threading.Lock()
+        self.requests_made = 0
+        self.http2_requests = 0
+
+    def _count(self, response):
+        with self._lock:
+            self.requests_made += 1
+            if response.http_version == 'HTTP/2':
+                self.http2_requests += 1
+
+    def request(
+        self,
+        method,
+        url,
+        params=None,
+        data=None,
+        json=None,
+        headers=None,
+        cookies=None,
+        timeout=None,
+        allow_redirects=True,
+        stream=False,
+        **kwargs,
+    ):
+        """Send a request; *stream* is accepted for compatibility, the body is read in full.
+
+        Fetcher's byte cap therefore applies to HTTP/2 responses only once
+        they are fully downloaded, and stream=True saves no download.
+        """
+        import httpx
+
+        if kwargs:
+            raise TypeError(f"Opções não suportadas no transporte HTTP/2: {', '.join(kwargs)}")
+
+        content = None
+        if isinstance(data, (str, bytes)):
+            content, data = data, None
+        retry_on_status = method.upper() in ('GET', 'HEAD', 'OPTIONS')
+
+        for attempt in range(self.retries + 1):
+            try:
+                response = self._client.request(
+                    method,
+                    url,
+                    params=params,
+                    content=content,
+                    data=data,
+                    json=json,
+                    headers=headers,
+                    cookies=cookies,
+                    timeout=_httpx_timeout(timeout),
+                    follow_redirects=allow_redirects,
+                )
+            except httpx.TimeoutException as e:
+                if attempt >= self.retries or not retry_policy.allow():
+                    raise requests.exceptions.Timeout(f"Timeout ao acessar {url}") from e
+            except httpx.TransportError as e:
+                if attempt >= self.retries or not retry_policy.allow():
+                    raise requests.exceptions.ConnectionError(str(e)) from e
+            except httpx.HTTPError as e:
+                # Too many redirects, undecodable body...: not worth retrying
+                raise requests.exceptions.RequestException(str(e)) from e
+            else:
+                self._count(response)
+                retry = retry_on_status and response.status_code in self.status_forcelist
+                if not retry or attempt >= self.retries or not retry_policy.allow():
+                    return _to_requests_response(response)
+            delay = retry_policy.backoff(attempt, self.backoff_factor) if attempt >= 1 else 0
+            retry_policy.record_wait(delay)
+            time.sleep(delay)
+
+    def get(self, url, **kwargs):
+        kwargs.setdefault('allow_redirects', True)
+        return self.request('GET', url, **kwargs)
+
+    def post(self, url, data=None, json=None, **kwargs):
+        return self.request('POST', url, data=data, json=json, **kwargs)
+
+    def close(self):
+        self._client.close()
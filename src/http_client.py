@@ -0,0 +1,259 @@
+import threading
+import requests
+from collections import Counter
+from requests.adapters import HTTPAdapter
+from urllib.parse import urlsplit
+from src.retry import BudgetedRetry
+from src.cookies import cookie_store as default_cookie_store
+from src.utils import get_host_key
+
+DEFAULT_RETRIES = 3
+DEFAULT_BACKOFF_FACTOR = 0.3
+DEFAULT_STATUS_FORCELIST = (500, 502, 504)
+
+def _build_retry(retries, backoff_factor, status_forcelist):
+    # Retries spend the run's retry budgets and back off with jitter
+    return BudgetedRetry(
+        total=retries,
+        read=retries,
+        connect=retries,
+        backoff_factor=backoff_factor,
+        status_forcelist=status_forcelist,
+        # 429/503 + Retry-After surface to the caller, so HostThrottle can
+        # pause the whole domain instead of one thread sleeping on its own
+        respect_retry_after_header=False,
+    )
+
+class SessionRegistry:
+    """Thread-safe, process-wide registry of pooled sessions, one per host.
+
+    Every request to a host goes through the same requests.Session, so its
+    keep-alive connections are reused by all scrapers during a run instead
+    of paying a new TCP/TLS handshake per call. Sessions use the same retry
+    policy as requests_retry_session().
+
+    Hosts whose publisher domain (see get_host_key) is in *http2_hosts* get
+    an Http2Session instead, multiplexing their requests over HTTP/2 when
+    the server supports it.
+
+    Sessions of a domain persisted by *cookie_store* (see CookieStore) use
+    its jar, so cookies set by consent and login hops on a previous run
+    are sent from the first request. Redirects followed are counted per
+    domain.
+    """
+    def __init__(self, pool_connections=10, pool_maxsize=10, http2_hosts=(), cookie_store=None):
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.http2_hosts = set(http2_hosts)
+        self.cookie_store = cookie_store or default_cookie_store
+        self._lock = threading.Lock()
+        self._sessions = {}
+        self._adapters = []
+        self._http2_sessions = []
+        self._redirects = Counter()
+
+    def configure(self, pool_connections=None, pool_maxsize=None, http2_hosts=None):
+        """Change pool sizes and HTTP/2 hosts; applies to sessions created afterwards."""
+        with self._lock:
+            if pool_connections is not None:
+                self.pool_connections = pool_connections
+            if pool_maxsize is not None:
+                self.pool_maxsize = pool_maxsize
+            if http2_hosts is not None:
+                self.http2_hosts = set(http2_hosts)
+
+    def _http2_session(self, cookies=None):
+        """A new Http2Session, or None when httpx[http2] is not installed."""
+        try:
+            from src.http2_client import Http2Session
+            session = Http2Session(max_connections=self.pool_maxsize, cookies=cookies)
+        except ImportError:
+            print("⚠️  httpx[http2] não instalado; usando HTTP/1.1 para todos os hosts")
+            self.http2_hosts = set()
+            return None
+        self._http2_sessions.append(session)
+        return session
+
+    def session_for(self, url):
+        parts = urlsplit(url)
+        key = (parts.scheme.lower(), parts.netloc.lower())
+        with self._lock:
+            session = self._sessions.get(key)
+            if session is not None:
+                return session
+            jar = self.cookie_store.jar_for(url)
+            if get_host_key(url) in self.http2_hosts:
+                session = self._http2_session(cookies=jar)
+                if session is not None:
+                    self._sessions[key] = session
+            if session is None:
+                session = requests.Session()
+                if jar is not None:
+                    session.cookies = jar
+                adapter = HTTPAdapter(
+                    pool_connections=self.pool_connections,
+                    pool_maxsize=self.pool_maxsize,
+                    max_retries=_build_retry(
+                        DEFAULT_RETRIES,
+                        DEFAULT_BACKOFF_FACTOR,
+                        DEFAULT_STATUS_FORCELIST,
+                    ),
+                )
+                session.mount('http://', adapter)
+                session.mount('https://', adapter)
+                self._sessions[key] = session
+                self._adapters.append(adapter)
+            return session
+
+    def record_redirects(self, url, hops):
+        if hops:
+            with self._lock:
+                self._redirects[get_host_key(url)] += hops
+
+    def stats(self):
+        """Return request, connection, connection-reuse and redirect counts so far."""
+        requests_made = 0
+        connections = 0
+        with self._lock:
+            for adapter in self._adapters:
+                pools = adapter.poolmanager.pools
+                for key in pools.keys():
+                    pool = pools.get(key)
+                    if pool is None:
+                        continue
+                    requests_made += pool.num_requests
+                    connections += pool.num_connections
+            # httpx doesn't count connections; its requests are reported apart
+            http2_client_requests = sum(session.requests_made for session in self._http2_sessions)
+            http2_requests = sum(session.http2_requests for session in self._http2_sessions)
+            hosts = len(self._sessions)
+            redirects = dict(self._redirects)
+        return {
+            'hosts': hosts,
+            'requests': requests_made + http2_client_requests,
+            'connections': connections,
+            'reused': max(requests_made - connections, 0),
+            'http2_requests': http2_requests,
+            'redirects': redirects,
+        }
+
+    def close(self):
+        with self._lock:
+            for session in self._sessions.values():
+                session.close()
+            self._sessions.clear()
+            self._adapters.clear()
+            self._http2_sessions.clear()
+
+_registry = SessionRegistry()
+
+class PooledSession:
+    """requests.Session look-alike that routes each call to its host's pooled session."""
+    def __init__(self, registry=None):
+        self._registry = registry or _registry
+
+    def request(self, method, url, **kwargs):
+        response = self._registry.session_for(url).request(method, url, **kwargs)
+        self._registry.record_redirects(url, len(response.history))
+        return response
+
+    def get(self, url, **kwargs):
+        kwargs.setdefault('allow_redirects', True)
+        return self.request('GET', url, **kwargs)
+
+    def head(self, url, **kwargs):
+        kwargs.setdefault('allow_redirects', False)
+        return self.request('HEAD', url, **kwargs)
+
+    def post(self, url, data=None, json=None, **kwargs):
+        return self.request('POST', url, data=data, json=json, **kwargs)
+
+def requests_retry_session(
+    retries=DEFAULT_RETRIES,
+    backoff_factor=DEFAULT_BACKOFF_FACTOR,
+    status_forcelist=DEFAULT_STATUS_FORCELIST,
+    session=None,
+    timeout=30,  # Aumentado o timeout padrão
+):
+    """Configure requests session with retry capabilities.
+
+    With the default policy and no explicit *session*, returns a
+    PooledSession backed by the shared registry, so connections are reused
+    across calls. A custom policy or session gets its own adapter.
+    """
+    if (session is None
+            and retries == DEFAULT_RETRIES
+            and backoff_factor == DEFAULT_BACKOFF_FACTOR
+            and tuple(status_forcelist) == DEFAULT_STATUS_FORCELIST):
+        return PooledSession()
+
+    session = session or requests.Session()
+    adapter = HTTPAdapter(max_retries=_build_retry(retries, backoff_factor, status_forcelist))
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+def configure_http_pool(pool_connections=None, pool_maxsize=None, http2_hosts=None):
+    """Set the pool sizes and HTTP/2 domains of the shared session registry."""
+    _registry.configure(
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        http2_hosts=http2_hosts,
+    )
+
+def http_pool_stats():
+    return _registry.stats()
+
+class NotModified(Exception):
+    """Raised when a conditional GET is answered with 304 Not Modified."""
+    def __init__(self, url):
+        super().__init__(f"Não modificado desde a última execução: {url}")
+        self.url = url
+
+def _conditional_headers(url, validators, headers):
+    headers = dict(headers or {})
+    stored = validators.get(url) if validators is not None else None
+    if stored:
+        if stored.get('etag'):
+            headers['If-None-Match'] = stored['etag']
+        if stored.get('last_modified'):
+            headers['If-Modified-Since'] = stored['last_modified']
+    return headers
+
+def _handle_conditional_response(url, validators, response):
+    if response.status_code == 304:
+        raise NotModified(url)
+    response.raise_for_status()
+    if validators is not None:
+        fresh = {}
+        if response.headers.get('ETag'):
+            fresh['etag'] = response.headers['ETag']
+        if response.headers.get('Last-Modified'):
+            fresh['last_modified'] = response.headers['Last-Modified']
+        if fresh:
+            validators[url] = fresh
+        else:
+            validators.pop(url, None)
+    return response
+
+def conditional_get(session, url, validators, **kwargs):
+    """GET *url* with the ETag/Last-Modified validators stored for it.
+
+    *validators* maps URL -> {'etag': ..., 'last_modified': ...} and is
+    updated with the validators of the new response; None sends a plain
+    GET. Raises NotModified on a 304 and HTTPError on other error statuses.
+    """
+    headers = _conditional_headers(url, validators, kwargs.pop('headers', None))
+    response = session.get(url, headers=headers, **kwargs)
+    try:
+        return _handle_conditional_response(url, validators, response)
+    except Exception:
+        # Nobody will read a streamed body
+        response.close()
+        raise
+
+async def aconditional_get(session, url, validators, **kwargs):
+    """conditional_get() for an AsyncRetrySession."""
+    headers = _conditional_headers(url, validators, kwargs.pop('headers', None))
+    response = await session.get(url, headers=headers, **kwargs)
+    return _handle_conditional_response(url, validators, response)
@@ -0,0 +1,71 @@
+import io
+import asyncio
+import contextlib
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+# Process pool for the CPU-bound parse stage; None means parse inline
+_parse_pool = None
+
+def start_parse_pool(workers, initializer=None, initargs=()):
+    """Start the process pool used by parse_in_pool() (0 keeps parsing inline).
+
+    Uses the spawn start method: the pool is created by a process that also
+    runs HTTP threads, and forking a multi-threaded process is unsafe. So
+    workers start from a fresh interpreter; *initializer*(*initargs), if
+    given, runs in each one to set it up like the parent.
+    """
+    global _parse_pool
+    if workers and workers > 0:
+        _parse_pool = ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context('spawn'),
+            initializer=initializer,
+            initargs=initargs,
+        )
+    return _parse_pool
+
+def shutdown_parse_pool():
+    global _parse_pool
+    if _parse_pool is not None:
+        _parse_pool.shutdown()
+        _parse_pool = None
+
+def _run_captured(func, args):
+    """Run func(*args) in a worker, returning its result, error and output.
+
+    Messages printed by a worker are sent back to the parent so they end up
+    in the calling source's log instead of the worker's stdout.
+    """
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        try:
+            return func(*args), None, output.getvalue()
+        except Exception as e:
+            return None, e, output.getvalue()
+
+def _unpack(outcome):
+    result, error, output = outcome
+    if output:
+        print(output, end='')
+    if error is not None:
+        raise error
+    return result
+
+def parse_in_pool(func, *args):
+    """Run a CPU-bound parse function in the process pool.
+
+    *func* and *args* must be picklable: module-level functions, static or
+    class methods, or methods of a scraper instance, given the downloaded
+    bytes rather than soups or responses. Without a pool the call runs
+    inline, so scrapers behave the same either way.
+    """
+    if _parse_pool is None:
+        return func(*args)
+    return _unpack(_parse_pool.submit(_run_captured, func, args).result())
+
+async def aparse_in_pool(func, *args):
+    """Awaitable parse_in_pool() for scrapers running on the event loop."""
+    if _parse_pool is None:
+        return await asyncio.to_thread(func, *args)
+    return _unpack(await asyncio.wrap_future(_parse_pool.submit(_run_captured, func, args)))
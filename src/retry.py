@@ -0,0 +1,116 @@
+import time
+import random
+import threading
+import contextvars
+import requests
+from urllib3.util.retry import Retry
+from src.deadline import expired
+
+# HTTP statuses that another attempt will not fix
+PERMANENT_STATUSES = (401, 404, 410)
+
+# Name of the source whose retry budget the current request draws from
+_current_source = contextvars.ContextVar('retry_source', default=None)
+
+class PermanentError(Exception):
+    """A failure that retrying cannot fix, such as a login wall."""
+
+def is_permanent(exc):
+    """Whether *exc* should fail fast instead of being retried.
+
+    That covers PermanentError, HTTP 401/404/410 and parse errors (a
+    ValueError, KeyError... raised on a page we did get), since the next
+    attempt would fetch and parse the same bytes.
+    """
+    if isinstance(exc, PermanentError):
+        return True
+    if isinstance(exc, requests.exceptions.HTTPError):
+        return exc.response is not None and exc.response.status_code in PERMANENT_STATUSES
+    return isinstance(exc, (ValueError, KeyError, IndexError, AttributeError, TypeError))
+
+class RetryPolicy:
+    """The run's single retry policy.
+
+    Every retry, whether of a request (urllib3, AsyncRetrySession, a
+    throttled 429/503) or of a whole source, must be allowed by allow(),
+    which draws from the current source's budget and from the run's
+    budget. Once either is spent, or the source's deadline (see
+    src/deadline.py) has passed, failures are final. backoff() gives the
+    jittered exponential delay every layer sleeps between attempts.
+    """
+    def __init__(self, per_source=6, per_run=60, base_delay=5.0, max_delay=60.0):
+        self._lock = threading.Lock()
+        self.configure(per_source, per_run, base_delay, max_delay)
+
+    def configure(self, per_source=6, per_run=60, base_delay=5.0, max_delay=60.0):
+        with self._lock:
+            self.per_source = per_source
+            self.per_run = per_run
+            self.base_delay = base_delay
+            self.max_delay = max_delay
+            self._run_left = per_run
+            self._source_left = {}
+            self._stats = {'retries': 0, 'denied': 0, 'fast_failed': 0, 'retry_time': 0.0}
+
+    def bind_source(self, name):
+        """Charge retries made in the current context to source *name*."""
+        return _current_source.set(name)
+
+    def unbind_source(self, token):
+        _current_source.reset(token)
+
+    def allow(self):
+        """Spend one retry from the budgets; False when either is exhausted."""
+        source = _current_source.get()
+        with self._lock:
+            source_left = self._source_left.get(source, self.per_source)
+            if (self._run_left <= 0
+                    or (source is not None and source_left <= 0)
+                    or expired()):
+                self._stats['denied'] += 1
+                return False
+            self._run_left -= 1
+            if source is not None:
+                self._source_left[source] = source_left - 1
+            self._stats['retries'] += 1
+            return True
+
+    def backoff(self, attempt, base_delay=None):
+        """Delay before retry number *attempt* + 1: exponential, with equal jitter."""
+        base_delay = self.base_delay if base_delay is None else base_delay
+        delay = min(self.max_delay, base_delay * (2 ** attempt))
+        return delay / 2 + random.uniform(0, delay / 2)
+
+    def record_wait(self, seconds):
+        with self._lock:
+            self._stats['retry_time'] += seconds
+
+    def record_fast_fail(self):
+        with self._lock:
+            self._stats['fast_failed'] += 1
+
+    def stats(self):
+        with self._lock:
+            return dict(self._stats)
+
+retry_policy = RetryPolicy()
+
+class BudgetedRetry(Retry):
+    """urllib3 Retry that spends retry_policy's budgets and backs off with jitter."""
+    def increment(self, *args, **kwargs):
+        new_retry = super().increment(*args, **kwargs)
+        if not retry_policy.allow():
+            # Out of budget: fail the way urllib3 does when retries run out
+            return self.new(total=0).increment(*args, **kwargs)
+        return new_retry
+
+    def get_backoff_time(self):
+        consecutive_errors = len(self.history)
+        if consecutive_errors <= 1:
+            return 0
+        return retry_policy.backoff(consecutive_errors - 1, self.backoff_factor)
+
+    def sleep(self, response=None):
+        started = time.monotonic()
+        super().sleep(response)
+        retry_policy.record_wait(time.monotonic() - started)
@@ -0,0 +1,205 @@
+import io
+import sys
+import time
+import asyncio
+import threading
+import contextvars
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from src.utils import get_host_key
+
+# Per-source log buffer; set while a source is being processed concurrently
+_log_buffer = contextvars.ContextVar('source_log_buffer', default=None)
+_output_lock = threading.Lock()
+
+class _SourceLogRouter:
+    """Route print() output to the current source's buffer when there is one.
+
+    Sources run in parallel, so their messages would otherwise interleave.
+    Each source's output is written out as one block when it finishes.
+    """
+    def __init__(self, stream):
+        self._stream = stream
+
+    def write(self, text):
+        buffer = _log_buffer.get()
+        if buffer is not None:
+            return buffer.write(text)
+        with _output_lock:
+            return self._stream.write(text)
+
+    def flush(self):
+        if _log_buffer.get() is None:
+            self._stream.flush()
+
+    def __getattr__(self, name):
+        return getattr(self._stream, name)
+
+def _run_with_log_buffer(process, source, attempt, stream):
+    """Call process(source, attempt), writing everything it prints to stream as one block."""
+    buffer = io.StringIO()
+    token = _log_buffer.set(buffer)
+    try:
+        return process(source, attempt)
+    finally:
+        _log_buffer.reset(token)
+        with _output_lock:
+            stream.write(buffer.getvalue())
+            stream.flush()
+
+def _host_delay(throttle, source):
+    return throttle.delay(source['url']) if throttle is not None else 0.0
+
+def run_sources(sources, process, max_workers=1, max_per_host=1, throttle=None):
+    """Run every source and return the results in order.
+
+    *process* is called as process(source, attempt), starting at attempt 0.
+    A result holding 'retry_in' asks for another attempt that many seconds
+    later: the source is put back in the queue instead of sleeping in its
+    worker, which meanwhile runs sources on other hosts.
+
+    Sources run in a pool of max_workers threads. At most max_per_host
+    sources sharing a publisher domain (see get_host_key) run at the same
+    time, so a burst of Folha or LinkedIn sources never monopolizes the pool
+    while sources on other hosts wait. No source is started on a domain the
+    *throttle* (see HostThrottle) has paused.
+    """
+    pending = {}
+    for index, source in enumerate(sources):
+        pending.setdefault(get_host_key(source['url']), deque()).append((0.0, index, source, 0))
+
+    results = [None] * len(sources)
+    active = {}
+    running = {}
+
+    def pop_ready(host, now):
+        """Next (index, source, attempt) of host that may start now, if any."""
+        if active.get(host, 0) >= max_per_host:
+            return None
+        queue = pending[host]
+        for position, (ready_at, index, source, attempt) in enumerate(queue):
+            if ready_at <= now and _host_delay(throttle, source) <= 0:
+                del queue[position]
+                if not queue:
+                    del pending[host]
+                return index, source, attempt
+        return None
+
+    def next_ready_in(now):
+        """Seconds until some pending source may start, or None if blocked by slots."""
+        waits = [
+            max(ready_at - now, _host_delay(throttle, source))
+            for host, queue in pending.items()
+            if active.get(host, 0) < max_per_host
+            for ready_at, _, source, _ in queue
+        ]
+        return max(min(waits), 0.0) if waits else None
+
+    original_stdout = sys.stdout
+    sys.stdout = _SourceLogRouter(original_stdout)
+    try:
+        with ThreadPoolExecutor(max_workers=max(max_workers, 1)) as pool:
+            while pending or running:
+                # Fill free worker slots round-robin across hosts
+                launched = True
+                while launched and len(running) < max(max_workers, 1):
+                    launched = False
+                    now = time.monotonic()
+                    for host in list(pending):
+                        if len(running) >= max(max_workers, 1):
+                            break
+                        entry = pop_ready(host, now)
+                        if entry is None:
+                            continue
+                        index, source, attempt = entry
+                        future = pool.submit(
+                            _run_with_log_buffer, process, source, attempt, original_stdout,
+                        )
+                        running[future] = (index, host, source, attempt)
+                        active[host] = active.get(host, 0) + 1
+                        launched = True
+
+                timeout = next_ready_in(time.monotonic())
+                if not running:
+                    time.sleep(timeout or 0)
+                    continue
+                done, _ = wait(running, timeout=timeout, return_when=FIRST_COMPLETED)
+                for future in done:
+                    index, host, source, attempt = running.pop(future)
+                    active[host] -= 1
+                    result = future.result()
+                    retry_in = result.pop('retry_in', None)
+                    if retry_in is None:
+                        results[index] = result
+                    else:
+                        pending.setdefault(host, deque()).append(
+                            (time.monotonic() + retry_in, index, source, attempt + 1)
+                        )
+    finally:
+        sys.stdout = original_stdout
+
+    return results
+
+def run_sources_async(
+    sources,
+    process,
+    max_workers=1,
+    max_per_host=1,
+    limiter=None,
+    throttle=None,
+    session_options=None,
+):
+    """Asyncio counterpart of run_sources().
+
+    *process* is a coroutine function called as process(source, session,
+    attempt), where session is one AsyncRetrySession shared by the whole
+    run and gated by *limiter* and *throttle*, if given; *session_options*
+    are further AsyncRetrySession arguments (e.g. byte caps). A result holding
+    'retry_in' is retried after that many seconds, waiting without holding
+    any slot. All sources are driven from a single event loop; max_workers
+    and max_per_host bound how many sources are in flight overall and per
+    publisher domain.
+    """
+    from src.async_http import AsyncRetrySession
+
+    async def run_all():
+        slots = asyncio.Semaphore(max(max_workers, 1))
+        host_slots = {}
+        for source in sources:
+            host_slots.setdefault(get_host_key(source['url']), asyncio.Semaphore(max_per_host))
+
+        async with AsyncRetrySession(limiter=limiter, throttle=throttle, **(session_options or {})) as session:
+            async def run_attempt(source, attempt):
+                async with host_slots[get_host_key(source['url'])], slots:
+                    # Each task runs in its own context copy, and asyncio.to_thread
+                    # propagates it, so adapted blocking scrapers log here too.
+                    buffer = io.StringIO()
+                    _log_buffer.set(buffer)
+                    try:
+                        return await process(source, session, attempt)
+                    finally:
+                        _log_buffer.set(None)
+                        with _output_lock:
+                            original_stdout.write(buffer.getvalue())
+                            original_stdout.flush()
+
+            async def run_one(source):
+                attempt = 0
+                while True:
+                    if throttle is not None:
+                        await throttle.await_ready(source['url'])
+                    result = await run_attempt(source, attempt)
+                    retry_in = result.pop('retry_in', None)
+                    if retry_in is None:
+                        return result
+                    await asyncio.sleep(retry_in)
+                    attempt += 1
+
+            return await asyncio.gather(*(run_one(source) for source in sources))
+
+    original_stdout = sys.stdout
+    sys.stdout = _SourceLogRouter(original_stdout)
+    try:
+        return asyncio.run(run_all())
+    finally:
+        sys.stdout = original_stdout
@@ -1,53 +1,136 @@
 import re
 import json
+import asyncio
+import hashlib
 import requests
-from requests.adapters import HTTPAdapter
-from urllib3.util.retry import Retry
-from bs4 import BeautifulSoup, Comment
+from bs4 import Comment
 import datetime
 import pytz
 import xml.etree.ElementTree as ET
 from email.utils import parsedate_to_datetime
 from html import escape as html_escape
-from urllib.parse import parse_qs, urljoin, unquote, urlparse
-
-def requests_retry_session(
-    retries=3,
-    backoff_factor=0.3,
-    status_forcelist=(500, 502, 504),
-    session=None,
-    timeout=30,  # Aumentado o timeout padrão
-):
-    """Configure requests session with retry capabilities."""
-    session = session or requests.Session()
-    retry = Retry(
-        total=retries,
-        read=retries,
-        connect=retries,
-        backoff_factor=backoff_factor,
-        status_forcelist=status_forcelist,
-    )
-    adapter = HTTPAdapter(max_retries=retry)
-    session.mount('http://', adapter)
-    session.mount('https://', adapter)
-    return session
+from urllib.parse import urljoin
+from src.http_client import aconditional_get, NotModified
+from src.fetcher import Fetcher
+from src.retry import PermanentError
+from src.parsing import parse_in_pool, aparse_in_pool
+from src.dom import make_soup, parse_cards, select, select_one
+from src.feeds import feed_items, iter_feed_items
+from src.embedded_json import assigned_json, iter_json_after, json_after, ld_json, script_json
+from src.cache import enrichment_cache
+from src.urls import canonical_url, unwrap_redirect
+
+def _trafilatura_extract(html):
+    """Extract the main content of a page as HTML (parse stage helper)."""
+    import trafilatura
+
+    return trafilatura.extract(html, output_format='html', include_links=True)
 
 class BaseScraper:
-    """Base scraper class with common functionality."""
-    def __init__(self, url):
+    """Base scraper class with common functionality.
+
+    *validators* holds the ETag/Last-Modified values of the feed URLs this
+    scraper fetched on the previous run (see conditional_get). When set by
+    the caller, feed-backed scrapers send conditional requests and raise
+    NotModified if the source has not changed; it is None by default.
+
+    *fingerprint* works the same way one level up: it is seeded with the
+    digest of the listing entries seen on the previous run, and
+    check_listing() raises NotModified when the new listing matches it.
+
+    *published* indexes the articles of the feed written on the previous run
+    by canonical link (see utils.load_published_articles). Enriching
+    scrapers look listing items up there before fetching article pages, so
+    only links that are new since the last run cost a request. Links
+    missing there are then looked up in *article_index*, the run's
+    ArticleIndex, when the caller sets it with *source_name*, so an
+    article another source already enriched isn't enriched again. Articles
+    whose content a scraper did fetch are marked ``_enriched``; only those
+    are indexed.
+    """
+    def __init__(self, url, fetcher=None):
         self.url = url
+        self.fetcher = fetcher or Fetcher()
+        self.validators = None
+        self.fingerprint = None
+        self.published = {}
+        self.article_index = None
+        self.source_name = None
+
+    def __getstate__(self):
+        # Scrapers are pickled with the bound parse methods sent to the parse
+        # pool; workers never touch the network or the published feed.
+        state = dict(self.__dict__)
+        state['fetcher'] = None
+        state['published'] = {}
+        state['article_index'] = None
+        return state
+
+    def published_article(self, link):
+        """Return a copy of the article published for *link*, or None."""
+        if not link:
+            return None
+        previous = self.published.get(canonical_url(link))
+        if previous:
+            return dict(previous)
+        if self.article_index is not None:
+            return self.article_index.get(link, self.source_name)
+        return None
+
+    def fill_from_published(self, article):
+        """Fill a listing article with its published content; True if there was one."""
+        previous = self.published_article(article.get('link'))
+        if previous is None:
+            return False
+        article.update(
+            description=previous['description'],
+            author=previous['author'],
+            pubdate=previous['pubdate'],
+        )
+        return True
+
+    def check_listing(self, entries):
+        """Fingerprint the listing entries the feed is built from.
+
+        *entries* identify the listing items (links, titles, raw dates) and
+        must be JSON-serializable. Called before any article page is
+        fetched, so an unchanged source costs one request. The new digest is
+        left in self.fingerprint for the caller to store.
+        """
+        digest = hashlib.sha256(
+            json.dumps(list(entries), ensure_ascii=False, default=str).encode('utf-8')
+        ).hexdigest()
+        if self.fingerprint is not None and digest == self.fingerprint:
+            raise NotModified(self.url)
+        self.fingerprint = digest
+
+    @staticmethod
+    def _article_keys(articles):
+        """Listing entries of already parsed articles: link and title.
+
+        Parsed dates are left out because several scrapers fall back to the
+        current time (or resolve relative dates like "Há 2 horas").
+        """
+        return [[article['link'], article['title']] for article in articles]
 
     def get_latest_article(self):
         """Fetch and extract the latest article data."""
         try:
             # Aumentado o timeout para 30 segundos
-            response = requests_retry_session().get(self.url, timeout=30)
+            response = self.fetcher.get(self.url, timeout=30)
             response.raise_for_status()
-            soup = BeautifulSoup(response.content, 'html.parser', from_encoding='utf-8')
-            return self._extract_article_data(soup)
+            article = parse_in_pool(self._parse_page, response.content)
         except requests.exceptions.RequestException as e:
             print(f"Erro ao acessar {self.url}: {str(e)}")
             return None
+        if article:
+            self.check_listing([article['link'], article['title']])
+        return article
+
+    def _parse_page(self, content):
+        """Parse stage of get_latest_article(): build the soup and extract."""
+        soup = make_soup(content, from_encoding='utf-8')
+        return self._extract_article_data(soup)
 
     def get_articles(self, limit=10):
         """Return a list of articles (up to *limit*).
@@ -58,67 +141,38 @@ class BaseScraper:
         article = self.get_latest_article()
         return [article] if article else []
 
+    async def aget_articles(self, session, limit=None):
+        """Awaitable counterpart of get_articles().
+
+        *session* is the run's shared AsyncRetrySession. Scrapers that don't
+        override this are adapted by running their blocking get_articles() in
+        the default executor, so every registered scraper can be awaited.
+        """
+        if limit is None:
+            return await asyncio.to_thread(self.get_articles)
+        return await asyncio.to_thread(self.get_articles, limit)
+
     def _extract_article_data(self, soup):
         raise NotImplementedError("This method should be implemented by subclasses")
 
 class ExistingRssScraper(BaseScraper):
     """Scraper for existing RSS feeds (no scraping needed)."""
 
-    @staticmethod
-    def _find_elem(parent, *tags):
-        """Find the first matching element, avoiding the XML element bool() pitfall."""
-        for tag in tags:
-            elem = parent.find(tag)
-            if elem is not None:
-                return elem
-        return None
-
     def _parse_item(self, item):
-        """Parse a single RSS/Atom item element into an article dict."""
-        # Extract title
-        title_elem = self._find_elem(item, 'title', '{http://www.w3.org/2005/Atom}title')
-        title = title_elem.text if title_elem is not None and title_elem.text else 'Título não encontrado'
-
-        # Extract link
-        link_elem = self._find_elem(item, 'link', '{http://www.w3.org/2005/Atom}link')
-        if link_elem is not None:
-            link = link_elem.get('href', link_elem.text if link_elem.text else '')
-        else:
-            link = ''
-
-        # Extract description
-        desc_elem = self._find_elem(item,
-                    'description',
-                    '{http://purl.org/rss/1.0/modules/content/}encoded',
-                    '{http://www.w3.org/2005/Atom}summary',
-                    '{http://www.w3.org/2005/Atom}content')
-        description = desc_elem.text if desc_elem is not None and desc_elem.text else ''
-
-        # Extract author
-        author_elem = self._find_elem(item,
-                      'author',
-                      '{http://purl.org/dc/elements/1.1/}creator',
-                      '{http://www.w3.org/2005/Atom}author/{http://www.w3.org/2005/Atom}name')
-        author = author_elem.text if author_elem is not None and author_elem.text else 'Autor não encontrado'
-
-        # Extract publication date
+        """Parse a normalized RSS/Atom item (see src/feeds.py) into an article dict."""
         pubdate = None
-        date_elem = self._find_elem(item,
-                    'pubDate',
-                    '{http://purl.org/dc/elements/1.1/}date',
-                    '{http://www.w3.org/2005/Atom}published',
-                    '{http://www.w3.org/2005/Atom}updated')
+        date_text = item['published'] or item['updated']
 
-        if date_elem is not None and date_elem.text:
+        if date_text:
             try:
-                pubdate = parsedate_to_datetime(date_elem.text)
+                pubdate = parsedate_to_datetime(date_text)
                 if pubdate.tzinfo is None:
                     pubdate = pubdate.replace(tzinfo=pytz.UTC)
                 else:
                     pubdate = pubdate.astimezone(pytz.UTC)
             except Exception:
                 try:
-                    pubdate = datetime.datetime.fromisoformat(date_elem.text.replace('Z', '+00:00'))
+                    pubdate = datetime.datetime.fromisoformat(date_text.replace('Z', '+00:00'))
                     if pubdate.tzinfo is None:
                         pubdate = pubdate.replace(tzinfo=pytz.UTC)
                     else:
@@ -130,29 +184,41 @@ class ExistingRssScraper(BaseScraper):
             pubdate = datetime.datetime.now(pytz.UTC)
 
         return {
-            'title': title,
-            'link': link,
+            'title': item['title'] or 'Título não encontrado',
+            'link': item['link'] or '',
             'pubdate': pubdate,
-            'author': author,
-            'description': description
+            'author': item['author'] or 'Autor não encontrado',
+            'description': item['description'] or '',
         }
 
-    def _fetch_items(self):
-        """Fetch and return all RSS/Atom item elements."""
-        response = requests_retry_session().get(self.url, timeout=30)
-        response.raise_for_status()
-        root = ET.fromstring(response.content)
-        items = root.findall('.//item') or root.findall('.//{http://www.w3.org/2005/Atom}entry')
-        return items
+    def _fetch_items(self, limit=None):
+        """Fetch the feed and return its first *limit* items, reading no further."""
+        response = self.fetcher.get_conditional(self.url, self.validators, timeout=30, stream=True)
+        return list(feed_items(response, limit))
+
+    @staticmethod
+    def _items_from_xml(content, limit=None):
+        """Return the first *limit* RSS/Atom items of a feed document."""
+        return list(iter_feed_items([content], limit))
+
+    @staticmethod
+    def _item_keys(items):
+        """Listing entries of feed items: their link, guid and date texts."""
+        return [
+            [item['link'] or '', item['guid'] or '', item['published'] or item['updated'] or '']
+            for item in items
+        ]
 
     def get_latest_article(self):
         """Fetch and parse an existing RSS feed to get the latest article."""
         try:
-            items = self._fetch_items()
+            items = self._fetch_items(limit=1)
             if not items:
                 print(f"Nenhum item encontrado no feed: {self.url}")
                 return None
             return self._parse_item(items[0])
+        except NotModified:
+            raise
         except Exception as e:
             print(f"Erro ao processar feed RSS {self.url}: {str(e)}")
             return None
@@ -160,11 +226,14 @@ class ExistingRssScraper(BaseScraper):
     def get_articles(self, limit=10):
         """Fetch and parse up to *limit* articles from the RSS feed."""
         try:
-            items = self._fetch_items()
+            items = self._fetch_items(limit)
             if not items:
                 print(f"Nenhum item encontrado no feed: {self.url}")
                 return []
-            return [self._parse_item(item) for item in items[:limit]]
+            self.check_listing(self._item_keys(items))
+            return [self._parse_item(item) for item in items]
+        except NotModified:
+            raise
         except Exception as e:
             print(f"Erro ao processar feed RSS {self.url}: {str(e)}")
             return []
@@ -194,19 +263,14 @@ class FolhaRssFullContentScraper(ExistingRssScraper):
         'wilson-gomes': 'Wilson Gomes',
         'zecacamargo': 'Zeca Camargo',
     }
+    HEADERS = {
+        'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36',
+    }
 
-    @staticmethod
-    def _resolve_folha_redirect(url):
-        """Return the article URL hidden behind Folha's RSS redirection URL."""
-        if not url:
-            return url
-        if 'redir.folha.com.br/redir/' in url and '*' in url:
-            return unquote(url.split('*', 1)[1])
-        return url
-
-    def _parse_item(self, item):
+    def _parse_listing_item(self, item):
+        """Parse an RSS item without fetching the article page."""
         article = super()._parse_item(item)
-        article['link'] = self._resolve_folha_redirect(article['link'])
+        article['link'] = unwrap_redirect(article['link'])
 
         if article.get('author') == 'Autor não encontrado':
             for slug, author in self.DEFAULT_AUTHORS.items():
@@ -214,41 +278,117 @@ class FolhaRssFullContentScraper(ExistingRssScraper):
                     article['author'] = author
                     break
 
-        content = self._fetch_article_content(article['link'])
+        return article
+
+    @staticmethod
+    def _apply_content(article, content):
         if content:
             article['description'] = content
             article['_enrichment_failed'] = False
+            article['_enriched'] = True
         else:
             article['_enrichment_failed'] = True
-
         return article
 
-    @staticmethod
-    def _fetch_article_content(url):
-        """Fetch and extract full Folha article content using trafilatura."""
-        import trafilatura
+    def _parse_item(self, item):
+        article = self._parse_listing_item(item)
+        if self.fill_from_published(article):
+            return article
+        content = enrichment_cache.fetch(
+            'folha', article['link'], self._fetch_article_content, article['link'],
+        )
+        return self._apply_content(article, content)
 
+    def get_articles(self, limit=10):
+        """Fetch the RSS feed, then the article pages through the Fetcher's fan-out."""
         try:
-            response = requests_retry_session().get(url, timeout=30, headers={
-                'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36',
-            })
-            response.raise_for_status()
-            html = response.content.decode('utf-8', errors='replace')
-            content = trafilatura.extract(
-                html,
-                output_format='html',
-                include_links=True,
+            items = self._fetch_items(limit)
+            if not items:
+                print(f"Nenhum item encontrado no feed: {self.url}")
+                return []
+            self.check_listing(self._item_keys(items))
+            articles = [self._parse_listing_item(item) for item in items]
+            pending = [article for article in articles if not self.fill_from_published(article)]
+            contents = self.fetcher.map(
+                lambda article: enrichment_cache.fetch(
+                    'folha', article['link'], self._fetch_article_content, article['link'],
+                ),
+                pending,
             )
-            if not content:
-                return None
+            for article, content in zip(pending, contents):
+                self._apply_content(article, content)
+            return articles
+        except NotModified:
+            raise
+        except Exception as e:
+            print(f"Erro ao processar feed RSS {self.url}: {str(e)}")
+            return []
+
+    async def aget_articles(self, session, limit=10):
+        """Fetch the RSS feed and all article pages concurrently on one event loop."""
+        try:
+            response = await aconditional_get(session, self.url, self.validators, timeout=30)
+            items = self._items_from_xml(response.content, limit)
+            if not items:
+                print(f"Nenhum item encontrado no feed: {self.url}")
+                return []
+
+            self.check_listing(self._item_keys(items))
+            articles = [self._parse_listing_item(item) for item in items]
+            pending = [article for article in articles if not self.fill_from_published(article)]
+            contents = await asyncio.gather(*(
+                enrichment_cache.afetch(
+                    'folha', article['link'], self._afetch_article_content, session, article['link'],
+                )
+                for article in pending
+            ))
+            for article, content in zip(pending, contents):
+                self._apply_content(article, content)
+            return articles
+        except NotModified:
+            raise
+        except Exception as e:
+            print(f"Erro ao processar feed RSS {self.url}: {str(e)}")
+            return []
 
-            soup = BeautifulSoup(content, 'html.parser')
-            body = soup.body
-            return body.decode_contents().strip() if body else content
+    def _fetch_article_content(self, url):
+        """Fetch and extract full Folha article content using trafilatura."""
+        try:
+            response = self.fetcher.get(url, timeout=30, headers=self.HEADERS)
+            response.raise_for_status()
+            return parse_in_pool(self._extract_content, response.content)
         except Exception as e:
             print(f"   ⚠️  Erro ao buscar conteúdo da Folha em {url}: {str(e)}")
             return None
 
+    @classmethod
+    async def _afetch_article_content(cls, session, url):
+        try:
+            response = await session.get(url, timeout=30, headers=cls.HEADERS)
+            response.raise_for_status()
+            return await aparse_in_pool(cls._extract_content, response.content)
+        except Exception as e:
+            print(f"   ⚠️  Erro ao buscar conteúdo da Folha em {url}: {str(e)}")
+            return None
+
+    @staticmethod
+    def _extract_content(content):
+        """Extract the article body from a Folha page using trafilatura."""
+        import trafilatura
+
+        html = content.decode('utf-8', errors='replace')
+        extracted = trafilatura.extract(
+            html,
+            output_format='html',
+            include_links=True,
+        )
+        if not extracted:
+            return None
+
+        soup = make_soup(extracted)
+        body = soup.body
+        return body.decode_contents().strip() if body else extracted
+
 class GoogleAlertsScraper(ExistingRssScraper):
     """Scraper for Google Alerts RSS feeds.
 
@@ -262,35 +402,33 @@ class GoogleAlertsScraper(ExistingRssScraper):
         article = super()._parse_item(item)
 
         # Clean HTML from title
-        article['title'] = BeautifulSoup(article['title'], 'html.parser').text
+        article['title'] = make_soup(article['title']).text
 
         # Resolve google.com/url redirect to real URL
-        from urllib.parse import urlparse, parse_qs
-        parsed = urlparse(article['link'])
-        if parsed.netloc.endswith('google.com') and parsed.path == '/url':
-            real_url = parse_qs(parsed.query).get('url', [''])[0]
-            if real_url:
-                article['link'] = real_url
+        article['link'] = unwrap_redirect(article['link'])
+
+        if self.fill_from_published(article):
+            return article
 
         # Fetch full article content via trafilatura
-        content = self._fetch_content(article['link'])
+        content = enrichment_cache.fetch('trafilatura', article['link'], self._fetch_content, article['link'])
         if content:
             article['description'] = content
-        elif article['description']:
-            # Fallback: clean the Google Alerts snippet
-            article['description'] = BeautifulSoup(article['description'], 'html.parser').text
+            article['_enriched'] = True
+        else:
+            # Fallback: clean the Google Alerts snippet, and retry the page next run
+            if article['description']:
+                article['description'] = make_soup(article['description']).text
+            article['_enrichment_failed'] = True
 
         return article
 
-    @staticmethod
-    def _fetch_content(url):
+    def _fetch_content(self, url):
         """Fetch and extract article content using trafilatura."""
-        import trafilatura
-
         try:
-            downloaded = trafilatura.fetch_url(url)
+            downloaded = self.fetcher.download(url, timeout=30)
             if downloaded:
-                return trafilatura.extract(downloaded, output_format='html', include_links=True)
+                return parse_in_pool(_trafilatura_extract, downloaded)
         except Exception as e:
             print(f"Erro ao extrair conteúdo de {url}: {str(e)}")
         return None
@@ -301,31 +439,31 @@ class Poder360Scraper(BaseScraper):
     
     def _extract_article_data(self, soup):
         # Find the most recent article in the archive list
-        article = soup.select_one('ul.archive-list__list li')
+        article = select_one(soup, 'ul.archive-list__list li')
         
         if article:
             # Extract title
-            title_element = article.select_one('h2.archive-list__title-2 a')
+            title_element = select_one(article, 'h2.archive-list__title-2 a')
             title = title_element.text.strip() if title_element else "Título não encontrado"
             
             # Extract link
             link = title_element['href'] if title_element else ""
             
             # Extract date
-            date_element = article.select_one('span.archive-list__date')
+            date_element = select_one(article, 'span.archive-list__date')
             date_str = date_element.text.strip() if date_element else ""
             date = self._parse_date(date_str)
             
             # Extract author from the profile or page title
-            author_element = soup.select_one('h2.box-profile-author__title')
+            author_element = select_one(soup, 'h2.box-profile-author__title')
             author = author_element.text.strip() if author_element else "Autor Desconhecido"
             
             # Extract description/summary
-            description_element = article.select_one('div.archive-list__text p')
+            description_element = select_one(article, 'div.archive-list__text p')
             description = description_element.text.strip() if description_element else ""
             
             # Extract category/tag
-            tag_element = article.select_one('a.archive-list__tag')
+            tag_element = select_one(article, 'a.archive-list__tag')
             tag = tag_element.text.strip() if tag_element else ""
             
             # Add tag to description if available
@@ -373,11 +511,11 @@ class ValorOGloboScraper(BaseScraper):
     """Scraper for Valor/O Globo articles."""
     def _parse_feed_item(self, item):
         """Parse a single bastian-feed-item element."""
-        title_el = item.select_one('h2.feed-post-link')
-        link_el = item.select_one('a')
-        date_el = item.select_one('span.feed-post-datetime')
-        author_el = item.select_one('span.feed-post-metadata-section')
-        desc_el = item.select_one('p.feed-post-body-resumo')
+        title_el = select_one(item, 'h2.feed-post-link')
+        link_el = select_one(item, 'a')
+        date_el = select_one(item, 'span.feed-post-datetime')
+        author_el = select_one(item, 'span.feed-post-metadata-section')
+        desc_el = select_one(item, 'p.feed-post-body-resumo')
 
         if not (title_el and link_el):
             return None
@@ -391,7 +529,7 @@ class ValorOGloboScraper(BaseScraper):
         }
 
     def _extract_article_data(self, soup):
-        article = soup.select_one('div.bastian-feed-item')
+        article = select_one(soup, 'div.bastian-feed-item')
         if article:
             return self._parse_feed_item(article)
         return None
@@ -400,42 +538,104 @@ class ValorOGloboScraper(BaseScraper):
         """Fetch full article content from individual article page.
 
         Returns HTML string with article body paragraphs, or None on failure.
-        Filters out inline recommendation blocks (data-block-type="raw").
         """
         try:
-            response = requests_retry_session().get(url, timeout=30)
+            response = self.fetcher.get(url, timeout=30)
             response.raise_for_status()
-            soup = BeautifulSoup(response.content, 'html.parser')
-            body = soup.select_one('div.mc-article-body')
-            if not body:
-                return None
-            paragraphs = []
-            for div in body.select('div.content-text'):
-                if div.get('data-block-type') == 'raw':
-                    continue
-                p = div.select_one('p.content-text__container')
-                if p:
-                    paragraphs.append(str(p))
-            return '\n'.join(paragraphs) if paragraphs else None
+            return parse_in_pool(self._extract_article_body, response.content)
+        except Exception as e:
+            print(f"   ⚠️  Erro ao buscar conteúdo de {url}: {str(e)}")
+            return None
+
+    async def _afetch_article_content(self, session, url):
+        try:
+            response = await session.get(url, timeout=30)
+            response.raise_for_status()
+            return await aparse_in_pool(self._extract_article_body, response.content)
         except Exception as e:
             print(f"   ⚠️  Erro ao buscar conteúdo de {url}: {str(e)}")
             return None
 
+    @staticmethod
+    def _extract_article_body(content):
+        """Extract the body paragraphs of an article page.
+
+        Filters out inline recommendation blocks (data-block-type="raw").
+        """
+        soup = make_soup(content)
+        body = select_one(soup, 'div.mc-article-body')
+        if not body:
+            return None
+        paragraphs = []
+        for div in select(body, 'div.content-text'):
+            if div.get('data-block-type') == 'raw':
+                continue
+            p = select_one(div, 'p.content-text__container')
+            if p:
+                paragraphs.append(str(p))
+        return '\n'.join(paragraphs) if paragraphs else None
+
+    @staticmethod
+    def _apply_content(article, content):
+        # Without the body the listing summary is published and marked for retry
+        if content:
+            article['description'] = content
+            article['_enriched'] = True
+        else:
+            article['_enrichment_failed'] = True
+
+    def _parse_listing(self, content, limit):
+        # Only the feed cards are built, and parsing stops at the limit
+        return parse_cards(
+            content,
+            self._parse_feed_item,
+            limit=limit,
+            from_encoding='utf-8',
+            name='div',
+            class_='bastian-feed-item',
+        )
+
     def get_articles(self, limit=10):
         try:
-            response = requests_retry_session().get(self.url, timeout=30)
+            response = self.fetcher.get(self.url, timeout=30)
             response.raise_for_status()
-            soup = BeautifulSoup(response.content, 'html.parser', from_encoding='utf-8')
-            items = soup.select('div.bastian-feed-item')
-            articles = []
-            for item in items[:limit]:
-                article = self._parse_feed_item(item)
-                if article:
-                    content = self._fetch_article_content(article['link'])
-                    if content:
-                        article['description'] = content
-                    articles.append(article)
+            articles = parse_in_pool(self._parse_listing, response.content, limit)
+            self.check_listing(self._article_keys(articles))
+            pending = [article for article in articles if not self.fill_from_published(article)]
+            contents = self.fetcher.map(
+                lambda article: enrichment_cache.fetch(
+                    'valor', article['link'], self._fetch_article_content, article['link'],
+                ),
+                pending,
+            )
+            for article, content in zip(pending, contents):
+                self._apply_content(article, content)
+            return articles
+        except NotModified:
+            raise
+        except Exception as e:
+            print(f"Erro ao processar {self.url}: {str(e)}")
+            return []
+
+    async def aget_articles(self, session, limit=10):
+        """Fetch the listing, then all article pages concurrently."""
+        try:
+            response = await session.get(self.url, timeout=30)
+            response.raise_for_status()
+            articles = await aparse_in_pool(self._parse_listing, response.content, limit)
+            self.check_listing(self._article_keys(articles))
+            pending = [article for article in articles if not self.fill_from_published(article)]
+            contents = await asyncio.gather(*(
+                enrichment_cache.afetch(
+                    'valor', article['link'], self._afetch_article_content, session, article['link'],
+                )
+                for article in pending
+            ))
+            for article, content in zip(pending, contents):
+                self._apply_content(article, content)
             return articles
+        except NotModified:
+            raise
         except Exception as e:
             print(f"Erro ao processar {self.url}: {str(e)}")
             return []
@@ -463,26 +663,26 @@ class ValorOGloboScraper(BaseScraper):
 class WashingtonPostScraper(BaseScraper):
     """Scraper for Washington Post articles."""
     def _extract_article_data(self, soup):
-        articles = soup.select('div[data-feature-id="homepage/story"]')
+        articles = select(soup, 'div[data-feature-id="homepage/story"]')
         if not articles:
             return None
 
         latest_article = articles[0]
         
-        title_element = latest_article.select_one('h3[data-qa="card-title"]')
+        title_element = select_one(latest_article, 'h3[data-qa="card-title"]')
         title = title_element.text.strip() if title_element else "No title found"
 
-        link_element = latest_article.select_one('a[data-pb-local-content-field="web_headline"]')
+        link_element = select_one(latest_article, 'a[data-pb-local-content-field="web_headline"]')
         link = link_element['href'] if link_element else ""
 
-        description_element = latest_article.select_one('p.font-size-blurb')
+        description_element = select_one(latest_article, 'p.font-size-blurb')
         description = description_element.text.strip() if description_element else ""
 
-        author_elements = latest_article.select('span.wpds-c-iVfWzS a')
+        author_elements = select(latest_article, 'span.wpds-c-iVfWzS a')
         authors = [author.text.strip() for author in author_elements]
         author = ", ".join(authors) if authors else "Unknown Author"
 
-        date_element = latest_article.select_one('span[data-testid="timestamp"]')
+        date_element = select_one(latest_article, 'span[data-testid="timestamp"]')
         date_str = date_element.text.strip() if date_element else ""
         date = self._parse_date(date_str)
 
@@ -504,16 +704,16 @@ class WashingtonPostScraper(BaseScraper):
 class FolhaScraper(BaseScraper):
     """Scraper for Folha articles."""
     def _extract_article_data(self, soup):
-        article = soup.select_one('div.c-headline.c-headline--opinion')
+        article = select_one(soup, 'div.c-headline.c-headline--opinion')
         if article:
-            title = article.select_one('h2.c-headline__title').text.strip()
-            link = article.select_one('a.c-headline__url')['href']
-            date_str = article.select_one('time.c-headline__dateline')['datetime']
+            title = select_one(article, 'h2.c-headline__title').text.strip()
+            link = select_one(article, 'a.c-headline__url')['href']
+            date_str = select_one(article, 'time.c-headline__dateline')['datetime']
             
-            author_element = soup.select_one('div[data-qa="kicker"]')
+            author_element = select_one(soup, 'div[data-qa="kicker"]')
             author = author_element.text.strip() if author_element else "Autor Desconhecido"
             
-            description_element = article.select_one('p.c-headline__standfirst')
+            description_element = select_one(article, 'p.c-headline__standfirst')
             description = description_element.text.strip() if description_element else ""
             
             date = self._parse_date(date_str)
@@ -537,34 +737,29 @@ class FolhaScraper(BaseScraper):
 class EstadaoColumnistScraper(BaseScraper):
     """Scraper for Estadão columnist articles."""
     def _extract_article_data(self, soup):
-        article = soup.select_one('div.manchete-dia-a-dia-block-container')
+        article = select_one(soup, 'div.manchete-dia-a-dia-block-container')
         if article:
-            title_element = article.select_one('h2.headline')
+            title_element = select_one(article, 'h2.headline')
             title = title_element.text.strip() if title_element else "No title found"
 
-            headline_elem = article.select_one('h2.headline')
+            headline_elem = select_one(article, 'h2.headline')
             link_element = headline_elem.find_parent('a') if headline_elem else None
             link = link_element['href'] if link_element else ""
 
-            description_element = article.select_one('p.subheadline')
+            description_element = select_one(article, 'p.subheadline')
             description = description_element.text.strip() if description_element else ""
 
-            author_element = article.select_one('div.chapeu span')
+            author_element = select_one(article, 'div.chapeu span')
             author = author_element.text.strip() if author_element else "Autor Desconhecido"
 
-            latest_article = soup.select_one('div.noticias-mais-recenter--item')
+            latest_article = select_one(soup, 'div.noticias-mais-recenter--item')
             if latest_article:
-                date_element = latest_article.select_one('span.date')
+                date_element = select_one(latest_article, 'span.date')
                 date_str = date_element.text.strip() if date_element else ""
                 date = self._parse_date(date_str)
             else:
                 date = datetime.datetime.now(pytz.timezone('America/Sao_Paulo'))
 
-            if link:
-                content = self._fetch_content(link)
-                if content:
-                    description = content
-
             return {
                 'title': title,
                 'link': link,
@@ -574,18 +769,28 @@ class EstadaoColumnistScraper(BaseScraper):
             }
         return None
 
-    @staticmethod
-    def _fetch_content(url):
+    def get_latest_article(self):
+        """Parse the columnist page, then fetch the full text of the latest article."""
+        article = super().get_latest_article()
+        if article and article['link'] and not self.fill_from_published(article):
+            content = enrichment_cache.fetch('trafilatura', article['link'], self._fetch_content, article['link'])
+            if content:
+                article['description'] = content
+                article['_enriched'] = True
+            else:
+                article['_enrichment_failed'] = True
+        return article
+
+    def _fetch_content(self, url):
         """Fetch and extract article content using trafilatura.
 
         Estadão article pages use styled-components with dynamic class names,
         so trafilatura's heuristic extraction is more robust than CSS selectors.
         """
-        import trafilatura
         try:
-            downloaded = trafilatura.fetch_url(url)
+            downloaded = self.fetcher.download(url, timeout=30)
             if downloaded:
-                return trafilatura.extract(downloaded, output_format='html', include_links=True)
+                return parse_in_pool(_trafilatura_extract, downloaded)
         except Exception as e:
             print(f"   ⚠️  Erro ao buscar conteúdo de {url}: {str(e)}")
         return None
@@ -611,8 +816,8 @@ class EstadaoColumnistScraper(BaseScraper):
 class LinkedInNewsletterScraper(BaseScraper):
     """Scraper for public LinkedIn newsletter pages with full article content."""
     
-    def __init__(self, url):
-        super().__init__(url)
+    def __init__(self, url, fetcher=None):
+        super().__init__(url, fetcher)
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36',
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
@@ -635,27 +840,28 @@ class LinkedInNewsletterScraper(BaseScraper):
         ``article-content-blocks`` container with the full newsletter body.
         """
         try:
-            session = requests_retry_session()
+            session = self.fetcher
             response = session.get(
                 self.url,
                 headers=self.headers,
                 timeout=30
             )
             response.raise_for_status()
-            
-            if 'login' in response.url.lower() or 'authenticate' in response.url.lower():
-                print(f"LinkedIn está solicitando autenticação para {self.url}")
-                return []
-                
-            soup = BeautifulSoup(response.content, 'html.parser', from_encoding='utf-8')
-            cards = soup.select('div.share-update-card')[:limit]
-            if not cards:
+
+            if self._is_login_redirect(response):
+                raise PermanentError(f"LinkedIn está solicitando autenticação para {self.url}")
+
+            summaries = parse_in_pool(self._parse_listing, response.content, limit)
+            if not summaries:
                 print(f"Nenhuma edição pública encontrada em {self.url}")
                 return []
+            self.check_listing(summaries)
 
             articles = []
-            for card in cards:
-                article = self._extract_card_data(card, session)
+            for summary in summaries:
+                article = self.published_article(summary[0]) or enrichment_cache.fetch(
+                    'linkedin', summary[0], self._fetch_issue, summary, session,
+                )
                 if article:
                     articles.append(article)
             return articles
@@ -663,34 +869,70 @@ class LinkedInNewsletterScraper(BaseScraper):
             print(f"Erro ao acessar {self.url}: {str(e)}")
             return []
     
+    @staticmethod
+    def _is_login_redirect(response):
+        """Whether LinkedIn redirected to its login wall instead of the page."""
+        url = response.url.lower()
+        return 'login' in url or 'authenticate' in url or 'authwall' in url
+
     def _extract_article_data(self, soup):
         """Extract the first article from an already parsed newsletter page."""
-        card = soup.select_one('div.share-update-card')
+        card = select_one(soup, 'div.share-update-card')
         if not card:
             return None
-        return self._extract_card_data(card, requests_retry_session())
-
-    def _extract_card_data(self, card, session):
-        title_element = card.select_one('h3.share-article__title a')
+        return self._extract_card_data(card, self.fetcher)
+
+    def _parse_listing(self, content, limit):
+        """Return (link, title, subtitle) for each issue card on the listing page."""
+        soup = make_soup(content, from_encoding='utf-8')
+        summaries = []
+        for card in select(soup, 'div.share-update-card')[:limit]:
+            summary = self._card_summary(card)
+            if summary:
+                summaries.append(summary)
+        return summaries
+
+    def _card_summary(self, card):
+        title_element = select_one(card, 'h3.share-article__title a')
         if not title_element or not title_element.get('href'):
             return None
 
         link = urljoin(self.url, title_element['href'])
         fallback_title = title_element.get_text(' ', strip=True)
-        subtitle = card.select_one('h4.share-article__subtitle')
+        subtitle = select_one(card, 'h4.share-article__subtitle')
         fallback_description = subtitle.get_text(' ', strip=True) if subtitle else ''
+        return link, fallback_title, fallback_description
+
+    def _extract_card_data(self, card, session):
+        summary = self._card_summary(card)
+        return self._fetch_issue(summary, session) if summary else None
+
+    def _parse_article_page(self, content, link, fallback_title, fallback_description):
+        article_soup = make_soup(content, from_encoding='utf-8')
+        return self._extract_full_article(
+            article_soup,
+            link,
+            fallback_title,
+            fallback_description,
+            self._find_article_metadata(content),
+        )
+
+    def _fetch_issue(self, summary, session):
+        link, fallback_title, fallback_description = summary
 
         try:
             response = session.get(link, headers=self.headers, timeout=30)
             response.raise_for_status()
-            article_soup = BeautifulSoup(response.content, 'html.parser', from_encoding='utf-8')
-            return self._extract_full_article(
-                article_soup,
+            if self._is_login_redirect(response):
+                raise PermanentError(f"LinkedIn está solicitando autenticação para {link}")
+            return parse_in_pool(
+                self._parse_article_page,
+                response.content,
                 response.url,
                 fallback_title,
                 fallback_description,
             )
-        except requests.exceptions.RequestException as e:
+        except (requests.exceptions.RequestException, PermanentError) as e:
             print(f"   ⚠️  Erro ao enriquecer artigo do LinkedIn {link}: {str(e)}")
             return {
                 'title': fallback_title,
@@ -701,10 +943,9 @@ class LinkedInNewsletterScraper(BaseScraper):
                 '_enrichment_failed': True,
             }
 
-    def _extract_full_article(self, soup, link, fallback_title, fallback_description):
-        metadata = self._find_article_metadata(soup)
+    def _extract_full_article(self, soup, link, fallback_title, fallback_description, metadata):
 
-        title_element = soup.select_one('main article h1')
+        title_element = select_one(soup, 'main article h1')
         title = (
             metadata.get('name')
             or (title_element.get_text(' ', strip=True) if title_element else '')
@@ -723,7 +964,7 @@ class LinkedInNewsletterScraper(BaseScraper):
             author = None
 
         if not author:
-            author_element = soup.select_one('main article h3.base-main-card__title')
+            author_element = select_one(soup, 'main article h3.base-main-card__title')
             author = author_element.get_text(' ', strip=True) if author_element else 'Autor não encontrado'
 
         pubdate = self._parse_iso_date(metadata.get('datePublished'))
@@ -737,17 +978,13 @@ class LinkedInNewsletterScraper(BaseScraper):
             'author': author.strip(),
             'description': description,
             '_enrichment_failed': not bool(article_content),
+            '_enriched': bool(article_content),
         }
 
     @classmethod
-    def _find_article_metadata(cls, soup):
+    def _find_article_metadata(cls, content):
         """Return the schema.org Article object embedded in LinkedIn's JSON-LD."""
-        for script in soup.find_all('script', type='application/ld+json'):
-            try:
-                data = json.loads(script.string or '')
-            except (TypeError, ValueError):
-                continue
-
+        for data in ld_json(content):
             article = cls._find_article_object(data)
             if article:
                 return article
@@ -784,11 +1021,11 @@ class LinkedInNewsletterScraper(BaseScraper):
 
     @classmethod
     def _extract_article_content(cls, soup, article_url):
-        container = soup.select_one('[data-test-id="article-content-blocks"]')
+        container = select_one(soup, '[data-test-id="article-content-blocks"]')
         if not container:
             return None
 
-        for unwanted in container.select('script, style, button'):
+        for unwanted in select(container, 'script, style, button'):
             unwanted.decompose()
 
         for comment in container.find_all(string=lambda text: isinstance(text, Comment)):
@@ -839,13 +1076,7 @@ class LinkedInNewsletterScraper(BaseScraper):
 
     @staticmethod
     def _clean_linkedin_url(href, article_url):
-        absolute_url = urljoin(article_url, href)
-        parsed = urlparse(absolute_url)
-        if parsed.netloc.endswith('linkedin.com') and parsed.path == '/redir/redirect':
-            destination = parse_qs(parsed.query).get('url', [None])[0]
-            if destination:
-                return destination
-        return absolute_url
+        return unwrap_redirect(urljoin(article_url, href))
 
 
 class PaulGrahamScraper(BaseScraper):
@@ -861,69 +1092,82 @@ class PaulGrahamScraper(BaseScraper):
     def get_latest_article(self):
         """Fetch the articles listing and return the most recent essay with full content."""
         try:
-            response = requests_retry_session().get(self.url, timeout=30)
+            response = self.fetcher.get(self.url, timeout=30)
             response.raise_for_status()
-            soup = BeautifulSoup(response.content, 'html.parser')
-
-            # Page structure: table[0]=nav, table[1]=recommended intro,
-            # table[2]=full article listing (newest first), table[3]=footer.
-            # We want the first article link from table[2].
-            tables = soup.find_all('table')
-            if len(tables) < 3:
-                print(f"Estrutura inesperada da página {self.url}")
+            latest = parse_in_pool(self._parse_listing, response.content)
+            if not latest:
                 return None
 
-            article_listing_table = tables[2]
-            article_links = [
-                a for a in article_listing_table.find_all('a', href=True)
-                if a['href'].endswith('.html')
-                and not a['href'].startswith('http')
-                and a.text.strip()
-            ]
+            self.check_listing(latest)
+            title, article_url = latest
+            return self.published_article(article_url) or enrichment_cache.fetch(
+                'paulgraham', article_url, self._fetch_article, title, article_url,
+            )
+        except requests.exceptions.RequestException as e:
+            print(f"Erro ao acessar {self.url}: {str(e)}")
+            return None
+
+    def _parse_listing(self, content):
+        """Return (title, url) of the most recent essay on the listing page."""
+        soup = make_soup(content)
 
-            if not article_links:
-                print(f"Nenhum artigo encontrado em {self.url}")
-                return None
+        # Page structure: table[0]=nav, table[1]=recommended intro,
+        # table[2]=full article listing (newest first), table[3]=footer.
+        # We want the first article link from table[2].
+        tables = soup.find_all('table')
+        if len(tables) < 3:
+            print(f"Estrutura inesperada da página {self.url}")
+            return None
 
-            # First link is the most recent essay
-            first_link = article_links[0]
-            title = first_link.text.strip()
-            article_url = f"{self.BASE_URL}/{first_link['href']}"
+        article_listing_table = tables[2]
+        article_links = [
+            a for a in article_listing_table.find_all('a', href=True)
+            if a['href'].endswith('.html')
+            and not a['href'].startswith('http')
+            and a.text.strip()
+        ]
 
-            return self._fetch_article(title, article_url)
-        except requests.exceptions.RequestException as e:
-            print(f"Erro ao acessar {self.url}: {str(e)}")
+        if not article_links:
+            print(f"Nenhum artigo encontrado em {self.url}")
             return None
 
+        # First link is the most recent essay
+        first_link = article_links[0]
+        return first_link.text.strip(), f"{self.BASE_URL}/{first_link['href']}"
+
     def _fetch_article(self, title, url):
         """Fetch a Paul Graham essay page and extract its full content."""
         try:
-            response = requests_retry_session().get(url, timeout=30)
+            response = self.fetcher.get(url, timeout=30)
             response.raise_for_status()
-            # Pages are ISO-8859-1 encoded
-            soup = BeautifulSoup(response.content, 'html.parser', from_encoding='ISO-8859-1')
-
-            # Content is inside <font face="verdana"> in the second table
-            tables = soup.find_all('table')
-            font = tables[1].find('font', {'face': 'verdana'}) if len(tables) >= 2 else None
-            if not font:
-                print(f"Conteúdo não encontrado em {url}")
-                return None
-
-            date = self._extract_date(font)
-            content_html = self._extract_content(font)
-
-            return {
-                'title': title,
-                'link': url,
-                'pubdate': date,
-                'author': 'Paul Graham',
-                'description': content_html,
-            }
+            return parse_in_pool(self._parse_essay, response.content, title, url)
         except requests.exceptions.RequestException as e:
             print(f"Erro ao acessar artigo {url}: {str(e)}")
             return None
 
+    def _parse_essay(self, content, title, url):
+        # Pages are ISO-8859-1 encoded
+        soup = make_soup(content, from_encoding='ISO-8859-1')
+
+        # Content is inside <font face="verdana"> in the second table
+        tables = soup.find_all('table')
+        font = tables[1].find('font', {'face': 'verdana'}) if len(tables) >= 2 else None
+        if not font:
+            print(f"Conteúdo não encontrado em {url}")
+            return None
+
+        date = self._extract_date(font)
+        content_html = self._extract_content(font)
+
+        return {
+            'title': title,
+            'link': url,
+            'pubdate': date,
+            'author': 'Paul Graham',
+            'description': content_html,
+            '_enriched': True,
+        }
+
     def _extract_date(self, font_tag):
         """Extract publication date from the font tag's opening text (e.g. 'June 2025')."""
         pattern = re.compile(
@@ -975,31 +1219,40 @@ class EstadaoSectionScraper(BaseScraper):
         canonical = article_meta.get('canonical_url', '')
         article_url = canonical if canonical.startswith('http') else f"{self.BASE_URL}{canonical}"
 
-        content_html = self._fetch_article_content(article_url) if fetch_content else None
-
         credits = article_meta.get('credits', {})
         authors = [a.get('name', '') for a in credits.get('by', [])]
 
-        return {
+        article = {
             'title': article_meta.get('headlines', {}).get('basic', ''),
             'link': article_url,
             'pubdate': self._parse_date(article_meta.get('first_publish_date', '')),
             'author': ', '.join(authors) if authors else 'Estadão',
-            'description': content_html or article_meta.get('subheadlines', {}).get('basic', ''),
+            'description': article_meta.get('subheadlines', {}).get('basic', ''),
         }
+        if fetch_content and not self.fill_from_published(article):
+            content_html = enrichment_cache.fetch(
+                'estadao-section', article_url, self._fetch_article_content, article_url,
+            )
+            if content_html:
+                article['description'] = content_html
+                article['_enriched'] = True
+            else:
+                article['_enrichment_failed'] = True
+        return article
 
     def get_latest_article(self):
         """Fetch the section listing page and return the most recent article with full content."""
         try:
-            response = requests_retry_session().get(self.url, timeout=30)
+            response = self.fetcher.get(self.url, timeout=30)
             response.raise_for_status()
-            soup = BeautifulSoup(response.content, 'html.parser')
-
-            all_meta = self._find_articles_from_cache(soup)
+            all_meta = parse_in_pool(self._parse_listing, response.content)
             if not all_meta:
                 return None
 
+            self.check_listing(self._listing_keys(all_meta[:1]))
             return self._build_article(all_meta[0])
+        except NotModified:
+            raise
         except Exception as e:
             print(f"Erro ao processar seção {self.url}: {str(e)}")
             return None
@@ -1007,86 +1260,76 @@ class EstadaoSectionScraper(BaseScraper):
     def get_articles(self, limit=10):
         """Fetch up to *limit* articles from the section page, with full content."""
         try:
-            response = requests_retry_session().get(self.url, timeout=30)
+            response = self.fetcher.get(self.url, timeout=30)
             response.raise_for_status()
-            soup = BeautifulSoup(response.content, 'html.parser')
-
-            all_meta = self._find_articles_from_cache(soup)
-            return [self._build_article(meta) for meta in all_meta[:limit]]
+            all_meta = parse_in_pool(self._parse_listing, response.content)[:limit]
+            self.check_listing(self._listing_keys(all_meta))
+            return [self._build_article(meta) for meta in all_meta]
+        except NotModified:
+            raise
         except Exception as e:
             print(f"Erro ao processar seção {self.url}: {str(e)}")
             return []
 
-    def _find_articles_from_cache(self, soup):
-        """Extract article metadata list from Fusion.contentCache, sorted by date desc."""
-        import json as _json
+    @staticmethod
+    def _listing_keys(all_meta):
+        return [
+            [meta.get('canonical_url'), meta.get('first_publish_date'), meta.get('last_updated_date')]
+            for meta in all_meta
+        ]
 
-        for script in soup.find_all('script'):
-            text = script.string or ''
-            if 'Fusion.contentCache' not in text:
-                continue
+    def _parse_listing(self, content):
+        return self._find_articles_from_cache(content)
 
-            start = text.index('Fusion.contentCache=') + len('Fusion.contentCache=')
-            end = text.index(';Fusion.', start)
-            cache = _json.loads(text[start:end])
-
-            story_feed = cache.get('story-feed-query', {})
-
-            # Collect all articles from every query in the cache, deduplicating by _id
-            seen_ids = set()
-            all_articles = []
-            for query_val in story_feed.values():
-                data = query_val.get('data', {}) if isinstance(query_val, dict) else {}
-                for el in data.get('content_elements', []):
-                    aid = el.get('_id')
-                    if aid and aid not in seen_ids:
-                        seen_ids.add(aid)
-                        all_articles.append(el)
-
-            all_articles.sort(
-                key=lambda a: a.get('first_publish_date', ''),
-                reverse=True,
-            )
-            return all_articles
+    def _find_articles_from_cache(self, content):
+        """Extract article metadata list from Fusion.contentCache, sorted by date desc."""
+        story_feed = assigned_json(content, 'Fusion.contentCache', path=('story-feed-query',))
+        if not isinstance(story_feed, dict):
+            return []
 
-        return []
+        # Collect all articles from every query in the cache, deduplicating by _id
+        seen_ids = set()
+        all_articles = []
+        for query_val in story_feed.values():
+            data = query_val.get('data', {}) if isinstance(query_val, dict) else {}
+            for el in data.get('content_elements', []):
+                aid = el.get('_id')
+                if aid and aid not in seen_ids:
+                    seen_ids.add(aid)
+                    all_articles.append(el)
+
+        all_articles.sort(
+            key=lambda a: a.get('first_publish_date', ''),
+            reverse=True,
+        )
+        return all_articles
 
     def _fetch_article_content(self, url):
         """Fetch an article page and build HTML from its Fusion content_elements."""
-        import json as _json
-
         try:
-            response = requests_retry_session().get(url, timeout=30)
+            response = self.fetcher.get(url, timeout=30)
             response.raise_for_status()
-            soup = BeautifulSoup(response.content, 'html.parser')
-
-            for script in soup.find_all('script'):
-                text = script.string or ''
-                if 'Fusion.globalContent' not in text:
-                    continue
-
-                start = text.index('Fusion.globalContent=') + len('Fusion.globalContent=')
-                end = text.index(';Fusion.', start)
-                data = _json.loads(text[start:end])
-
-                elements = data.get('content_elements', [])
-                if not elements:
-                    return None
-
-                parts = []
-                for el in elements:
-                    el_type = el.get('type')
-                    if el_type == 'text':
-                        parts.append(el.get('content', ''))
-                    elif el_type == 'header':
-                        level = el.get('level', 2)
-                        parts.append(f"<h{level}>{el.get('content', '')}</h{level}>")
-                return '\n'.join(parts) if parts else None
-
+            return parse_in_pool(self._render_article_page, response.content)
         except Exception as e:
             print(f"Erro ao buscar conteúdo de {url}: {str(e)}")
             return None
 
+    @staticmethod
+    def _render_article_page(content):
+        elements = assigned_json(content, 'Fusion.globalContent', path=('content_elements',))
+        if not elements:
+            return None
+
+        parts = []
+        for el in elements:
+            el_type = el.get('type')
+            if el_type == 'text':
+                parts.append(el.get('content', ''))
+            elif el_type == 'header':
+                level = el.get('level', 2)
+                parts.append(f"<h{level}>{el.get('content', '')}</h{level}>")
+        return '\n'.join(parts) if parts else None
+
     def _parse_date(self, date_str):
         """Parse ISO 8601 date string."""
         if not date_str:
@@ -1121,22 +1364,39 @@ class BloombergLineaScraper(BaseScraper):
         """Build a full article dict from API metadata, fetching content from the article page."""
         canonical = meta.get('canonical_url', '')
         article_url = canonical if canonical.startswith('http') else f"{self.BASE_URL}{canonical}"
-        content_html, author = self._fetch_article_content(article_url)
-
-        return {
+        article = {
             'title': meta.get('headlines', {}).get('basic', ''),
             'link': article_url,
             'pubdate': self._parse_date(meta.get('display_date', '')),
-            'author': author or 'Bloomberg Línea',
-            'description': content_html or meta.get('description', {}).get('basic', ''),
+            'author': 'Bloomberg Línea',
+            'description': meta.get('description', {}).get('basic', ''),
         }
+        if self.fill_from_published(article):
+            return article
+
+        # An author without the body is no result: never cached
+        content_html, author = enrichment_cache.fetch(
+            'bloomberg-linea', article_url, self._fetch_article_content, article_url,
+            complete=lambda value: bool(value[0]),
+        )
+        if author:
+            article['author'] = author
+        if content_html:
+            article['description'] = content_html
+            article['_enriched'] = True
+        else:
+            article['_enrichment_failed'] = True
+        return article
 
     def get_latest_article(self):
         try:
             elements = self._fetch_listing(1)
             if not elements:
                 return None
+            self.check_listing(self._listing_keys(elements))
             return self._build_article(elements[0])
+        except NotModified:
+            raise
         except Exception as e:
             print(f"Erro ao processar Bloomberg Línea {self.url}: {str(e)}")
             return None
@@ -1144,11 +1404,21 @@ class BloombergLineaScraper(BaseScraper):
     def get_articles(self, limit=10):
         try:
             elements = self._fetch_listing(limit)
+            self.check_listing(self._listing_keys(elements))
             return [self._build_article(meta) for meta in elements]
+        except NotModified:
+            raise
         except Exception as e:
             print(f"Erro ao processar Bloomberg Línea {self.url}: {str(e)}")
             return []
 
+    @staticmethod
+    def _listing_keys(elements):
+        return [
+            [meta.get('canonical_url'), meta.get('display_date'), meta.get('last_updated_date')]
+            for meta in elements
+        ]
+
     def _section_path(self):
         """Derive the Arc section path from the page URL (e.g. '/esg/bloomberg-linea-green')."""
         from urllib.parse import urlparse
@@ -1175,7 +1445,7 @@ class BloombergLineaScraper(BaseScraper):
             f"&_website=bloomberg-linea-brasil"
         )
 
-        response = requests_retry_session().get(api_url, timeout=30, headers={
+        response = self.fetcher.get(api_url, timeout=30, headers={
             'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36',
         })
         response.raise_for_status()
@@ -1185,48 +1455,43 @@ class BloombergLineaScraper(BaseScraper):
 
     def _fetch_article_content(self, url):
         """Fetch an article page and extract full content + author from Fusion.globalContent."""
-        import json as _json
-
         try:
-            response = requests_retry_session().get(url, timeout=30, headers={
+            response = self.fetcher.get(url, timeout=30, headers={
                 'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36',
             })
             response.raise_for_status()
-            soup = BeautifulSoup(response.content, 'html.parser')
-
-            for script in soup.find_all('script'):
-                text = script.string or ''
-                if 'Fusion.globalContent' not in text:
-                    continue
-
-                start = text.index('Fusion.globalContent=') + len('Fusion.globalContent=')
-                end = text.index(';Fusion.', start)
-                data = _json.loads(text[start:end])
-
-                # Extract author
-                credits = data.get('credits', {})
-                authors = [a.get('name', '') for a in credits.get('by', [])]
-                author = ', '.join(a for a in authors if a)
-
-                # Extract content
-                elements = data.get('content_elements', [])
-                parts = []
-                for el in elements:
-                    el_type = el.get('type')
-                    if el_type == 'text':
-                        parts.append(el.get('content', ''))
-                    elif el_type == 'header':
-                        level = el.get('level', 2)
-                        parts.append(f"<h{level}>{el.get('content', '')}</h{level}>")
-
-                content_html = '\n'.join(parts) if parts else None
-                return content_html, author
-
+            return parse_in_pool(self._parse_article_page, response.content)
         except Exception as e:
             print(f"Erro ao buscar conteúdo de {url}: {str(e)}")
 
         return None, None
 
+    @staticmethod
+    def _parse_article_page(content):
+        """Return (content_html, author) from an article page's Fusion.globalContent."""
+        data = assigned_json(content, 'Fusion.globalContent')
+        if not isinstance(data, dict):
+            return None, None
+
+        # Extract author
+        credits = data.get('credits', {})
+        authors = [a.get('name', '') for a in credits.get('by', [])]
+        author = ', '.join(a for a in authors if a)
+
+        # Extract content
+        elements = data.get('content_elements', [])
+        parts = []
+        for el in elements:
+            el_type = el.get('type')
+            if el_type == 'text':
+                parts.append(el.get('content', ''))
+            elif el_type == 'header':
+                level = el.get('level', 2)
+                parts.append(f"<h{level}>{el.get('content', '')}</h{level}>")
+
+        content_html = '\n'.join(parts) if parts else None
+        return content_html, author
+
     def _parse_date(self, date_str):
         """Parse ISO 8601 date string."""
         if not date_str:
@@ -1270,13 +1535,17 @@ class BloombergGreenScraper(ExistingRssScraper):
         re.compile(r'^read more$', re.I),
     )
 
-    def _fetch_items(self):
+    def _fetch_items(self, limit=None):
         """Fetch Bloomberg Green RSS items regardless of the configured page URL."""
         feed_url = self.url if self.url.endswith('.rss') else self.FEED_URL
-        response = requests_retry_session().get(feed_url, timeout=30, headers=self.HEADERS)
-        response.raise_for_status()
-        root = ET.fromstring(response.content)
-        return root.findall('.//item') or root.findall('.//{http://www.w3.org/2005/Atom}entry')
+        response = self.fetcher.get_conditional(
+            feed_url,
+            self.validators,
+            timeout=30,
+            headers=self.HEADERS,
+            stream=True,
+        )
+        return list(feed_items(response, limit))
 
     def get_latest_article(self):
         articles = self.get_articles(limit=1)
@@ -1284,56 +1553,57 @@ class BloombergGreenScraper(ExistingRssScraper):
 
     def get_articles(self, limit=10):
         try:
-            items = self._fetch_items()
+            items = self._fetch_items(limit)
             if not items:
                 print(f"Nenhum item encontrado no feed Bloomberg Green: {self.FEED_URL}")
                 return []
 
+            self.check_listing(self._item_keys(items))
             articles = []
-            for item in items[:limit]:
+            for item in items:
                 article = super()._parse_item(item)
-                enriched = self._fetch_article_data(article['link'])
+                articles.append(article)
+                if self.fill_from_published(article):
+                    continue
+                enriched = enrichment_cache.fetch(
+                    'bloomberg-green', article['link'], self._fetch_article_data, article['link'],
+                )
                 if enriched:
                     article.update({k: v for k, v in enriched.items() if v})
-                articles.append(article)
+                    article['_enriched'] = True
+                else:
+                    article['_enrichment_failed'] = True
             return articles
+        except NotModified:
+            raise
         except Exception as e:
             print(f"Erro ao processar Bloomberg Green {self.url}: {str(e)}")
             return []
 
     def _fetch_article_data(self, url):
         """Fetch an article page and extract metadata plus body from __NEXT_DATA__."""
-        import json as _json
-
         try:
             html = self._fetch_article_html(url)
-            soup = BeautifulSoup(html, 'html.parser')
-            script = soup.find('script', id='__NEXT_DATA__')
-            if not script or not script.string:
-                return None
-
-            data = _json.loads(script.string)
-            story = (
-                data.get('props', {})
-                    .get('pageProps', {})
-                    .get('story', {})
-            )
-            if not story:
-                return None
-
-            return {
-                'title': story.get('headline') or story.get('title'),
-                'author': self._extract_authors(story),
-                'pubdate': self._parse_story_date(story),
-                'description': self._extract_story_html(story),
-            }
+            return parse_in_pool(self._parse_article_html, html)
         except Exception as e:
             print(f"Erro ao buscar conteúdo Bloomberg Green {url}: {str(e)}")
             return None
 
+    def _parse_article_html(self, html):
+        story = script_json(html, '__NEXT_DATA__', path=('props', 'pageProps', 'story'))
+        if not story:
+            return None
+
+        return {
+            'title': story.get('headline') or story.get('title'),
+            'author': self._extract_authors(story),
+            'pubdate': self._parse_story_date(story),
+            'description': self._extract_story_html(story),
+        }
+
     def _fetch_article_html(self, url):
         try:
-            response = requests_retry_session().get(url, timeout=30, headers=self.HEADERS)
+            response = self.fetcher.get(url, timeout=30, headers=self.HEADERS)
             response.raise_for_status()
             return response.content
         except requests.exceptions.HTTPError as e:
@@ -1344,19 +1614,7 @@ class BloombergGreenScraper(ExistingRssScraper):
         return self._fetch_article_html_with_curl(url)
 
     def _fetch_article_html_with_curl(self, url):
-        import subprocess
-
-        return subprocess.check_output([
-            'curl',
-            '-L',
-            '--silent',
-            '--show-error',
-            '--max-time',
-            '30',
-            '-A',
-            self.CURL_USER_AGENT,
-            url,
-        ])
+        return self.fetcher.download_with_curl(url, user_agent=self.CURL_USER_AGENT)
 
     def _extract_story_html(self, story):
         """Render the Bloomberg story body into simple feed-safe HTML."""
@@ -1453,7 +1711,7 @@ class BloombergGreenScraper(ExistingRssScraper):
         return href if href and href.startswith(('http://', 'https://')) else None
 
     def _plain_text(self, html):
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = make_soup(html)
         return ' '.join(soup.get_text(' ', strip=True).split())
 
     def _is_promotional_text(self, text):
@@ -1505,82 +1763,41 @@ class CDPInsightsScraper(BaseScraper):
 
     def get_articles(self, limit=10):
         try:
-            response = requests_retry_session().get(self.url, timeout=30, headers=self.HEADERS)
+            response = self.fetcher.get(self.url, timeout=30, headers=self.HEADERS)
             response.raise_for_status()
-            html = response.content.decode('utf-8', errors='replace')
-            items = self._extract_initial_insights(html)
-            articles = [self._parse_insight(item) for item in items]
+            articles = parse_in_pool(self._parse_listing, response.content)
             articles.sort(key=lambda article: article['pubdate'], reverse=True)
-            return articles[:limit]
+            articles = articles[:limit]
+            self.check_listing(self._article_keys(articles))
+            return articles
+        except NotModified:
+            raise
         except Exception as e:
             print(f"Erro ao processar CDP Insights {self.url}: {str(e)}")
             return []
 
-    def _extract_initial_insights(self, html):
-        import json as _json
-
-        soup = BeautifulSoup(html, 'html.parser')
-        payload_parts = []
-
-        for script in soup.find_all('script'):
-            text = script.string or script.get_text() or ''
-            match = re.search(r'self\.__next_f\.push\(\[1,(".*")\]\)', text, re.S)
-            if not match:
-                continue
-            try:
-                payload_parts.append(_json.loads(match.group(1)))
-            except Exception:
-                continue
+    def _parse_listing(self, content):
+        html = content.decode('utf-8', errors='replace')
+        items = self._extract_initial_insights(html)
+        return [self._parse_insight(item) for item in items]
 
+    def _extract_initial_insights(self, html):
+        # Each React Server Components chunk is pushed as a JSON string literal
+        payload_parts = [
+            part for part in iter_json_after(html, 'self.__next_f.push([1,')
+            if isinstance(part, str)
+        ]
         payload = '\n'.join(payload_parts)
-        initial_insights = self._extract_json_array_after_key(payload, '"initialInsights":')
-        if not initial_insights:
+        entries = json_after(payload, '"initialInsights":')
+        if not isinstance(entries, list):
             return []
 
-        entries = _json.loads(initial_insights)
         return [
             item for item in entries
             if isinstance(item, dict)
             and not item.get('fields', {}).get('hideInsight')
         ]
 
-    @staticmethod
-    def _extract_json_array_after_key(text, key):
-        key_index = text.find(key)
-        if key_index == -1:
-            return None
-
-        start = text.find('[', key_index + len(key))
-        if start == -1:
-            return None
-
-        depth = 0
-        in_string = False
-        escaped = False
-
-        for index in range(start, len(text)):
-            char = text[index]
-
-            if in_string:
-                if escaped:
-                    escaped = False
-                elif char == '\\':
-                    escaped = True
-                elif char == '"':
-                    in_string = False
-                continue
-
-            if char == '"':
-                in_string = True
-            elif char == '[':
-                depth += 1
-            elif char == ']':
-                depth -= 1
-                if depth == 0:
-                    return text[start:index + 1]
-
-        return None
-
     def _parse_insight(self, item):
         fields = item.get('fields', {})
         slug = fields.get('slug', '')
@@ -1728,7 +1945,7 @@ class CDPInsightsScraper(BaseScraper):
 
     @staticmethod
     def _strip_html_text(value):
-        return BeautifulSoup(value, 'html.parser').get_text(' ', strip=True)
+        return make_soup(value).get_text(' ', strip=True)
 
     @staticmethod
     def _title_from_slug(slug):
@@ -1775,15 +1992,19 @@ class ReutersSustainabilityScraper(BaseScraper):
             articles = []
             seen_links = set()
 
-            for offset in self._sitemap_offsets():
-                for article in self._fetch_sitemap_articles(offset):
+            for page in self._fetch_sitemap_pages():
+                for article in page:
                     if article['link'] in seen_links:
                         continue
                     seen_links.add(article['link'])
                     articles.append(article)
 
             articles.sort(key=lambda article: article['pubdate'], reverse=True)
-            return articles[:limit]
+            articles = articles[:limit]
+            self.check_listing(self._article_keys(articles))
+            return articles
+        except NotModified:
+            raise
         except Exception as e:
             print(f"Erro ao processar Reuters Sustainability {self.url}: {str(e)}")
             return []
@@ -1794,14 +2015,39 @@ class ReutersSustainabilityScraper(BaseScraper):
         # scheduled runs light.
         return [None] + list(range(100, 1100, 100))
 
-    def _fetch_sitemap_articles(self, offset):
-        url = self.SITEMAP_URL
+    def _sitemap_url(self, offset):
         if offset:
-            url = f"{url}&from={offset}"
+            return f"{self.SITEMAP_URL}&from={offset}"
+        return self.SITEMAP_URL
+
+    def _fetch_sitemap_pages(self):
+        """Return the parsed articles of every sitemap page, newest page first."""
+        newest, *older = self._sitemap_offsets()
+
+        # Only the newest page is fetched conditionally: if it has not
+        # changed, nothing new was published and the whole run is skipped.
+        response = self.fetcher.get_conditional(
+            self._sitemap_url(newest),
+            self.validators,
+            timeout=30,
+            headers=self.HEADERS,
+        )
+        pages = [parse_in_pool(self._parse_sitemap, response.content)]
 
-        response = requests_retry_session().get(url, timeout=30, headers=self.HEADERS)
-        response.raise_for_status()
-        root = ET.fromstring(response.content)
+        responses = self.fetcher.fetch_many(
+            [self._sitemap_url(offset) for offset in older],
+            timeout=30,
+            headers=self.HEADERS,
+        )
+        for response in responses:
+            if isinstance(response, Exception):
+                raise response
+            response.raise_for_status()
+            pages.append(parse_in_pool(self._parse_sitemap, response.content))
+        return pages
+
+    def _parse_sitemap(self, content):
+        root = ET.fromstring(content)
 
         articles = []
         for url_elem in root.findall('sm:url', self.SITEMAP_NAMESPACES):
@@ -1884,7 +2130,7 @@ class SustainableViewsScraper(BaseScraper):
             return None
 
         article_link = None
-        for a in aside.select('a[href]'):
+        for a in select(aside, 'a[href]'):
             href = a.get('href', '')
             if (href.startswith('https://www.sustainableviews.com/')
                     and href != 'https://www.sustainableviews.com/'
@@ -1909,63 +2155,63 @@ class SustainableViewsScraper(BaseScraper):
 
     def get_articles(self, limit=10):
         try:
-            response = requests_retry_session().get(self.url, timeout=30, headers={
+            response = self.fetcher.get(self.url, timeout=30, headers={
                 'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36',
             })
             response.raise_for_status()
-            soup = BeautifulSoup(response.content, 'html.parser')
+            articles = parse_in_pool(self._parse_listing, response.content, limit)
+            self.check_listing(self._article_keys(articles))
 
-            asides = soup.select('aside')
-            if not asides:
-                print(f"Nenhum artigo encontrado em {self.url}")
-                return []
+            # Published articles keep the author found on an earlier run
+            filled = [self.fill_from_published(article) for article in articles]
 
-            articles = []
-            for aside in asides[:limit]:
-                article = self._parse_aside(aside)
-                if article:
-                    # Fetch author only for the first article to avoid too many requests
-                    if not articles:
-                        author = self._fetch_author(article['link'])
-                        if author:
-                            article['author'] = author
-                    articles.append(article)
+            # Fetch author only for the first article to avoid too many requests
+            if articles and not filled[0]:
+                author = enrichment_cache.fetch(
+                    'sustainable-views-author', articles[0]['link'], self._fetch_author, articles[0]['link'],
+                )
+                if author:
+                    articles[0]['author'] = author
             return articles
+        except NotModified:
+            raise
         except Exception as e:
             print(f"Erro ao processar Sustainable Views {self.url}: {str(e)}")
             return []
 
+    def _parse_listing(self, content, limit):
+        """Parse the <aside> cards of a listing page into articles."""
+        articles = parse_cards(content, self._parse_aside, limit=limit, name='aside')
+        if not articles:
+            print(f"Nenhum artigo encontrado em {self.url}")
+        return articles
+
     def _fetch_author(self, url):
         """Fetch the article page and extract author from the dataLayer script."""
-        import json as _json
-
         try:
-            response = requests_retry_session().get(url, timeout=30, headers={
+            response = self.fetcher.get(url, timeout=30, headers={
                 'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36',
             })
             response.raise_for_status()
-            soup = BeautifulSoup(response.content, 'html.parser')
-
-            for script in soup.find_all('script'):
-                text = script.string or ''
-                if 'Article Entity Loaded' not in text:
-                    continue
-
-                start = text.index('data: {') + 6
-                brace_count = 0
-                for i, c in enumerate(text[start:], start):
-                    if c == '{':
-                        brace_count += 1
-                    elif c == '}':
-                        brace_count -= 1
-                    if brace_count == 0:
-                        data = _json.loads(text[start:i + 1])
-                        return data.get('author_name', '')
+            return parse_in_pool(self._extract_author, response.content)
         except Exception as e:
             print(f"Erro ao buscar autor de {url}: {str(e)}")
 
         return None
 
+    @staticmethod
+    def _extract_author(content):
+        marker = content.find(b'Article Entity Loaded')
+        if marker == -1:
+            return None
+
+        # The dataLayer push carrying the marker: its `data: {...}` object
+        script_start = content.rfind(b'<script', 0, marker)
+        data = json_after(content, 'data: ', start=max(script_start, 0))
+        if not isinstance(data, dict):
+            return None
+        return data.get('author_name', '')
+
     def _parse_date(self, date_str):
         """Parse English date string like 'March 31, 2026'."""
         if not date_str:
@@ -1989,8 +2235,8 @@ class BBCTopicScraper(BaseScraper):
 
     def _parse_promo(self, promo):
         """Parse a promo card into a partial article dict (no content/author yet)."""
-        h = promo.select_one('h2, h3')
-        link = promo.select_one('a[href*="/articles/"]')
+        h = select_one(promo, 'h2, h3')
+        link = select_one(promo, 'a[href*="/articles/"]')
         if not (h and link):
             return None
 
@@ -1998,7 +2244,7 @@ class BBCTopicScraper(BaseScraper):
         if not article_url.startswith('http'):
             article_url = f"https://www.bbc.com{article_url}"
 
-        time_el = promo.select_one('time')
+        time_el = select_one(promo, 'time')
         date_str = time_el.get('datetime', '') if time_el else ''
 
         return {
@@ -2015,79 +2261,95 @@ class BBCTopicScraper(BaseScraper):
 
     def get_articles(self, limit=10):
         try:
-            response = requests_retry_session().get(self.url, timeout=30, headers={
+            response = self.fetcher.get(self.url, timeout=30, headers={
                 'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36',
             })
             response.raise_for_status()
-            soup = BeautifulSoup(response.content, 'html.parser')
+            promos = parse_in_pool(self._parse_listing, response.content)
+            self.check_listing(self._article_keys(promos[:limit]))
 
             articles = []
-            for promo in soup.select('div.promo-text'):
-                article = self._parse_promo(promo)
-                if not article:
+            for article in promos[:limit]:
+                articles.append(article)
+                if self.fill_from_published(article):
                     continue
 
                 # Fetch full content for each article
-                author, content_html = self._fetch_article(article['link'])
+                # An author without the body is no result: never cached
+                author, content_html = enrichment_cache.fetch(
+                    'bbc-topic', article['link'], self._fetch_article, article['link'],
+                    complete=lambda value: bool(value[1]),
+                )
                 if author:
                     article['author'] = author
                 if content_html:
                     article['description'] = content_html
-
-                articles.append(article)
-                if len(articles) >= limit:
-                    break
+                    article['_enriched'] = True
+                else:
+                    article['_enrichment_failed'] = True
 
             if not articles:
                 print(f"Nenhum artigo encontrado em {self.url}")
             return articles
+        except NotModified:
+            raise
         except Exception as e:
             print(f"Erro ao processar BBC topic {self.url}: {str(e)}")
             return []
 
+    def _parse_listing(self, content):
+        """Parse every promo card on the topic page (no content/author yet)."""
+        soup = make_soup(content)
+        promos = (self._parse_promo(promo) for promo in select(soup, 'div.promo-text'))
+        return [article for article in promos if article]
+
     def _fetch_article(self, url):
         """Fetch article page to extract author and full content."""
         try:
-            response = requests_retry_session().get(url, timeout=30, headers={
+            response = self.fetcher.get(url, timeout=30, headers={
                 'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36',
             })
             response.raise_for_status()
-            soup = BeautifulSoup(response.content, 'html.parser')
+            return parse_in_pool(self._parse_article_page, response.content)
+        except Exception as e:
+            print(f"Erro ao buscar artigo BBC {url}: {str(e)}")
+            return None, None
 
-            main = soup.select_one('main')
-            if not main:
-                return None, None
+    @staticmethod
+    def _parse_article_page(content):
+        """Return (author, content_html) from an article page."""
+        soup = make_soup(content)
 
-            # Extract author from byline section
-            author = None
-            for section in main.select('section'):
-                text = section.text.strip()
-                if 'Author' in text and len(text) < 300:
-                    spans = section.select('span')
-                    for i, span in enumerate(spans):
-                        if span.string and span.string.strip().startswith('Author'):
-                            # The name is in the next sibling span
-                            if i + 1 < len(spans) and spans[i + 1].string:
-                                author = spans[i + 1].string.strip()
-                                break
-                    break
+        main = select_one(soup, 'main')
+        if not main:
+            return None, None
 
-            # Extract content paragraphs
-            parts = []
-            for p in main.select('p'):
-                text = p.text.strip()
-                if (len(text) > 40
-                        and not text.startswith('Crédito')
-                        and not text.startswith('Legenda')
-                        and 'Getty Images' not in text):
-                    parts.append(f'<p>{text}</p>')
+        # Extract author from byline section
+        author = None
+        for section in select(main, 'section'):
+            text = section.text.strip()
+            if 'Author' in text and len(text) < 300:
+                spans = select(section, 'span')
+                for i, span in enumerate(spans):
+                    if span.string and span.string.strip().startswith('Author'):
+                        # The name is in the next sibling span
+                        if i + 1 < len(spans) and spans[i + 1].string:
+                            author = spans[i + 1].string.strip()
+                            break
+                break
 
-            content_html = '\n'.join(parts) if parts else None
-            return author, content_html
+        # Extract content paragraphs
+        parts = []
+        for p in select(main, 'p'):
+            text = p.text.strip()
+            if (len(text) > 40
+                    and not text.startswith('Crédito')
+                    and not text.startswith('Legenda')
+                    and 'Getty Images' not in text):
+                parts.append(f'<p>{text}</p>')
 
-        except Exception as e:
-            print(f"Erro ao buscar artigo BBC {url}: {str(e)}")
-            return None, None
+        content_html = '\n'.join(parts) if parts else None
+        return author, content_html
 
     def _parse_date(self, date_str):
         """Parse ISO date string like '2026-03-23'."""
@@ -2129,7 +2391,7 @@ class WordPressApiScraper(BaseScraper):
         # Try tags first, then categories
         for endpoint in ('tags', 'categories'):
             try:
-                r = requests_retry_session().get(
+                r = self.fetcher.get(
                     f"{base}/{endpoint}?slug={slug}", timeout=15)
                 if r.status_code == 200:
                     items = r.json()
@@ -2140,7 +2402,7 @@ class WordPressApiScraper(BaseScraper):
 
         # Try custom taxonomies
         try:
-            r = requests_retry_session().get(f"{base}/taxonomies", timeout=15)
+            r = self.fetcher.get(f"{base}/taxonomies", timeout=15)
             if r.status_code == 200:
                 taxonomies = r.json()
                 for tax_key, tax_info in taxonomies.items():
@@ -2148,7 +2410,7 @@ class WordPressApiScraper(BaseScraper):
                         continue
                     rest_base = tax_info.get('rest_base', tax_key)
                     try:
-                        r2 = requests_retry_session().get(
+                        r2 = self.fetcher.get(
                             f"{base}/{rest_base}?slug={slug}", timeout=15)
                         if r2.status_code == 200:
                             items = r2.json()
@@ -2163,7 +2425,7 @@ class WordPressApiScraper(BaseScraper):
     def _parse_post(self, post):
         """Parse a WP REST API post object into an article dict."""
         title_html = post.get('title', {}).get('rendered', '')
-        title = BeautifulSoup(title_html, 'html.parser').text.strip()
+        title = make_soup(title_html).text.strip()
 
         embedded = post.get('_embedded', {})
         authors = embedded.get('author', [])
@@ -2185,7 +2447,7 @@ class WordPressApiScraper(BaseScraper):
         filter_param = self._resolve_filter(parsed)
         api_url = f"{parsed.scheme}://{parsed.netloc}/wp-json/wp/v2/posts?per_page={limit}&_embed{filter_param}"
 
-        response = requests_retry_session().get(api_url, timeout=30, headers={
+        response = self.fetcher.get(api_url, timeout=30, headers={
             'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36',
         })
         response.raise_for_status()
@@ -2197,7 +2459,10 @@ class WordPressApiScraper(BaseScraper):
             if not posts:
                 print(f"Nenhum post encontrado para {self.url}")
                 return None
+            self.check_listing(self._post_keys(posts))
             return self._parse_post(posts[0])
+        except NotModified:
+            raise
         except Exception as e:
             print(f"Erro ao processar WordPress API {self.url}: {str(e)}")
             return None
@@ -2205,11 +2470,18 @@ class WordPressApiScraper(BaseScraper):
     def get_articles(self, limit=10):
         try:
             posts = self._fetch_posts(limit)
+            self.check_listing(self._post_keys(posts))
             return [self._parse_post(post) for post in posts]
+        except NotModified:
+            raise
         except Exception as e:
             print(f"Erro ao processar WordPress API {self.url}: {str(e)}")
             return []
 
+    @staticmethod
+    def _post_keys(posts):
+        return [[post.get('link'), post.get('modified_gmt')] for post in posts]
+
     def _parse_date(self, date_str):
         """Parse WordPress GMT date (ISO 8601 without timezone)."""
         if not date_str:
@@ -2263,7 +2535,7 @@ class CNNBrasilBlogScraper(BaseScraper):
 
     def _fetch_full_content(self, slug):
         try:
-            r = requests_retry_session().get(self._post_detail_url(slug), timeout=30, headers={
+            r = self.fetcher.get(self._post_detail_url(slug), timeout=30, headers={
                 'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36',
             })
             r.raise_for_status()
@@ -2277,34 +2549,43 @@ class CNNBrasilBlogScraper(BaseScraper):
                 html = content
             else:
                 return ''
-            return self._clean_content(html)
+            return parse_in_pool(self._clean_content, html)
         except Exception as e:
             print(f"   ⚠️  Erro ao buscar conteúdo do post {slug}: {str(e)}")
             return ''
 
-    def _clean_content(self, html):
+    @staticmethod
+    def _clean_content(html):
         """Strip the 'Leia mais' recommendation aside, which is navigation, not body."""
         if not html or '<aside' not in html:
             return html
-        soup = BeautifulSoup(html, 'html.parser')
-        for aside in soup.select('aside.read-too'):
+        soup = make_soup(html)
+        for aside in select(soup, 'aside.read-too'):
             aside.decompose()
         return str(soup)
 
     def _parse_post(self, post, fetch_body=True):
         slug = post.get('slug', '')
-        body = self._fetch_full_content(slug) if fetch_body else ''
-        description = body or post.get('excerpt', '') or ''
-        return {
+        article = {
             'title': post.get('title', '').strip(),
             'link': post.get('permalink', ''),
             'pubdate': self._parse_date(post.get('publish_date', '')),
             'author': self._author_name(post),
-            'description': description,
+            'description': post.get('excerpt', '') or '',
         }
+        if fetch_body and not self.fill_from_published(article):
+            body = enrichment_cache.fetch(
+                'cnn-blog', self._post_detail_url(slug), self._fetch_full_content, slug,
+            )
+            if body:
+                article['description'] = body
+                article['_enriched'] = True
+            else:
+                article['_enrichment_failed'] = True
+        return article
 
     def _fetch_posts(self):
-        response = requests_retry_session().get(self._resolver_url(), timeout=30, headers={
+        response = self.fetcher.get(self._resolver_url(), timeout=30, headers={
             'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36',
         })
         response.raise_for_status()
@@ -2317,19 +2598,29 @@ class CNNBrasilBlogScraper(BaseScraper):
             if not posts:
                 print(f"Nenhum post encontrado para {self.url}")
                 return None
+            self.check_listing(self._post_keys(posts[:1]))
             return self._parse_post(posts[0])
+        except NotModified:
+            raise
         except Exception as e:
             print(f"Erro ao processar CNN Brasil blog {self.url}: {str(e)}")
             return None
 
     def get_articles(self, limit=10):
         try:
-            posts = self._fetch_posts()
-            return [self._parse_post(p) for p in posts[:limit]]
+            posts = self._fetch_posts()[:limit]
+            self.check_listing(self._post_keys(posts))
+            return [self._parse_post(p) for p in posts]
+        except NotModified:
+            raise
         except Exception as e:
             print(f"Erro ao processar CNN Brasil blog {self.url}: {str(e)}")
             return []
 
+    @staticmethod
+    def _post_keys(posts):
+        return [[post.get('permalink'), post.get('publish_date'), post.get('modified_date')] for post in posts]
+
     def _extract_article_data(self, soup):
         pass  # Logic is handled in get_latest_article
 
@@ -2341,65 +2632,68 @@ class NatureRdfScraper(BaseScraper):
     to extract the abstract from #Abs1-content.
     """
 
-    RDF_NS = 'http://purl.org/rss/1.0/'
-    DC_NS = 'http://purl.org/dc/elements/1.1/'
-
     def get_articles(self, limit=10):
         try:
-            response = requests_retry_session().get(self.url, timeout=30)
-            response.raise_for_status()
-            root = ET.fromstring(response.content)
-            items = root.findall(f'{{{self.RDF_NS}}}item')
+            response = self.fetcher.get_conditional(self.url, self.validators, timeout=30, stream=True)
+            items = list(feed_items(response, limit))
+            self.check_listing([[item['link'], item['published']] for item in items])
             articles = []
-            for item in items[:limit]:
+            for item in items:
                 article = self._parse_rdf_item(item)
                 if article:
                     articles.append(article)
             return articles
+        except NotModified:
+            raise
         except Exception as e:
             print(f"Erro ao processar feed Nature {self.url}: {str(e)}")
             return []
 
     def _parse_rdf_item(self, item):
-        title_el = item.find(f'{{{self.RDF_NS}}}title')
-        link_el = item.find(f'{{{self.RDF_NS}}}link')
-        date_el = item.find(f'{{{self.DC_NS}}}date')
-        creator_el = item.find(f'{{{self.DC_NS}}}creator')
-
-        if title_el is None or link_el is None:
+        if item['title'] is None or item['link'] is None:
             return None
 
-        title = title_el.text or ''
-        link = link_el.text or ''
-        author = creator_el.text if creator_el is not None else ''
-        pubdate = self._parse_date(date_el.text if date_el is not None else '')
-
-        abstract = self._fetch_abstract(link)
+        title = item['title']
+        link = item['link']
+        author = item['author'] or ''
+        pubdate = self._parse_date(item['published'] or '')
 
-        return {
+        article = {
             'title': title,
             'link': link,
             'pubdate': pubdate,
             'author': author,
-            'description': abstract or title,
+            'description': title,
         }
+        if not self.fill_from_published(article):
+            abstract = enrichment_cache.fetch('nature-abstract', link, self._fetch_abstract, link)
+            if abstract:
+                article['description'] = abstract
+                article['_enriched'] = True
+            else:
+                article['_enrichment_failed'] = True
+        return article
 
     def _fetch_abstract(self, url):
         """Fetch the article page and extract the abstract."""
         try:
-            response = requests_retry_session().get(url, timeout=30, headers={
+            response = self.fetcher.get(url, timeout=30, headers={
                 'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36',
             })
             response.raise_for_status()
-            soup = BeautifulSoup(response.content, 'html.parser')
-            abstract = soup.select_one('#Abs1-content')
-            if abstract:
-                return str(abstract)
-            return None
+            return parse_in_pool(self._extract_abstract, response.content)
         except Exception as e:
             print(f"   ⚠️  Erro ao buscar abstract de {url}: {str(e)}")
             return None
 
+    @staticmethod
+    def _extract_abstract(content):
+        soup = make_soup(content)
+        abstract = select_one(soup, '#Abs1-content')
+        if abstract:
+            return str(abstract)
+        return None
+
     def _parse_date(self, date_str):
         if not date_str:
             return datetime.datetime.now(pytz.UTC)
@@ -2464,7 +2758,7 @@ class DWTopicScraper(BaseScraper):
             }
             ''' % section_id
 
-            response = requests_retry_session().post(
+            response = self.fetcher.post(
                 self.GRAPHQL_URL,
                 json={'query': query},
                 timeout=30,
@@ -2489,9 +2783,12 @@ class DWTopicScraper(BaseScraper):
                                 'author': 'DW',
                                 'description': content.get('text', '') or content.get('teaser', ''),
                             })
-                            if len(articles) >= limit:
-                                return articles
+
+            articles = articles[:limit]
+            self.check_listing(self._article_keys(articles))
             return articles
+        except NotModified:
+            raise
         except Exception as e:
             print(f"Erro ao processar DW {self.url}: {str(e)}")
             return []
@@ -2523,10 +2820,6 @@ class BBCFutureScraper(BaseScraper):
     HEADERS = {
         'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36',
     }
-    NEXT_DATA_RE = re.compile(
-        r'<script id="__NEXT_DATA__" type="application/json"[^>]*>(.+?)</script>',
-        re.DOTALL,
-    )
 
     def get_latest_article(self):
         articles = self.get_articles(limit=1)
@@ -2534,73 +2827,85 @@ class BBCFutureScraper(BaseScraper):
 
     def get_articles(self, limit=10):
         try:
-            response = requests_retry_session().get(self.url, timeout=30, headers=self.HEADERS)
+            response = self.fetcher.get(self.url, timeout=30, headers=self.HEADERS)
             response.raise_for_status()
-            soup = BeautifulSoup(response.content, 'html.parser')
-
-            seen = set()
-            article_urls = []
-            for a in soup.select('a[href*="/future/article/"]'):
-                href = (a.get('href') or '').split('?')[0].rstrip('/')
-                if not href:
-                    continue
-                if not href.startswith('http'):
-                    href = f"{self.BASE_URL}{href}"
-                if href not in seen:
-                    seen.add(href)
-                    article_urls.append(href)
+            article_urls = parse_in_pool(self._parse_listing, response.content, limit)
 
             if not article_urls:
                 print(f"Nenhum artigo encontrado em {self.url}")
                 return []
 
+            self.check_listing(article_urls)
+
             articles = []
-            for url in article_urls[:limit]:
-                article = self._fetch_article(url)
+            for url in article_urls:
+                article = self.published_article(url) or enrichment_cache.fetch(
+                    'bbc-future', url, self._fetch_article, url,
+                )
                 if article:
                     articles.append(article)
             return articles
+        except NotModified:
+            raise
         except Exception as e:
             print(f"Erro ao processar BBC Future {self.url}: {str(e)}")
             return []
 
-    def _fetch_article(self, url):
-        import json as _json
+    def _parse_listing(self, content, limit=None):
+        """Return the first *limit* unique article URLs linked from the hub page."""
+        seen = set()
 
-        try:
-            r = requests_retry_session().get(url, timeout=30, headers=self.HEADERS)
-            r.raise_for_status()
-
-            match = self.NEXT_DATA_RE.search(r.text)
-            if not match:
+        def article_url(a):
+            href = (a.get('href') or '').split('?')[0].rstrip('/')
+            if not href:
                 return None
-
-            data = _json.loads(match.group(1))
-            pp = data.get('props', {}).get('pageProps', {})
-            md = pp.get('metadata', {})
-            page = pp.get('page', {})
-            if not isinstance(page, dict) or not page:
+            if not href.startswith('http'):
+                href = f"{self.BASE_URL}{href}"
+            if href in seen:
                 return None
+            seen.add(href)
+            return href
 
-            article_data = next(iter(page.values()))
-            contents = article_data.get('contents', []) if isinstance(article_data, dict) else []
+        # Only the article links are built, and parsing stops at the limit
+        return parse_cards(content, article_url, limit=limit, name='a', href=re.compile(r'/future/article/'))
 
-            title = self._extract_title(contents) or md.get('seoHeadline') or md.get('promoHeadline') or ''
-            author = self._clean_author(md.get('contributor', ''))
-            pubdate = self._parse_timestamp(md.get('firstPublished'))
-            description = self._render_contents(contents) or md.get('description', '')
-
-            return {
-                'title': title,
-                'link': url,
-                'pubdate': pubdate,
-                'author': author or 'BBC Future',
-                'description': description,
-            }
+    def _fetch_article(self, url):
+        try:
+            r = self.fetcher.get(url, timeout=30, headers=self.HEADERS)
+            r.raise_for_status()
+            return parse_in_pool(self._parse_article_page, r.content, url)
         except Exception as e:
             print(f"   ⚠️  Erro ao buscar artigo BBC Future {url}: {str(e)}")
             return None
 
+    def _parse_article_page(self, content, url):
+        pp = script_json(content, '__NEXT_DATA__', path=('props', 'pageProps'))
+        if not isinstance(pp, dict):
+            return None
+
+        md = pp.get('metadata', {})
+        page = pp.get('page', {})
+        if not isinstance(page, dict) or not page:
+            return None
+
+        article_data = next(iter(page.values()))
+        contents = article_data.get('contents', []) if isinstance(article_data, dict) else []
+
+        title = self._extract_title(contents) or md.get('seoHeadline') or md.get('promoHeadline') or ''
+        author = self._clean_author(md.get('contributor', ''))
+        pubdate = self._parse_timestamp(md.get('firstPublished'))
+        body = self._render_contents(contents)
+
+        return {
+            'title': title,
+            'link': url,
+            'pubdate': pubdate,
+            'author': author or 'BBC Future',
+            'description': body or md.get('description', ''),
+            '_enriched': bool(body),
+            '_enrichment_failed': not body,
+        }
+
     def _extract_title(self, contents):
         for blk in contents:
             if isinstance(blk, dict) and blk.get('type') == 'headline':
@@ -2693,28 +2998,35 @@ class YouTubeTranscriptScraper(BaseScraper):
     via youtube-transcript-api. Shorts are skipped.
     """
 
-    ATOM_NS = 'http://www.w3.org/2005/Atom'
     YT_NS = 'http://www.youtube.com/xml/schemas/2015'
-    MEDIA_NS = 'http://search.yahoo.com/mrss/'
 
     def get_articles(self, limit=10):
         try:
-            response = requests_retry_session().get(self.url, timeout=30)
-            response.raise_for_status()
-            root = ET.fromstring(response.content)
-            entries = root.findall(f'{{{self.ATOM_NS}}}entry')
+            response = self.fetcher.get_conditional(self.url, self.validators, timeout=30, stream=True)
+            # Shorts are filtered out below, so the whole feed is read and fingerprinted
+            entries = list(feed_items(response, extra={'video_id': f'{{{self.YT_NS}}}videoId'}))
+            self.check_listing([[entry['video_id'], entry['updated']] for entry in entries])
 
             articles = []
             for entry in entries:
                 if len(articles) >= limit:
                     break
-                video_id = entry.find(f'{{{self.YT_NS}}}videoId').text
+                video_id = entry['video_id']
+                if not video_id:
+                    continue
+                # Published videos already passed the Shorts check
+                previous = self.published_article(f'https://www.youtube.com/watch?v={video_id}')
+                if previous:
+                    articles.append(previous)
+                    continue
                 if self._is_short(video_id):
                     continue
                 article = self._parse_entry(entry, video_id)
                 if article:
                     articles.append(article)
             return articles
+        except NotModified:
+            raise
         except Exception as e:
             print(f"Erro ao processar feed YouTube {self.url}: {str(e)}")
             return []
@@ -2722,7 +3034,7 @@ class YouTubeTranscriptScraper(BaseScraper):
     def _is_short(self, video_id):
         """Check if a video is a YouTube Short."""
         try:
-            resp = requests_retry_session().get(
+            resp = self.fetcher.get(
                 f'https://www.youtube.com/shorts/{video_id}',
                 timeout=15,
                 headers={'User-Agent': 'Mozilla/5.0'},
@@ -2734,19 +3046,14 @@ class YouTubeTranscriptScraper(BaseScraper):
             return False
 
     def _parse_entry(self, entry, video_id):
-        title = entry.find(f'{{{self.ATOM_NS}}}title').text or ''
-        published = entry.find(f'{{{self.ATOM_NS}}}published').text or ''
-        media_group = entry.find(f'{{{self.MEDIA_NS}}}group')
-        description = ''
-        if media_group is not None:
-            desc_el = media_group.find(f'{{{self.MEDIA_NS}}}description')
-            if desc_el is not None and desc_el.text:
-                description = desc_el.text
+        title = entry['title'] or ''
+        published = entry['published'] or ''
+        description = entry['description'] or ''
 
         link = f'https://www.youtube.com/watch?v={video_id}'
         pubdate = self._parse_date(published)
 
-        transcript = self._fetch_transcript(video_id)
+        transcript = enrichment_cache.fetch('youtube-transcript', link, self._fetch_transcript, video_id)
 
         return {
             'title': title,
@@ -2754,6 +3061,7 @@ class YouTubeTranscriptScraper(BaseScraper):
             'pubdate': pubdate,
             'author': '',
             'description': transcript or description,
+            '_enriched': bool(transcript),
         }
 
     def _fetch_transcript(self, video_id):
@@ -2800,50 +3108,60 @@ class FiocruzClimaSaudeScraper(BaseScraper):
 
     def get_articles(self, limit=10):
         try:
-            response = requests_retry_session().get(self.url, timeout=30)
+            response = self.fetcher.get(self.url, timeout=30)
             response.raise_for_status()
-            soup = BeautifulSoup(response.content, 'html.parser', from_encoding='utf-8')
+            articles = parse_in_pool(self._parse_listing, response.content, limit)
+            self.check_listing(self._article_keys(articles))
+            return articles
+        except NotModified:
+            raise
+        except Exception as e:
+            print(f"Erro ao processar Fiocruz Clima e Saúde {self.url}: {str(e)}")
+            return []
 
-            container = soup.select_one('div.view-content')
-            if not container:
-                print(f"Container .view-content não encontrado em {self.url}")
-                return []
+    def _parse_listing(self, content, limit):
+        # Only the publications container is built; the rest of the page is skipped
+        containers = parse_cards(
+            content, lambda container: container, limit=1, from_encoding='utf-8',
+            name='div', class_='view-content',
+        )
+        container = containers[0] if containers else None
+        if not container:
+            print(f"Container .view-content não encontrado em {self.url}")
+            return []
 
-            sp_tz = pytz.timezone('America/Sao_Paulo')
-            articles = []
-            current_year = None
-            year_index = 0
+        sp_tz = pytz.timezone('America/Sao_Paulo')
+        articles = []
+        current_year = None
+        year_index = 0
 
-            for el in container.children:
-                if getattr(el, 'name', None) == 'h3':
-                    try:
-                        current_year = int(el.get_text(strip=True))
-                    except (ValueError, TypeError):
-                        current_year = None
-                    year_index = 0
-                    continue
+        for el in container.children:
+            if getattr(el, 'name', None) == 'h3':
+                try:
+                    current_year = int(el.get_text(strip=True))
+                except (ValueError, TypeError):
+                    current_year = None
+                year_index = 0
+                continue
 
-                if getattr(el, 'name', None) != 'div' or 'views-row' not in (el.get('class') or []):
-                    continue
-                if current_year is None:
-                    continue
+            if getattr(el, 'name', None) != 'div' or 'views-row' not in (el.get('class') or []):
+                continue
+            if current_year is None:
+                continue
 
-                article = self._parse_row(el, current_year, year_index, sp_tz)
-                if article:
-                    articles.append(article)
-                    year_index += 1
-                    if len(articles) >= limit:
-                        break
+            article = self._parse_row(el, current_year, year_index, sp_tz)
+            if article:
+                articles.append(article)
+                year_index += 1
+                if len(articles) >= limit:
+                    break
 
-            if not articles:
-                print(f"Nenhuma publicação encontrada em {self.url}")
-            return articles
-        except Exception as e:
-            print(f"Erro ao processar Fiocruz Clima e Saúde {self.url}: {str(e)}")
-            return []
+        if not articles:
+            print(f"Nenhuma publicação encontrada em {self.url}")
+        return articles
 
     def _parse_row(self, row, year, year_index, tz):
-        link_el = row.select_one('.views-field-title a')
+        link_el = select_one(row, '.views-field-title a')
         if not link_el:
             return None
 
@@ -2854,8 +3172,8 @@ class FiocruzClimaSaudeScraper(BaseScraper):
         if href.startswith('/'):
             href = f"{self.BASE_URL}{href}"
 
-        tema_el = row.select_one('.views-field-field-tema .field-content')
-        tipo_el = row.select_one('.views-field-field-tipo-de-publica-o .field-content')
+        tema_el = select_one(row, '.views-field-field-tema .field-content')
+        tipo_el = select_one(row, '.views-field-field-tipo-de-publica-o .field-content')
         tema = tema_el.get_text(strip=True) if tema_el else ''
         tipo = tipo_el.get_text(strip=True) if tipo_el else ''
 
@@ -2901,37 +3219,53 @@ class WorldBankBlogScraper(BaseScraper):
 
     def get_articles(self, limit=10):
         try:
-            response = requests_retry_session().get(self.url, timeout=30, headers={
+            response = self.fetcher.get(self.url, timeout=30, headers={
                 'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36',
             })
             response.raise_for_status()
-            soup = BeautifulSoup(response.content, 'html.parser')
+
+            listing = parse_in_pool(self._parse_listing, response.content, limit)
+            self.check_listing(self._article_keys(listing))
 
             articles = []
-            seen_links = set()
-            for teaser in soup.select('div.blog_teaser'):
-                article = self._parse_teaser(teaser)
-                if not article or article['link'] in seen_links:
+            for article in listing:
+                articles.append(article)
+                if self.fill_from_published(article):
                     continue
-                seen_links.add(article['link'])
-
-                content_html = self._fetch_article_content(article['link'])
+                content_html = enrichment_cache.fetch(
+                    'worldbank', article['link'], self._fetch_article_content, article['link'],
+                )
                 if content_html:
                     article['description'] = content_html
-
-                articles.append(article)
-                if len(articles) >= limit:
-                    break
+                    article['_enriched'] = True
+                else:
+                    article['_enrichment_failed'] = True
 
             if not articles:
                 print(f"Nenhum artigo encontrado em {self.url}")
             return articles
+        except NotModified:
+            raise
         except Exception as e:
             print(f"Erro ao processar World Bank blog {self.url}: {str(e)}")
             return []
 
+    def _parse_listing(self, content, limit=None):
+        """Parse up to *limit* blog teasers of a listing page, skipping repeated links."""
+        seen_links = set()
+
+        def parse_teaser(teaser):
+            article = self._parse_teaser(teaser)
+            if not article or article['link'] in seen_links:
+                return None
+            seen_links.add(article['link'])
+            return article
+
+        # Only the teasers are built, and parsing stops at the limit
+        return parse_cards(content, parse_teaser, limit=limit, name='div', class_='blog_teaser')
+
     def _parse_teaser(self, teaser):
-        title_link = teaser.select_one('h3.blog_teaser__title a, h3 a')
+        title_link = select_one(teaser, 'h3.blog_teaser__title a, h3 a')
         if not title_link:
             return None
         title = title_link.get_text(strip=True)
@@ -2941,10 +3275,10 @@ class WorldBankBlogScraper(BaseScraper):
         if href.startswith('/'):
             href = f"{self.BASE_URL}{href}"
 
-        time_el = teaser.select_one('time')
+        time_el = select_one(teaser, 'time')
         pubdate = self._parse_date(time_el.get_text(strip=True) if time_el else '')
 
-        author_links = teaser.select('a[href*="/team/"]')
+        author_links = select(teaser, 'a[href*="/team/"]')
         authors = [a.get_text(strip=True) for a in author_links if a.get_text(strip=True)]
         author = ', '.join(authors) if authors else 'World Bank Blogs'
 
@@ -2966,45 +3300,47 @@ class WorldBankBlogScraper(BaseScraper):
         rewrite relative URLs. Falls back to trafilatura, then og:description.
         """
         try:
-            response = requests_retry_session().get(url, timeout=30, headers={
+            response = self.fetcher.get(url, timeout=30, headers={
                 'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36',
             })
             response.raise_for_status()
-            html = response.text
-            soup = BeautifulSoup(html, 'html.parser')
-
-            wrapper = soup.select_one('.tui_container_col_10_offset_1')
-            if wrapper:
-                # Remove scripts, styles, and the trailing topics/regions list
-                for tag in wrapper.find_all(['script', 'style']):
-                    tag.decompose()
-                for nav in wrapper.select('.listnavigation, .cmp-list'):
-                    nav.decompose()
-                # Rewrite relative hrefs/src to absolute
-                for a in wrapper.find_all('a', href=True):
-                    if a['href'].startswith('/'):
-                        a['href'] = f"{self.BASE_URL}{a['href']}"
-                for img in wrapper.find_all('img', src=True):
-                    if img['src'].startswith('/'):
-                        img['src'] = f"{self.BASE_URL}{img['src']}"
-                content_html = wrapper.decode_contents().strip()
-                if content_html:
-                    return content_html
-
-            # Fallback: trafilatura heuristic extraction
-            import trafilatura
-            content = trafilatura.extract(html, output_format='html', include_links=True)
-            if content:
-                return content
-
-            og = soup.find('meta', property='og:description')
-            if og and og.get('content'):
-                return f"<p>{html_escape(og['content'].strip())}</p>"
-            return None
+            return parse_in_pool(self._extract_article_content, response.text)
         except Exception as e:
             print(f"Erro ao buscar artigo World Bank {url}: {str(e)}")
             return None
 
+    @classmethod
+    def _extract_article_content(cls, html):
+        soup = make_soup(html)
+
+        wrapper = select_one(soup, '.tui_container_col_10_offset_1')
+        if wrapper:
+            # Remove scripts, styles, and the trailing topics/regions list
+            for tag in wrapper.find_all(['script', 'style']):
+                tag.decompose()
+            for nav in select(wrapper, '.listnavigation, .cmp-list'):
+                nav.decompose()
+            # Rewrite relative hrefs/src to absolute
+            for a in wrapper.find_all('a', href=True):
+                if a['href'].startswith('/'):
+                    a['href'] = f"{cls.BASE_URL}{a['href']}"
+            for img in wrapper.find_all('img', src=True):
+                if img['src'].startswith('/'):
+                    img['src'] = f"{cls.BASE_URL}{img['src']}"
+            content_html = wrapper.decode_contents().strip()
+            if content_html:
+                return content_html
+
+        # Fallback: trafilatura heuristic extraction
+        content = _trafilatura_extract(html)
+        if content:
+            return content
+
+        og = soup.find('meta', property='og:description')
+        if og and og.get('content'):
+            return f"<p>{html_escape(og['content'].strip())}</p>"
+        return None
+
     def _parse_date(self, date_str):
         """Parse 'May 05, 2026' into a UTC datetime."""
         if not date_str:
@@ -3030,38 +3366,57 @@ class WMONewsScraper(BaseScraper):
 
     def get_articles(self, limit=10):
         try:
-            response = requests_retry_session().get(self.url, timeout=30, headers={
+            response = self.fetcher.get(self.url, timeout=30, headers={
                 'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36',
             })
             response.raise_for_status()
-            soup = BeautifulSoup(response.content, 'html.parser')
+
+            listing = parse_in_pool(self._parse_listing, response.content, limit)
+            self.check_listing(self._article_keys(listing))
 
             articles = []
-            seen_links = set()
-            for row in soup.select('.view-news .views-row'):
-                article = self._parse_news_card(row)
-                if not article or article['link'] in seen_links:
+            for article in listing:
+                articles.append(article)
+                if self.fill_from_published(article):
                     continue
-                seen_links.add(article['link'])
-
-                content_html = self._fetch_article_content(article['link'])
+                content_html = enrichment_cache.fetch(
+                    'wmo', article['link'], self._fetch_article_content, article['link'],
+                )
                 if content_html:
                     article['description'] = content_html
-
-                articles.append(article)
-                if len(articles) >= limit:
-                    break
+                    article['_enriched'] = True
+                else:
+                    article['_enrichment_failed'] = True
 
             if not articles:
                 print(f"Nenhuma notícia encontrada em {self.url}")
             return articles
+        except NotModified:
+            raise
         except Exception as e:
             print(f"Erro ao processar WMO News {self.url}: {str(e)}")
             return []
 
+    def _parse_listing(self, content, limit=None):
+        """Parse up to *limit* news cards of the portal page, skipping repeated links."""
+        # Only the news view is built; the rest of the portal page is skipped
+        views = parse_cards(content, lambda view: view, limit=1, class_='view-news')
+
+        articles = []
+        seen_links = set()
+        for row in select(views[0], '.views-row') if views else []:
+            article = self._parse_news_card(row)
+            if not article or article['link'] in seen_links:
+                continue
+            seen_links.add(article['link'])
+            articles.append(article)
+            if limit is not None and len(articles) >= limit:
+                break
+        return articles
+
     def _parse_news_card(self, row):
-        link_el = row.select_one('a[href]')
-        title_el = row.select_one('h2')
+        link_el = select_one(row, 'a[href]')
+        title_el = select_one(row, 'h2')
         if not link_el or not title_el:
             return None
 
@@ -3070,14 +3425,14 @@ class WMONewsScraper(BaseScraper):
         if not title or not link:
             return None
 
-        category_el = row.select_one('.uppercase')
+        category_el = select_one(row, '.uppercase')
         category = category_el.get_text(' ', strip=True) if category_el else ''
 
-        date_el = row.select_one('span.text-sm, span.md\\:text-base')
+        date_el = select_one(row, 'span.text-sm, span.md\\:text-base')
         date_text = date_el.get_text(' ', strip=True) if date_el else ''
         pubdate = self._parse_date(date_text)
 
-        image_el = row.select_one('img')
+        image_el = select_one(row, 'img')
         description_parts = []
         if category:
             description_parts.append(f"<p><strong>{html_escape(category)}</strong></p>")
@@ -3094,38 +3449,38 @@ class WMONewsScraper(BaseScraper):
 
     def _fetch_article_content(self, url):
         try:
-            response = requests_retry_session().get(url, timeout=30, headers={
+            response = self.fetcher.get(url, timeout=30, headers={
                 'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36',
             })
             response.raise_for_status()
-            html = response.text
-            soup = BeautifulSoup(html, 'html.parser')
-
-            parts = []
-            summary = soup.select_one('.field--name-field-summary')
-            body = soup.select_one('.field--name-body')
-            for section in (summary, body):
-                if not section:
-                    continue
-                self._clean_content(section)
-                content = section.decode_contents().strip()
-                if content:
-                    parts.append(content)
-
-            if parts:
-                return ''.join(parts)
-
-            og_description = soup.find('meta', property='og:description')
-            if og_description and og_description.get('content'):
-                return f"<p>{html_escape(og_description['content'].strip())}</p>"
-
-            import trafilatura
-            content = trafilatura.extract(html, output_format='html', include_links=True)
-            return content
+            return parse_in_pool(self._extract_article_content, response.text)
         except Exception as e:
             print(f"Erro ao buscar notícia WMO {url}: {str(e)}")
             return None
 
+    def _extract_article_content(self, html):
+        soup = make_soup(html)
+
+        parts = []
+        summary = select_one(soup, '.field--name-field-summary')
+        body = select_one(soup, '.field--name-body')
+        for section in (summary, body):
+            if not section:
+                continue
+            self._clean_content(section)
+            content = section.decode_contents().strip()
+            if content:
+                parts.append(content)
+
+        if parts:
+            return ''.join(parts)
+
+        og_description = soup.find('meta', property='og:description')
+        if og_description and og_description.get('content'):
+            return f"<p>{html_escape(og_description['content'].strip())}</p>"
+
+        return _trafilatura_extract(html)
+
     def _clean_content(self, section):
         for tag in section.find_all(['script', 'style']):
             tag.decompose()
@@ -0,0 +1,141 @@
+import re
+import threading
+from urllib.parse import parse_qs, parse_qsl, unquote, urlencode, urlsplit, urlunsplit
+
+# Query parameters that only track the click (utm_* are matched by prefix)
+TRACKING_PARAMS = {
+    'fbclid', 'gclid', 'dclid', 'msclkid', 'yclid', 'mc_cid', 'mc_eid', 'mkt_tok',
+    'cmpid', 'cmp', 'xtor', 'ncid', 'ito', 'igshid', 'spm', 'sr_share', '_ga',
+    'trk', 'trkinfo', 'trackingid', 'lipi', 'refid', 'midtoken', 'midsig', 'eid', 'otptoken',
+}
+# Parameters that only ask for the AMP rendering of the page
+_AMP_PARAMS = {'amp', 'outputtype'}
+# Leading host labels of www, mobile and AMP mirrors (www1.folha, m.folha, amp.theguardian...)
+_MIRROR_LABEL = re.compile(r'^(?:www\d*|m|mobile|amp)$')
+_DEFAULT_PORTS = {'http': '80', 'https': '443'}
+
+def unwrap_redirect(url):
+    """The destination of a known redirector URL, or *url* itself.
+
+    Handles Google's /url links (Google Alerts), Folha's RSS redirector
+    (redir.folha.com.br/redir/...*<url>) and LinkedIn's external-link
+    redirector.
+    """
+    if not url:
+        return url
+    parts = urlsplit(url)
+    host = (parts.hostname or '').lower()
+    if host == 'redir.folha.com.br' and '*' in url:
+        return unwrap_redirect(unquote(url.split('*', 1)[1]))
+    if (host == 'google.com' or host.endswith('.google.com')) and parts.path == '/url':
+        query = parse_qs(parts.query)
+        target = (query.get('url') or query.get('q') or [''])[0]
+        return unwrap_redirect(target) if target else url
+    if host.endswith('linkedin.com') and parts.path.startswith('/redir/redirect'):
+        target = parse_qs(parts.query).get('url', [''])[0]
+        return unwrap_redirect(target) if target else url
+    return url
+
+def _is_tracking(name):
+    name = name.lower()
+    return name.startswith('utm_') or name in TRACKING_PARAMS
+
+def _netloc(parts):
+    try:
+        port = parts.port
+    except ValueError:
+        return parts.netloc.lower()
+    host = (parts.hostname or '').lower()
+    if port is not None and str(port) != _DEFAULT_PORTS.get(parts.scheme.lower()):
+        return f"{host}:{port}"
+    return host
+
+def normalize_url(url):
+    """Normalize a URL so tracking variants of the same resource compare equal.
+
+    Scheme and host are lowercased, the default port, fragment, trailing
+    slash and tracking parameters (utm_*, fbclid, ...) are dropped and the
+    remaining query parameters are sorted. This is lossy (a listed
+    parameter or the trailing slash may still matter to some server), so
+    it identifies content, never the request to send.
+    """
+    parts = urlsplit(url or '')
+    query = sorted(
+        (name, value)
+        for name, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not _is_tracking(name)
+    )
+    return urlunsplit((
+        parts.scheme.lower(),
+        _netloc(parts),
+        parts.path.rstrip('/'),
+        urlencode(query),
+        '',
+    ))
+
+def canonical_url(url):
+    """Identify the article behind *url*, across the variants that reach it.
+
+    On top of normalize_url(): redirector links are unwrapped, http and
+    https are folded together, and www, mobile (m.) and AMP mirrors and
+    AMP paths (/amp, .amp, ?amp=1, ?outputType=amp) map to the plain
+    article. Two links with the same canonical URL are the same article,
+    though not necessarily the same page, so this keys articles, not
+    responses.
+    """
+    if not url:
+        return ''
+    parts = urlsplit(normalize_url(unwrap_redirect(url)))
+    labels = parts.netloc.split('.')
+    while len(labels) > 2 and _MIRROR_LABEL.match(labels[0]):
+        labels = labels[1:]
+    path = parts.path
+    if path.endswith('/amp'):
+        path = path[:-len('/amp')]
+    elif path.endswith('.amp'):
+        path = path[:-len('.amp')]
+    path = path.replace('/amp/', '/', 1) if path.startswith('/amp/') else path
+    query = urlencode([
+        (name, value)
+        for name, value in parse_qsl(parts.query, keep_blank_values=True)
+        if name.lower() not in _AMP_PARAMS
+    ])
+    return urlunsplit(('https', '.'.join(labels), path.rstrip('/'), query, ''))
+
+class ArticleIndex:
+    """Run-wide index of the fully enriched articles, by canonical URL.
+
+    Each source adds the articles it published; a source listing the same
+    article later (a Folha column also in "Folha Ambiente", a Google Alerts
+    hit another scraper already covered) finds it here in O(1) and reuses
+    its content instead of enriching it again. Only articles whose page a
+    scraper fetched this run are indexed (marked ``_enriched``): listing
+    data or a snippet fallback must never stand in for an enrichment.
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._articles = {}
+        self.duplicates = 0
+
+    def add(self, source_name, articles):
+        with self._lock:
+            for article in articles:
+                key = canonical_url(article.get('link'))
+                if key and article.get('_enriched') and not article.get('_enrichment_failed'):
+                    # Internal markers stay with the source that set them
+                    public = {name: value for name, value in article.items() if not name.startswith('_')}
+                    self._articles.setdefault(key, (source_name, public))
+
+    def get(self, link, source_name=None):
+        """A copy of the article another source published for *link*, or None."""
+        key = canonical_url(link)
+        with self._lock:
+            entry = self._articles.get(key)
+            if entry is None or entry[0] == source_name:
+                return None
+            self.duplicates += 1
+            return dict(entry[1])
+
+    def stats(self):
+        with self._lock:
+            return {'articles': len(self._articles), 'duplicates': self.duplicates}
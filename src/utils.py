@@ -6,10 +6,43 @@ from email.utils import parsedate_to_datetime
 import pytz
 from xml.etree import ElementTree as ET
 from urllib.parse import urlsplit, urlunsplit
+from src.urls import canonical_url
 
 # Constante para a URL base do GitHub Pages
 GITHUB_PAGES_BASE_URL = "https://paulofeh.github.io/rss-de-valor"
 
+# Defaults for the optional "settings" block of sources_config.json
+DEFAULT_RUN_SETTINGS = {
+    'engine': 'threads',
+    'max_workers': 8,
+    'max_per_host': 3,
+    'parse_workers': None,
+    'html_parser': 'auto',
+    'http_pool_maxsize': 10,
+    'http2_hosts': [],
+    'persistent_cookie_hosts': [],
+    'coalesce_requests': True,
+    'coalesce_max_entries': 64,
+    'coalesce_max_kb': 256,
+    'coalesce_max_total_mb': 4,
+    'max_response_mb': 10,
+    'max_response_mb_per_host': {},
+    'max_response_mb_per_scraper': {},
+    'enrichment_cache': True,
+    'cache_ttl_days': 30,
+    'cache_max_entries': 2000,
+    'adaptive_concurrency': True,
+    'host_concurrency_initial': 4,
+    'host_concurrency_max': 16,
+    'retry_budget_per_source': 6,
+    'retry_budget_per_run': 60,
+    'source_deadline': 180,
+    'resume_window_hours': 12,
+}
+
+# Second-level suffixes under which publishers register their domains
+_COMPOUND_SUFFIXES = {'com.br', 'org.br', 'gov.br', 'net.br', 'co.uk', 'org.uk'}
+
 class CustomRssFeed(Rss201rev2Feed):
     def root_attributes(self):
         attrs = super().root_attributes()
@@ -150,6 +183,34 @@ def merge_articles_with_existing_feed(articles, filename, limit=5):
 
     return merged
 
+def fill_incomplete_from_feed(articles, filename):
+    """Replace incomplete articles with the copy already in the published feed.
+
+    Articles marked ``_enrichment_failed`` (say, because the source ran out
+    of time) that were published before are swapped for that version, like
+    merge_articles_with_existing_feed() does. New incomplete articles are
+    kept with their listing data, and their order is preserved.
+    """
+    if not any(article.get('_enrichment_failed') for article in articles):
+        return articles
+
+    previous_by_link = {
+        _article_link_key(article.get('link')): article
+        for article in _load_feed_articles(filename)
+        if article.get('link')
+    }
+    filled = []
+    for article in articles:
+        previous_article = None
+        if article.get('_enrichment_failed'):
+            previous_article = previous_by_link.get(_article_link_key(article.get('link')))
+        if previous_article:
+            print(f"   ♻️  Conteúdo anterior preservado: {article.get('title', article.get('link'))}")
+            filled.append(previous_article)
+        else:
+            filled.append(article)
+    return filled
+
 def _load_feed_articles(filename):
     """Load previously published RSS items as article dictionaries."""
     full_path = get_feed_path(filename)
@@ -186,13 +247,41 @@ def _load_feed_articles(filename):
 
     return articles
 
+def load_published_articles(filename, exclude=()):
+    """Index the articles of a previously written feed by canonical link.
+
+    Links in *exclude* (items published with incomplete content) are left
+    out so they get enriched again.
+    """
+    excluded = {canonical_url(link) for link in exclude}
+    published = {}
+    for article in _load_feed_articles(filename):
+        key = canonical_url(article.get('link'))
+        if article.get('link') and key not in excluded:
+            published[key] = article
+    return published
+
 def _article_link_key(link):
-    """Normalize a LinkedIn article URL for matching across tracking variants."""
+    """Match a link against the published feed, across tracking variants.
+
+    The whole query string is dropped, not just the known tracking
+    parameters canonical_url() strips: LinkedIn and other sources append
+    query parameters no list covers, and a feed entry must never be
+    duplicated by a rerun that sees the link with different ones.
+    """
     if not link:
         return ''
     parsed = urlsplit(link)
     return urlunsplit((parsed.scheme.lower(), parsed.netloc.lower(), parsed.path.rstrip('/'), '', ''))
 
+def get_host_key(url):
+    """Group a URL by publisher domain (e.g. www1.folha.uol.com.br -> uol.com.br)."""
+    host = (urlsplit(url or '').hostname or '').lower()
+    labels = host.split('.')
+    if len(labels) > 2 and '.'.join(labels[-2:]) in _COMPOUND_SUFFIXES:
+        return '.'.join(labels[-3:])
+    return '.'.join(labels[-2:])
+
 def load_history(filename):
     """Load history from the history directory."""
     full_path = get_history_path(filename)
@@ -214,6 +303,15 @@ def load_sources_config(filename='sources_config.json'):
         config = json.load(f)
     return config['sources']
 
+def load_run_settings(filename='sources_config.json'):
+    """Load run settings from the config directory, filling in defaults."""
+    full_path = get_config_path(filename)
+    with open(full_path, 'r', encoding='utf-8') as f:
+        config = json.load(f)
+    settings = dict(DEFAULT_RUN_SETTINGS)
+    settings.update(config.get('settings', {}))
+    return settings
+
 def generate_opml(sources):
     """Generate OPML file from sources configuration with both grouped and individual feeds."""
     # Create root OPML element